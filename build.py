@@ -6,40 +6,74 @@ Usage:
     python build.py
 """
 
-import subprocess
 import sys
 import os
-import shutil
-import stat
-import time
 
 
 def remove_readonly(func, path, _):
     """Clear the readonly bit and reattempt the removal"""
+    import stat
     os.chmod(path, stat.S_IWRITE)
     func(path)
 
 
+def _rmtree_with_retry(folder):
+    """Remove a folder, retrying once if Windows still holds a lock on it"""
+    import shutil
+    import time
+
+    if not os.path.exists(folder):
+        return
+    print(f"[*] Cleaning {folder}/...")
+    try:
+        shutil.rmtree(folder, onerror=remove_readonly)
+    except PermissionError:
+        print(f"[!] Could not clean {folder}. Retrying in 2 seconds...")
+        time.sleep(2)
+        try:
+            shutil.rmtree(folder, onerror=remove_readonly)
+        except Exception as e:
+            print(f"[!] Warning: Could not fully clean {folder}: {e}")
+
+
+async def _rmtree_async(folder):
+    """Run the blocking folder removal in a worker thread"""
+    import asyncio
+    await asyncio.to_thread(_rmtree_with_retry, folder)
+
+
+async def _run_pyinstaller_async(cmd, cwd):
+    """Spawn PyInstaller and wait for it, returning its exit code"""
+    import asyncio
+    proc = await asyncio.create_subprocess_exec(*cmd, cwd=cwd)
+    return await proc.wait()
+
+
+async def _clean_and_build(cmd, cwd):
+    """Delete old build/dist while PyInstaller works in fresh folders.
+
+    PyInstaller spends its first seconds importing hooks before it touches
+    its output folders, so the (slow, disk-bound) cleanup of the previous
+    build overlaps with it instead of running first.
+    """
+    import asyncio
+    _, _, returncode = await asyncio.gather(
+        _rmtree_async(os.path.join(cwd, "build")),
+        _rmtree_async(os.path.join(cwd, "dist")),
+        _run_pyinstaller_async(cmd, cwd),
+    )
+    return returncode
+
+
 def main():
+    # Heavier stdlib modules are only needed once we actually build
+    import asyncio
+
     print("=" * 60)
     print("  RZ Studio- Build to EXE")
     print("=" * 60)
     print()
 
-    # Clean old builds
-    for folder in ["build", "dist"]:
-        if os.path.exists(folder):
-            print(f"[*] Cleaning {folder}/...")
-            try:
-                shutil.rmtree(folder, onerror=remove_readonly)
-            except PermissionError:
-                print(f"[!] Could not clean {folder}. Retrying in 2 seconds...")
-                time.sleep(2)
-                try:
-                    shutil.rmtree(folder, onerror=remove_readonly)
-                except Exception as e:
-                    print(f"[!] Warning: Could not fully clean {folder}: {e}")
-
     # Build command
     cmd = [
         sys.executable, "-m", "PyInstaller",
@@ -66,18 +100,44 @@ def main():
         # Collect all customtkinter data files (themes, etc.)
         "--collect-all=customtkinter",
         "--collect-all=tkinterdnd2",
+        # Build into fresh folders so old ones can be cleaned concurrently
+        "--workpath=build_new",
+        "--distpath=dist_new",
         # Main script
         "app.py"
     ]
 
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Leftovers from an earlier failed run would be mixed into this build
+    for new_folder in ("build_new", "dist_new"):
+        _rmtree_with_retry(os.path.join(base_dir, new_folder))
+
     print()
     print("[*] Building exe... This may take a few minutes.")
     print()
 
-    result = subprocess.run(cmd, cwd=os.path.dirname(os.path.abspath(__file__)))
+    returncode = asyncio.run(_clean_and_build(cmd, base_dir))
+
+    if returncode == 0:
+        # Swap the fresh folders into place
+        dist_dir = os.path.join(base_dir, "dist")
+        for name in ("build", "dist"):
+            new_folder = os.path.join(base_dir, name + "_new")
+            folder = os.path.join(base_dir, name)
+            if not os.path.exists(new_folder):
+                continue
+            _rmtree_with_retry(folder)
+            try:
+                os.replace(new_folder, folder)
+            except OSError as e:
+                # A locked old folder must not lose a successful build
+                print(f"[!] Could not replace {folder}: {e}")
+                print(f"[!] Keeping the new output in {new_folder}")
+                if name == "dist":
+                    dist_dir = new_folder
 
-    if result.returncode == 0:
-        exe_path = os.path.join("dist", "RZAutomedata.exe")
+        exe_path = os.path.join(dist_dir, "RZAutomedata.exe")
         if os.path.exists(exe_path):
             size_mb = os.path.getsize(exe_path) / (1024 * 1024)
             print()
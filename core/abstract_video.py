@@ -15,13 +15,16 @@ import cv2
 import numpy as np
 import math
 import colorsys
-import random
+import functools
 import threading
 import os
 import time
 import logging
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import List, Tuple, Optional, Callable
 
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,6 +72,104 @@ def _get_ffmpeg_path() -> str:
 # Module-level cache so we only test once per app session
 _hw_encoder_cache = None  # Will be set to (encoder_name_or_None, label_str)
 
+# Display adapter device class in the Windows registry
+_DISPLAY_CLASS_KEY = (
+    r"SYSTEM\CurrentControlSet\Control\Class"
+    r"\{4d36e968-e325-11ce-bfc8-08002be10318}"
+)
+
+
+def _read_display_adapters() -> List[Tuple[str, str]]:
+    """Return (DriverDesc, DriverVersion) for each display adapter.
+
+    Reads the registry directly, so no subprocess is spawned.  Returns an
+    empty list on non-Windows systems or if the key can't be read.
+    """
+    try:
+        import winreg
+    except ImportError:
+        return []
+
+    adapters = []
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _DISPLAY_CLASS_KEY) as cls:
+            index = 0
+            while True:
+                try:
+                    sub_name = winreg.EnumKey(cls, index)
+                except OSError:
+                    break
+                index += 1
+                try:
+                    with winreg.OpenKey(cls, sub_name) as sub:
+                        desc = winreg.QueryValueEx(sub, "DriverDesc")[0]
+                        try:
+                            version = winreg.QueryValueEx(sub, "DriverVersion")[0]
+                        except OSError:
+                            version = ""
+                except OSError:
+                    # "Properties" and similar subkeys aren't adapters
+                    continue
+                adapters.append((str(desc), str(version)))
+    except OSError as e:
+        logger.debug("Display adapter registry read failed: %s", e)
+    return adapters
+
+
+def _gpu_signature() -> str:
+    """Cheap identifier of the installed GPU(s) and driver versions."""
+    if os.name == "nt":
+        return "; ".join(f"{desc} {version}" for desc, version in _read_display_adapters())
+    try:
+        with open("/proc/driver/nvidia/version", "r") as f:
+            return f.readline().strip()
+    except OSError:
+        return ""
+
+
+def _hw_encoder_cache_file() -> str:
+    """Path of the on-disk HW encoder detection cache."""
+    appdata = os.environ.get("LOCALAPPDATA", os.environ.get("APPDATA", os.path.expanduser("~")))
+    return os.path.join(appdata, "RZAutomedata", "hw_encoder.json")
+
+
+def _hw_encoder_cache_key(ffmpeg: str) -> dict:
+    """Inputs that invalidate the on-disk cache when any of them changes."""
+    try:
+        ffmpeg_mtime = os.path.getmtime(ffmpeg)
+    except OSError:
+        ffmpeg_mtime = 0
+    return {
+        "ffmpeg": ffmpeg,
+        "ffmpeg_mtime": ffmpeg_mtime,
+        "gpu": _gpu_signature(),
+    }
+
+
+def _load_hw_encoder_disk_cache(key: dict):
+    """Return the cached (encoder, label) if it was stored under ``key``."""
+    import json
+    try:
+        with open(_hw_encoder_cache_file(), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached["enc"], cached["label"]
+    except Exception:
+        pass
+    return None
+
+
+def _save_hw_encoder_disk_cache(key: dict, result):
+    """Persist the detection result so the next app start can skip it."""
+    import json
+    try:
+        path = _hw_encoder_cache_file()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "enc": result[0], "label": result[1]}, f)
+    except Exception as e:
+        logger.debug("Could not save HW encoder cache: %s", e)
+
 
 def detect_working_hw_encoder(force_recheck=False):
     """Detect a working hardware H.264 encoder by actually test-encoding.
@@ -85,24 +186,79 @@ def detect_working_hw_encoder(force_recheck=False):
     GPU matching priority:
         1. Match encoder to detected GPU vendor (AMD → amf, NVIDIA → nvenc, Intel → qsv)
         2. Fall through remaining encoders in order
+
+    The result is also persisted to %LOCALAPPDATA%/RZAutomedata/hw_encoder.json
+    and reused on later app starts until FFmpeg or the GPU driver changes.
+    A CPU fallback is only persisted when every probe actually ran and failed.
     """
     global _hw_encoder_cache
     if _hw_encoder_cache is not None and not force_recheck:
         return _hw_encoder_cache
 
-    import subprocess, tempfile
-
     ffmpeg = _get_ffmpeg_path()
+    cache_key = _hw_encoder_cache_key(ffmpeg)
+    if not force_recheck:
+        cached = _load_hw_encoder_disk_cache(cache_key)
+        if cached is not None:
+            logger.info("HW encoder loaded from cache: %s", cached[1])
+            _hw_encoder_cache = cached
+            return _hw_encoder_cache
+
+    _hw_encoder_cache, conclusive = _probe_hw_encoders(ffmpeg)
+    if cache_key["ffmpeg_mtime"] and conclusive:
+        # Don't pin a CPU fallback that was only caused by a missing FFmpeg
+        # or a probe that errored/timed out; retry those on the next start
+        _save_hw_encoder_disk_cache(cache_key, _hw_encoder_cache)
+    return _hw_encoder_cache
 
-    # All candidate encoders with their vendor-specific preset args
-    ALL_ENCODERS = [
-        ("h264_nvenc", "NVENC (NVIDIA GPU)", ["-preset", "p1"]),
-        ("h264_amf",   "AMF (AMD GPU)",      ["-quality", "speed"]),
-        ("h264_qsv",   "QSV (Intel GPU)",    ["-preset", "veryfast"]),
-    ]
 
-    # Step 1: Detect GPU vendor via WMI to prioritize the right encoder
-    gpu_vendor = None  # "nvidia", "amd", "intel", or None
+def _gpu_vendor_from_text(gpu_text: str) -> Optional[str]:
+    """Map a GPU name/description to "nvidia", "amd", "intel" or None."""
+    gpu_text = gpu_text.lower()
+    if any(k in gpu_text for k in ["nvidia", "geforce", "rtx ", "gtx "]):
+        return "nvidia"
+    if any(k in gpu_text for k in ["amd", "radeon"]):
+        return "amd"
+    if "intel" in gpu_text:
+        return "intel"
+    return None
+
+
+def _detect_gpu_vendor() -> Optional[str]:
+    """Detect the GPU vendor so the matching encoder is tried first.
+
+    Tries the display-class registry key, then nvidia-smi, and only then
+    the (slow to start) PowerShell/WMI query.
+    """
+    if os.name != "nt":
+        # WMI/PowerShell only exist on Windows
+        if os.path.exists("/proc/driver/nvidia/version"):
+            return "nvidia"
+        return None
+
+    # 1. Registry: no subprocess at all
+    descs = " ".join(desc for desc, _ in _read_display_adapters())
+    if descs.strip():
+        gpu_vendor = _gpu_vendor_from_text(descs)
+        logger.info("GPU vendor detected via registry: %s", gpu_vendor or "unknown")
+        return gpu_vendor
+
+    import subprocess
+    # 2. nvidia-smi: much cheaper to start than PowerShell
+    try:
+        r = subprocess.run(
+            ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
+            capture_output=True, text=True, timeout=5,
+            creationflags=subprocess.CREATE_NO_WINDOW,
+        )
+        if r.returncode == 0 and r.stdout.strip():
+            logger.info("GPU vendor detected via nvidia-smi: nvidia")
+            return "nvidia"
+    except Exception as e:
+        logger.debug("nvidia-smi GPU detection failed: %s", e)
+
+    # 3. WMI via PowerShell as a last resort
+    gpu_vendor = None
     try:
         r = subprocess.run(
             ["powershell", "-NoProfile", "-Command",
@@ -112,16 +268,79 @@ def detect_working_hw_encoder(force_recheck=False):
             creationflags=subprocess.CREATE_NO_WINDOW,
         )
         if r.returncode == 0 and r.stdout.strip():
-            gpu_text = r.stdout.lower()
-            if any(k in gpu_text for k in ["nvidia", "geforce", "rtx ", "gtx "]):
-                gpu_vendor = "nvidia"
-            elif any(k in gpu_text for k in ["amd", "radeon"]):
-                gpu_vendor = "amd"
-            elif "intel" in gpu_text:
-                gpu_vendor = "intel"
+            gpu_vendor = _gpu_vendor_from_text(r.stdout)
             logger.info("GPU vendor detected via WMI: %s", gpu_vendor or "unknown")
     except Exception as e:
         logger.debug("WMI GPU vendor detection failed: %s", e)
+    return gpu_vendor
+
+
+def _probe_encoder(ffmpeg: str, enc_name: str, enc_label: str, preset_args: List[str]):
+    """Test-encode one tiny clip with ``enc_name``.
+
+    Returns:
+        (returncode, enc_name, enc_label); returncode is None when FFmpeg
+        could not be run or the test timed out, so the failure may be
+        transient rather than a real "encoder doesn't work".
+    """
+    import subprocess
+
+    no_window = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    try:
+        # Encode a single 8x8 black frame into the null muxer — nothing is
+        # written to disk, but the encoder's HW context is still initialized
+        test_cmd = [
+            ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", "color=black:s=8x8:r=25",
+            "-frames:v", "1", "-an",
+            "-c:v", enc_name,
+        ] + preset_args + [
+            "-pix_fmt", "yuv420p",
+            "-f", "null", "-",
+        ]
+        result = subprocess.run(
+            test_cmd,
+            capture_output=True, text=True, timeout=10,
+            creationflags=no_window,
+        )
+
+        if result.returncode == 0:
+            logger.info(
+                "✅ HW encoder verified: %s (%s) — works on this system",
+                enc_name, enc_label,
+            )
+        else:
+            logger.info(
+                "❌ HW encoder %s listed but FAILED test: %s",
+                enc_name, result.stderr[:200] if result.stderr else "unknown",
+            )
+        return result.returncode, enc_name, enc_label
+    except Exception as e:
+        logger.debug("HW encoder test for %s failed: %s", enc_name, e)
+    return None, enc_name, enc_label
+
+
+def _probe_hw_encoders(ffmpeg: str):
+    """Run the actual vendor detection and test encodes (uncached).
+
+    Returns:
+        ((encoder_name, label), conclusive) where ``conclusive`` is False
+        when the CPU fallback may only be due to a transient failure (the
+        encoder listing or a test encode errored or timed out).
+    """
+    import subprocess
+
+    no_window = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+    # All candidate encoders with their vendor-specific preset args
+    ALL_ENCODERS = [
+        ("h264_nvenc", "NVENC (NVIDIA GPU)", ["-preset", "p1"]),
+        ("h264_amf",   "AMF (AMD GPU)",      ["-quality", "speed"]),
+        ("h264_qsv",   "QSV (Intel GPU)",    ["-preset", "veryfast"]),
+    ]
+
+    # Step 1: Detect GPU vendor to prioritize the right encoder
+    gpu_vendor = _detect_gpu_vendor()  # "nvidia", "amd", "intel", or None
 
     # Step 2: Reorder encoder list to try matching vendor first
     vendor_encoder_map = {
@@ -135,514 +354,500 @@ def detect_working_hw_encoder(force_recheck=False):
         # Move the preferred encoder to the front
         ordered_encoders.sort(key=lambda x: 0 if x[0] == preferred else 1)
 
-    # Step 3: Check which encoders are listed by FFmpeg
-    enc_list_text = ""
-    try:
-        enc_check = subprocess.run(
-            [ffmpeg, "-hide_banner", "-encoders"],
-            capture_output=True, text=True, timeout=5,
-            creationflags=subprocess.CREATE_NO_WINDOW,
-        )
-        enc_list_text = enc_check.stdout
-    except Exception as e:
-        logger.debug("FFmpeg encoder listing failed: %s", e)
-
-    # Step 4: Test each encoder with a real tiny encode
-    for enc_name, enc_label, preset_args in ordered_encoders:
-        if enc_name not in enc_list_text:
-            # Encoder not even listed — skip
-            continue
-
+    # Step 3: Check which encoders are listed by FFmpeg. When the vendor is
+    # known the listing adds nothing — most builds list all three anyway, and
+    # a missing encoder makes its probe below fail fast — so skip it.
+    if gpu_vendor in vendor_encoder_map:
+        candidates = ordered_encoders
+        conclusive = True
+    else:
+        enc_list_text = ""
         try:
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
-                tmp_path = tmp.name
-
-            # Encode a single 8x8 black frame — takes <100ms
-            test_cmd = [
-                ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
-                "-f", "lavfi", "-i", "color=black:s=8x8:d=0.04:r=25",
-                "-c:v", enc_name,
-            ] + preset_args + [
-                "-pix_fmt", "yuv420p",
-                tmp_path,
-            ]
-            result = subprocess.run(
-                test_cmd,
-                capture_output=True, text=True, timeout=10,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+            enc_check = subprocess.run(
+                [ffmpeg, "-hide_banner", "-encoders"],
+                capture_output=True, text=True, timeout=5,
+                creationflags=no_window,
             )
-
-            # Clean up temp file
-            try:
-                os.remove(tmp_path)
-            except Exception:
-                pass
-
-            if result.returncode == 0:
-                logger.info(
-                    "✅ HW encoder verified: %s (%s) — works on this system",
-                    enc_name, enc_label,
-                )
-                _hw_encoder_cache = (enc_name, enc_label)
-                return _hw_encoder_cache
-            else:
-                logger.info(
-                    "❌ HW encoder %s listed but FAILED test: %s",
-                    enc_name, result.stderr[:200] if result.stderr else "unknown",
-                )
+            enc_list_text = enc_check.stdout
+            conclusive = enc_check.returncode == 0
         except Exception as e:
-            logger.debug("HW encoder test for %s failed: %s", enc_name, e)
-            try:
-                os.remove(tmp_path)
-            except Exception:
-                pass
+            logger.debug("FFmpeg encoder listing failed: %s", e)
+            conclusive = False
+        candidates = [enc for enc in ordered_encoders if enc[0] in enc_list_text]
+
+    # Step 4: Test the candidate encoders with a real tiny encode. The probes
+    # run concurrently, but the winner is still picked in priority order.
+    if candidates:
+        from concurrent.futures import ThreadPoolExecutor
+        pool = ThreadPoolExecutor(max_workers=len(candidates))
+        try:
+            futures = [
+                pool.submit(_probe_encoder, ffmpeg, enc_name, enc_label, preset_args)
+                for enc_name, enc_label, preset_args in candidates
+            ]
+            for future in futures:
+                returncode, enc_name, enc_label = future.result()
+                if returncode == 0:
+                    return (enc_name, enc_label), True
+                if returncode is None:
+                    conclusive = False
+        finally:
+            # Don't wait for slower, lower-priority probes once one has won
+            pool.shutdown(wait=False, cancel_futures=True)
 
     logger.info("No working HW encoder found, will use libx264 (CPU)")
-    _hw_encoder_cache = (None, "libx264 (CPU)")
-    return _hw_encoder_cache
+    return (None, "libx264 (CPU)"), conclusive
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # BACKGROUND PATTERN DEFINITIONS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-BACKGROUND_PATTERNS = {
-    "gradient_flow": {
-        "name": "Gradient Flow",
-        "desc": "Smooth animated gradient transitions between colors",
-        "icon": "🌊",
-    },
-    "particle_wave": {
-        "name": "Particle Wave",
-        "desc": "Flowing particles forming wave-like patterns",
-        "icon": "✨",
-    },
-
-    "liquid_marble": {
-        "name": "Liquid Marble",
-        "desc": "Organic marble-like fluid animation",
-        "icon": "🫧",
-    },
-    "aurora_borealis": {
-        "name": "Aurora Borealis",
-        "desc": "Northern lights curtain effect",
-        "icon": "🌌",
-    },
-    "smoke_plume": {
-        "name": "Smoke Plume",
-        "desc": "Soft smoke/fog rising and swirling",
-        "icon": "🌫️",
-    },
-    "fractal_tunnel": {
-        "name": "Fractal Tunnel",
-        "desc": "Hypnotic tunnel zoom with fractal patterns",
-        "icon": "🌀",
-    },
-    "wave_interference": {
-        "name": "Wave Interference",
-        "desc": "Overlapping sine wave interference patterns",
-        "icon": "〰️",
-    },
-    "diamond_grid": {
-        "name": "Diamond Grid",
-        "desc": "Animated diamond/rhombus tessellation",
-        "icon": "💠",
-    },
-    "plasma_field": {
-        "name": "Plasma Field",
-        "desc": "Classic plasma effect with flowing colors",
-        "icon": "🔥",
-    },
-    "spiral_vortex": {
-        "name": "Spiral Vortex",
-        "desc": "Rotating spiral with color transitions",
-        "icon": "🌪️",
-    },
-    "stripe_cascade": {
-        "name": "Stripe Cascade",
-        "desc": "Diagonal stripes cascading with color shifts",
-        "icon": "📊",
-    },
-    "dot_matrix": {
-        "name": "Dot Matrix",
-        "desc": "Animated halftone dot pattern with depth",
-        "icon": "⚫",
-    },
-    "nebula_cloud": {
-        "name": "Nebula Cloud",
-        "desc": "Deep space nebula with swirling cosmic dust",
-        "icon": "🌠",
-    },
-    "kaleidoscope": {
-        "name": "Kaleidoscope",
-        "desc": "Mesmerizing mirror-symmetry kaleidoscope animation",
-        "icon": "🔮",
-    },
-    "fluid_ink": {
-        "name": "Fluid Ink",
-        "desc": "Ink drops spreading in water with organic flow",
-        "icon": "🎨",
-    },
-
-    "ripple_pond": {
-        "name": "Ripple Pond",
-        "desc": "Concentric water ripples with interference",
-        "icon": "💧",
-    },
-
-    "holographic": {
-        "name": "Holographic",
-        "desc": "Iridescent holographic color shifting",
-        "icon": "🌈",
-    },
-    "topographic": {
-        "name": "Topographic",
-        "desc": "Animated topographic contour map lines",
-        "icon": "🗺️",
-    },
-    "hexagon_grid": {
-        "name": "Hexagon Grid",
-        "desc": "Animated honeycomb hexagonal grid pattern",
-        "icon": "🔲",
-    },
-    "voronoi_cells": {
-        "name": "Voronoi Cells",
-        "desc": "Organic Voronoi tessellation with moving seeds",
-        "icon": "🧬",
-    },
-
-    "watercolor_blend": {
-        "name": "Watercolor Blend",
-        "desc": "Soft watercolor paint spreading and blending",
-        "icon": "🖌️",
-    },
-    "ocean_waves": {
-        "name": "Ocean Waves",
-        "desc": "Rolling ocean wave simulation with foam",
-        "icon": "🌊",
-    },
-    "rolling_clouds": {
-        "name": "Rolling Clouds",
-        "desc": "Soft cloud formations drifting across the sky",
-        "icon": "☁️",
-    },
-    "geometric_bloom": {
-        "name": "Geometric Bloom",
-        "desc": "Sacred geometry flower patterns expanding and contracting",
-        "icon": "🌸",
-    },
-    "color_explosion": {
-        "name": "Color Explosion",
-        "desc": "Vibrant radial burst of saturated colors from center",
-        "icon": "🎆",
-    },
-    "oil_slick": {
-        "name": "Oil Slick",
-        "desc": "Iridescent oil-on-water rainbow color shifting",
-        "icon": "💎",
-    },
-    "prismatic_waves": {
-        "name": "Prismatic Waves",
-        "desc": "Full spectrum prismatic waves flowing across screen",
-        "icon": "🔮",
-    },
-    "gradient_mesh": {
-        "name": "Gradient Mesh",
-        "desc": "Rich overlapping color gradients filling every pixel",
-        "icon": "🎨",
-    },
-    "chromatic_pulse": {
-        "name": "Chromatic Pulse",
-        "desc": "Pulsating concentric rings of vivid saturated colors",
-        "icon": "💜",
-    },
-    "color_smoke": {
-        "name": "Color Smoke",
-        "desc": "Vivid smoke plumes in saturated flowing colors",
-        "icon": "🌈",
-    },
-    "rainbow_flow": {
-        "name": "Rainbow Flow",
-        "desc": "Smooth flowing rainbow gradient transitions",
-        "icon": "🏳️‍🌈",
-    },
-    "paint_pour": {
-        "name": "Paint Pour",
-        "desc": "Acrylic paint pour with rich color mixing",
-        "icon": "🎨",
-    },
-    "silk_fabric": {
-        "name": "Silk Fabric",
-        "desc": "Flowing silk fabric with iridescent color folds",
-        "icon": "🧣",
-    },
-    "neon_waves": {
-        "name": "Neon Waves",
-        "desc": "Bright neon-colored flowing wave patterns",
-        "icon": "💡",
-    },
-    "lava_flow": {
-        "name": "Lava Flow",
-        "desc": "Flowing molten lava with vivid warm colors",
-        "icon": "🌋",
-    },
-    "color_vortex": {
-        "name": "Color Vortex",
-        "desc": "Spinning vortex whirlpool of saturated colors",
-        "icon": "🌪️",
-    },
-    "aurora_curtain": {
-        "name": "Aurora Curtain",
-        "desc": "Full-color dancing aurora curtain effect",
-        "icon": "🌌",
-    },
-    "marble_ink": {
-        "name": "Marble Ink",
-        "desc": "Colorful ink marble pattern in water",
-        "icon": "🫧",
-    },
-    "electric_gradient": {
-        "name": "Electric Gradient",
-        "desc": "Sharp vivid gradient transitions with energy",
-        "icon": "⚡",
-    },
-    "color_cells": {
-        "name": "Color Cells",
-        "desc": "Organic cellular pattern in saturated colors",
-        "icon": "🧬",
-    },
-    "neon_grid": {
-        "name": "Neon Grid",
-        "desc": "Glowing animated neon wireframe grid",
-        "icon": "🔲",
-    },
-    "paint_drip": {
-        "name": "Paint Drip",
-        "desc": "Thick paint dripping with rich color blends",
-        "icon": "🖌️",
-    },
-    "crystal_facets": {
-        "name": "Crystal Facets",
-        "desc": "Faceted crystal blocks with vibrant color fills",
-        "icon": "💎",
-    },
-    "thermal_map": {
-        "name": "Thermal Map",
-        "desc": "Animated thermal heat map in vivid colors",
-        "icon": "🌡️",
-    },
-    "color_storm": {
-        "name": "Color Storm",
-        "desc": "Turbulent storm of mixed vibrant colors",
-        "icon": "🌩️",
-    },
-    "pixel_mosaic": {
-        "name": "Pixel Mosaic",
-        "desc": "Animated colorful pixel mosaic grid pattern",
-        "icon": "🟩",
-    },
-    "liquid_chrome": {
-        "name": "Liquid Chrome",
-        "desc": "Liquid metal chrome with rainbow reflections",
-        "icon": "🪩",
-    },
-}
+@dataclass(frozen=True, slots=True)
+class PatternInfo:
+    """Display info for a background pattern or overlay effect."""
+    name: str
+    desc: str
+    icon: str
+
+
+BACKGROUND_PATTERNS = MappingProxyType({
+    "gradient_flow": PatternInfo(
+        name="Gradient Flow",
+        desc="Smooth animated gradient transitions between colors",
+        icon="🌊",
+    ),
+    "particle_wave": PatternInfo(
+        name="Particle Wave",
+        desc="Flowing particles forming wave-like patterns",
+        icon="✨",
+    ),
+
+    "liquid_marble": PatternInfo(
+        name="Liquid Marble",
+        desc="Organic marble-like fluid animation",
+        icon="🫧",
+    ),
+    "aurora_borealis": PatternInfo(
+        name="Aurora Borealis",
+        desc="Northern lights curtain effect",
+        icon="🌌",
+    ),
+    "smoke_plume": PatternInfo(
+        name="Smoke Plume",
+        desc="Soft smoke/fog rising and swirling",
+        icon="🌫️",
+    ),
+    "fractal_tunnel": PatternInfo(
+        name="Fractal Tunnel",
+        desc="Hypnotic tunnel zoom with fractal patterns",
+        icon="🌀",
+    ),
+    "wave_interference": PatternInfo(
+        name="Wave Interference",
+        desc="Overlapping sine wave interference patterns",
+        icon="〰️",
+    ),
+    "diamond_grid": PatternInfo(
+        name="Diamond Grid",
+        desc="Animated diamond/rhombus tessellation",
+        icon="💠",
+    ),
+    "plasma_field": PatternInfo(
+        name="Plasma Field",
+        desc="Classic plasma effect with flowing colors",
+        icon="🔥",
+    ),
+    "spiral_vortex": PatternInfo(
+        name="Spiral Vortex",
+        desc="Rotating spiral with color transitions",
+        icon="🌪️",
+    ),
+    "stripe_cascade": PatternInfo(
+        name="Stripe Cascade",
+        desc="Diagonal stripes cascading with color shifts",
+        icon="📊",
+    ),
+    "dot_matrix": PatternInfo(
+        name="Dot Matrix",
+        desc="Animated halftone dot pattern with depth",
+        icon="⚫",
+    ),
+    "nebula_cloud": PatternInfo(
+        name="Nebula Cloud",
+        desc="Deep space nebula with swirling cosmic dust",
+        icon="🌠",
+    ),
+    "kaleidoscope": PatternInfo(
+        name="Kaleidoscope",
+        desc="Mesmerizing mirror-symmetry kaleidoscope animation",
+        icon="🔮",
+    ),
+    "fluid_ink": PatternInfo(
+        name="Fluid Ink",
+        desc="Ink drops spreading in water with organic flow",
+        icon="🎨",
+    ),
+
+    "ripple_pond": PatternInfo(
+        name="Ripple Pond",
+        desc="Concentric water ripples with interference",
+        icon="💧",
+    ),
+
+    "holographic": PatternInfo(
+        name="Holographic",
+        desc="Iridescent holographic color shifting",
+        icon="🌈",
+    ),
+    "topographic": PatternInfo(
+        name="Topographic",
+        desc="Animated topographic contour map lines",
+        icon="🗺️",
+    ),
+    "hexagon_grid": PatternInfo(
+        name="Hexagon Grid",
+        desc="Animated honeycomb hexagonal grid pattern",
+        icon="🔲",
+    ),
+    "voronoi_cells": PatternInfo(
+        name="Voronoi Cells",
+        desc="Organic Voronoi tessellation with moving seeds",
+        icon="🧬",
+    ),
+
+    "watercolor_blend": PatternInfo(
+        name="Watercolor Blend",
+        desc="Soft watercolor paint spreading and blending",
+        icon="🖌️",
+    ),
+    "ocean_waves": PatternInfo(
+        name="Ocean Waves",
+        desc="Rolling ocean wave simulation with foam",
+        icon="🌊",
+    ),
+    "rolling_clouds": PatternInfo(
+        name="Rolling Clouds",
+        desc="Soft cloud formations drifting across the sky",
+        icon="☁️",
+    ),
+    "geometric_bloom": PatternInfo(
+        name="Geometric Bloom",
+        desc="Sacred geometry flower patterns expanding and contracting",
+        icon="🌸",
+    ),
+    "color_explosion": PatternInfo(
+        name="Color Explosion",
+        desc="Vibrant radial burst of saturated colors from center",
+        icon="🎆",
+    ),
+    "oil_slick": PatternInfo(
+        name="Oil Slick",
+        desc="Iridescent oil-on-water rainbow color shifting",
+        icon="💎",
+    ),
+    "prismatic_waves": PatternInfo(
+        name="Prismatic Waves",
+        desc="Full spectrum prismatic waves flowing across screen",
+        icon="🔮",
+    ),
+    "gradient_mesh": PatternInfo(
+        name="Gradient Mesh",
+        desc="Rich overlapping color gradients filling every pixel",
+        icon="🎨",
+    ),
+    "chromatic_pulse": PatternInfo(
+        name="Chromatic Pulse",
+        desc="Pulsating concentric rings of vivid saturated colors",
+        icon="💜",
+    ),
+    "color_smoke": PatternInfo(
+        name="Color Smoke",
+        desc="Vivid smoke plumes in saturated flowing colors",
+        icon="🌈",
+    ),
+    "rainbow_flow": PatternInfo(
+        name="Rainbow Flow",
+        desc="Smooth flowing rainbow gradient transitions",
+        icon="🏳️‍🌈",
+    ),
+    "paint_pour": PatternInfo(
+        name="Paint Pour",
+        desc="Acrylic paint pour with rich color mixing",
+        icon="🎨",
+    ),
+    "silk_fabric": PatternInfo(
+        name="Silk Fabric",
+        desc="Flowing silk fabric with iridescent color folds",
+        icon="🧣",
+    ),
+    "neon_waves": PatternInfo(
+        name="Neon Waves",
+        desc="Bright neon-colored flowing wave patterns",
+        icon="💡",
+    ),
+    "lava_flow": PatternInfo(
+        name="Lava Flow",
+        desc="Flowing molten lava with vivid warm colors",
+        icon="🌋",
+    ),
+    "color_vortex": PatternInfo(
+        name="Color Vortex",
+        desc="Spinning vortex whirlpool of saturated colors",
+        icon="🌪️",
+    ),
+    "aurora_curtain": PatternInfo(
+        name="Aurora Curtain",
+        desc="Full-color dancing aurora curtain effect",
+        icon="🌌",
+    ),
+    "marble_ink": PatternInfo(
+        name="Marble Ink",
+        desc="Colorful ink marble pattern in water",
+        icon="🫧",
+    ),
+    "electric_gradient": PatternInfo(
+        name="Electric Gradient",
+        desc="Sharp vivid gradient transitions with energy",
+        icon="⚡",
+    ),
+    "color_cells": PatternInfo(
+        name="Color Cells",
+        desc="Organic cellular pattern in saturated colors",
+        icon="🧬",
+    ),
+    "neon_grid": PatternInfo(
+        name="Neon Grid",
+        desc="Glowing animated neon wireframe grid",
+        icon="🔲",
+    ),
+    "paint_drip": PatternInfo(
+        name="Paint Drip",
+        desc="Thick paint dripping with rich color blends",
+        icon="🖌️",
+    ),
+    "crystal_facets": PatternInfo(
+        name="Crystal Facets",
+        desc="Faceted crystal blocks with vibrant color fills",
+        icon="💎",
+    ),
+    "thermal_map": PatternInfo(
+        name="Thermal Map",
+        desc="Animated thermal heat map in vivid colors",
+        icon="🌡️",
+    ),
+    "color_storm": PatternInfo(
+        name="Color Storm",
+        desc="Turbulent storm of mixed vibrant colors",
+        icon="🌩️",
+    ),
+    "pixel_mosaic": PatternInfo(
+        name="Pixel Mosaic",
+        desc="Animated colorful pixel mosaic grid pattern",
+        icon="🟩",
+    ),
+    "liquid_chrome": PatternInfo(
+        name="Liquid Chrome",
+        desc="Liquid metal chrome with rainbow reflections",
+        icon="🪩",
+    ),
+})
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # OVERLAY EFFECT DEFINITIONS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-OVERLAY_EFFECTS = {
-    "none": {
-        "name": "None",
-        "desc": "No overlay effect",
-        "icon": "❌",
-    },
-    "light_leak": {
-        "name": "Light Leak",
-        "desc": "Film-style light leak flares",
-        "icon": "☀️",
-    },
-    "film_grain": {
-        "name": "Film Grain",
-        "desc": "Subtle analog film grain texture",
-        "icon": "📽️",
-    },
-    "lens_flare": {
-        "name": "Lens Flare",
-        "desc": "Cinematic lens flare sweeping across",
-        "icon": "🔆",
-    },
-    "dust_particles": {
-        "name": "Dust Particles",
-        "desc": "Floating micro dust particles",
-        "icon": "💫",
-    },
-
-    "chromatic_aberration": {
-        "name": "Chromatic Shift",
-        "desc": "RGB split/chromatic aberration effect",
-        "icon": "🌈",
-    },
-
-    "sparkle_stars": {
-        "name": "Sparkle Stars",
-        "desc": "Twinkling star sparkle overlay",
-        "icon": "⭐",
-    },
-    "prism_rainbow": {
-        "name": "Prism Rainbow",
-        "desc": "Prismatic rainbow light dispersion",
-        "icon": "🌈",
-    },
-    "soft_blur_edge": {
-        "name": "Soft Edge Blur",
-        "desc": "Gaussian blur on edges keeping center sharp",
-        "icon": "🔲",
-    },
-    "radial_rays": {
-        "name": "Radial Rays",
-        "desc": "Sun-like radial light rays from center",
-        "icon": "☀️",
-    },
-
-    "noise_texture": {
-        "name": "Noise Texture",
-        "desc": "Perlin-style soft noise overlay",
-        "icon": "🏔️",
-    },
-    "motion_streak": {
-        "name": "Motion Streak",
-        "desc": "Horizontal motion blur streaks",
-        "icon": "💨",
-    },
-
-    "god_rays": {
-        "name": "God Rays",
-        "desc": "Volumetric light beams streaming from above",
-        "icon": "☀️",
-    },
-    "color_wash": {
-        "name": "Color Wash",
-        "desc": "Sweeping color gradient wash across frame",
-        "icon": "🎨",
-    },
-    "kaleidoscope_overlay": {
-        "name": "Kaleidoscope Refract",
-        "desc": "Prismatic kaleidoscope light refraction",
-        "icon": "💎",
-    },
-    "heat_haze": {
-        "name": "Heat Haze",
-        "desc": "Shimmering heat distortion ripples",
-        "icon": "🌡️",
-    },
-    "snow_fall": {
-        "name": "Snow Fall",
-        "desc": "Gentle falling snow particles",
-        "icon": "❄️",
-    },
-    "rain_drops": {
-        "name": "Rain Drops",
-        "desc": "Falling rain streaks across frame",
-        "icon": "🌧️",
-    },
-    "bubble_float": {
-        "name": "Bubble Float",
-        "desc": "Translucent floating bubbles rising",
-        "icon": "🫧",
-    },
-    "confetti": {
-        "name": "Confetti",
-        "desc": "Colorful confetti particles falling",
-        "icon": "🎊",
-    },
-    "golden_dust": {
-        "name": "Golden Dust",
-        "desc": "Floating golden dust particles shimmering",
-        "icon": "✨",
-    },
-    "fog_drift": {
-        "name": "Fog Drift",
-        "desc": "Drifting fog and mist layers",
-        "icon": "🌫️",
-    },
-    "light_rays_top": {
-        "name": "Light Rays Top",
-        "desc": "Light rays streaming from the top",
-        "icon": "🔦",
-    },
-
-    "light_streak": {
-        "name": "Light Streak",
-        "desc": "Diagonal light streaks across frame",
-        "icon": "💫",
-    },
-    "edge_glow": {
-        "name": "Edge Glow",
-        "desc": "Glowing neon edges around the frame",
-        "icon": "🔮",
-    },
-    "wave_distort": {
-        "name": "Wave Distort",
-        "desc": "Subtle wave distortion overlay",
-        "icon": "🌊",
-    },
-
-    "vintage_fade": {
-        "name": "Vintage Fade",
-        "desc": "Warm vintage color fade effect",
-        "icon": "📷",
-    },
-    "shimmer": {
-        "name": "Shimmer",
-        "desc": "Subtle sparkle shimmer across the frame",
-        "icon": "💫",
-    },
-    "gradient_wipe": {
-        "name": "Gradient Wipe",
-        "desc": "Animated gradient sweep across frame",
-        "icon": "🎬",
-    },
-
-    "ripple_overlay": {
-        "name": "Ripple Distort",
-        "desc": "Concentric ripple distortion from center",
-        "icon": "💧",
-    },
-    "star_field": {
-        "name": "Star Field",
-        "desc": "Twinkling star field overlay",
-        "icon": "⭐",
-    },
-    "smoke_wisp": {
-        "name": "Smoke Wisp",
-        "desc": "Subtle smoke wisps drifting across",
-        "icon": "💨",
-    },
-    "pulse_ring": {
-        "name": "Pulse Ring",
-        "desc": "Expanding concentric pulse rings",
-        "icon": "🔵",
-    },
-    "diamond_sparkle": {
-        "name": "Diamond Sparkle",
-        "desc": "Bright diamond sparkle highlights",
-        "icon": "💎",
-    },
-
-    "color_overlay": {
-        "name": "Color Overlay",
-        "desc": "Moving color gradient tint overlay",
-        "icon": "🎨",
-    },
-
-    "bloom_glow": {
-        "name": "Bloom Glow",
-        "desc": "Soft bloom glow on bright areas",
-        "icon": "🌟",
-    },
-}
+OVERLAY_EFFECTS = MappingProxyType({
+    "none": PatternInfo(
+        name="None",
+        desc="No overlay effect",
+        icon="❌",
+    ),
+    "light_leak": PatternInfo(
+        name="Light Leak",
+        desc="Film-style light leak flares",
+        icon="☀️",
+    ),
+    "film_grain": PatternInfo(
+        name="Film Grain",
+        desc="Subtle analog film grain texture",
+        icon="📽️",
+    ),
+    "lens_flare": PatternInfo(
+        name="Lens Flare",
+        desc="Cinematic lens flare sweeping across",
+        icon="🔆",
+    ),
+    "dust_particles": PatternInfo(
+        name="Dust Particles",
+        desc="Floating micro dust particles",
+        icon="💫",
+    ),
+
+    "chromatic_aberration": PatternInfo(
+        name="Chromatic Shift",
+        desc="RGB split/chromatic aberration effect",
+        icon="🌈",
+    ),
+
+    "sparkle_stars": PatternInfo(
+        name="Sparkle Stars",
+        desc="Twinkling star sparkle overlay",
+        icon="⭐",
+    ),
+    "prism_rainbow": PatternInfo(
+        name="Prism Rainbow",
+        desc="Prismatic rainbow light dispersion",
+        icon="🌈",
+    ),
+    "soft_blur_edge": PatternInfo(
+        name="Soft Edge Blur",
+        desc="Gaussian blur on edges keeping center sharp",
+        icon="🔲",
+    ),
+    "radial_rays": PatternInfo(
+        name="Radial Rays",
+        desc="Sun-like radial light rays from center",
+        icon="☀️",
+    ),
+
+    "noise_texture": PatternInfo(
+        name="Noise Texture",
+        desc="Perlin-style soft noise overlay",
+        icon="🏔️",
+    ),
+    "motion_streak": PatternInfo(
+        name="Motion Streak",
+        desc="Horizontal motion blur streaks",
+        icon="💨",
+    ),
+
+    "god_rays": PatternInfo(
+        name="God Rays",
+        desc="Volumetric light beams streaming from above",
+        icon="☀️",
+    ),
+    "color_wash": PatternInfo(
+        name="Color Wash",
+        desc="Sweeping color gradient wash across frame",
+        icon="🎨",
+    ),
+    "kaleidoscope_overlay": PatternInfo(
+        name="Kaleidoscope Refract",
+        desc="Prismatic kaleidoscope light refraction",
+        icon="💎",
+    ),
+    "heat_haze": PatternInfo(
+        name="Heat Haze",
+        desc="Shimmering heat distortion ripples",
+        icon="🌡️",
+    ),
+    "snow_fall": PatternInfo(
+        name="Snow Fall",
+        desc="Gentle falling snow particles",
+        icon="❄️",
+    ),
+    "rain_drops": PatternInfo(
+        name="Rain Drops",
+        desc="Falling rain streaks across frame",
+        icon="🌧️",
+    ),
+    "bubble_float": PatternInfo(
+        name="Bubble Float",
+        desc="Translucent floating bubbles rising",
+        icon="🫧",
+    ),
+    "confetti": PatternInfo(
+        name="Confetti",
+        desc="Colorful confetti particles falling",
+        icon="🎊",
+    ),
+    "golden_dust": PatternInfo(
+        name="Golden Dust",
+        desc="Floating golden dust particles shimmering",
+        icon="✨",
+    ),
+    "fog_drift": PatternInfo(
+        name="Fog Drift",
+        desc="Drifting fog and mist layers",
+        icon="🌫️",
+    ),
+    "light_rays_top": PatternInfo(
+        name="Light Rays Top",
+        desc="Light rays streaming from the top",
+        icon="🔦",
+    ),
+
+    "light_streak": PatternInfo(
+        name="Light Streak",
+        desc="Diagonal light streaks across frame",
+        icon="💫",
+    ),
+    "edge_glow": PatternInfo(
+        name="Edge Glow",
+        desc="Glowing neon edges around the frame",
+        icon="🔮",
+    ),
+    "wave_distort": PatternInfo(
+        name="Wave Distort",
+        desc="Subtle wave distortion overlay",
+        icon="🌊",
+    ),
+
+    "vintage_fade": PatternInfo(
+        name="Vintage Fade",
+        desc="Warm vintage color fade effect",
+        icon="📷",
+    ),
+    "shimmer": PatternInfo(
+        name="Shimmer",
+        desc="Subtle sparkle shimmer across the frame",
+        icon="💫",
+    ),
+    "gradient_wipe": PatternInfo(
+        name="Gradient Wipe",
+        desc="Animated gradient sweep across frame",
+        icon="🎬",
+    ),
+
+    "ripple_overlay": PatternInfo(
+        name="Ripple Distort",
+        desc="Concentric ripple distortion from center",
+        icon="💧",
+    ),
+    "star_field": PatternInfo(
+        name="Star Field",
+        desc="Twinkling star field overlay",
+        icon="⭐",
+    ),
+    "smoke_wisp": PatternInfo(
+        name="Smoke Wisp",
+        desc="Subtle smoke wisps drifting across",
+        icon="💨",
+    ),
+    "pulse_ring": PatternInfo(
+        name="Pulse Ring",
+        desc="Expanding concentric pulse rings",
+        icon="🔵",
+    ),
+    "diamond_sparkle": PatternInfo(
+        name="Diamond Sparkle",
+        desc="Bright diamond sparkle highlights",
+        icon="💎",
+    ),
+
+    "color_overlay": PatternInfo(
+        name="Color Overlay",
+        desc="Moving color gradient tint overlay",
+        icon="🎨",
+    ),
+
+    "bloom_glow": PatternInfo(
+        name="Bloom Glow",
+        desc="Soft bloom glow on bright areas",
+        icon="🌟",
+    ),
+})
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # COLOR HARMONY UTILITIES
@@ -659,12 +864,56 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
-def generate_harmony_colors(harmony_type: str = "random") -> List[str]:
+def _hls_to_rgb_vec(h, l, s) -> np.ndarray:
+    """Vectorized colorsys.hls_to_rgb over arrays in [0, 1].
+
+    Returns an (N, 3) uint8 array, truncated like int(c * 255).
+    """
+    h = np.asarray(h, dtype=np.float64)
+    l = np.asarray(l, dtype=np.float64)
+    s = np.asarray(s, dtype=np.float64)
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - l * s)
+    m1 = 2.0 * l - m2
+
+    def channel(hue):
+        hue = hue % 1.0
+        return np.select(
+            [hue < 1 / 6, hue < 0.5, hue < 2 / 3],
+            [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2 / 3 - hue) * 6.0],
+            default=m1,
+        )
+
+    rgb = np.stack([channel(h + 1 / 3), channel(h), channel(h - 1 / 3)], axis=-1)
+    rgb[s == 0.0] = l[s == 0.0, np.newaxis]
+    return (rgb * 255).astype(np.uint8)
+
+
+def generate_harmony_colors(harmony_type: str = "random",
+                            seed: Optional[int] = None) -> List[str]:
     """
     Generate 4 harmonious colors based on color theory.
     Returns list of 4 hex color strings.
+
+    With a seed the palette is reproducible and cached, so repeated calls
+    for the same (harmony_type, seed) return instantly.
     """
-    base_hue = random.random()
+    if seed is not None:
+        return list(_seeded_harmony_colors(harmony_type, seed))
+    return _harmony_colors(harmony_type, _harmony_rng)
+
+
+# Shared generator for unseeded palettes
+_harmony_rng = np.random.default_rng()
+
+
+@functools.lru_cache(maxsize=256)
+def _seeded_harmony_colors(harmony_type: str, seed: int) -> Tuple[str, ...]:
+    return tuple(_harmony_colors(harmony_type, np.random.default_rng(seed)))
+
+
+def _harmony_colors(harmony_type: str, rng: np.random.Generator) -> List[str]:
+    """Palette generation behind generate_harmony_colors, drawing from ``rng``."""
+    base_hue = rng.random()
 
     if harmony_type == "analogous":
         hues = [base_hue, (base_hue + 0.08) % 1, (base_hue + 0.16) % 1, (base_hue + 0.24) % 1]
@@ -677,43 +926,31 @@ def generate_harmony_colors(harmony_type: str = "random") -> List[str]:
     elif harmony_type == "tetradic":
         hues = [base_hue, (base_hue + 0.25) % 1, (base_hue + 0.5) % 1, (base_hue + 0.75) % 1]
     elif harmony_type == "warm":
-        base_hue = random.uniform(0.0, 0.12)  # Red-yellow range
+        base_hue = rng.uniform(0.0, 0.12)  # Red-yellow range
         hues = [base_hue, (base_hue + 0.04) % 1, (base_hue + 0.08) % 1, (base_hue + 0.12) % 1]
     elif harmony_type == "cool":
-        base_hue = random.uniform(0.5, 0.72)  # Blue-cyan range
+        base_hue = rng.uniform(0.5, 0.72)  # Blue-cyan range
         hues = [base_hue, (base_hue + 0.04) % 1, (base_hue + 0.08) % 1, (base_hue + 0.12) % 1]
     elif harmony_type == "pastel":
-        hues = [random.random() for _ in range(4)]
-        colors = []
-        for h in hues:
-            r, g, b = colorsys.hls_to_rgb(h, 0.82, 0.45)
-            colors.append(rgb_to_hex(int(r*255), int(g*255), int(b*255)))
-        return colors
+        hues = rng.random(4)
+        rgb = _hls_to_rgb_vec(hues, [0.82] * 4, [0.45] * 4)
+        return [rgb_to_hex(*c) for c in rgb.tolist()]
     elif harmony_type == "neon":
-        hues = [random.random() for _ in range(4)]
-        colors = []
-        for h in hues:
-            r, g, b = colorsys.hls_to_rgb(h, 0.55, 1.0)
-            colors.append(rgb_to_hex(int(r*255), int(g*255), int(b*255)))
-        return colors
+        hues = rng.random(4)
+        rgb = _hls_to_rgb_vec(hues, [0.55] * 4, [1.0] * 4)
+        return [rgb_to_hex(*c) for c in rgb.tolist()]
     elif harmony_type == "dark_rich":
-        hues = [random.random() for _ in range(4)]
-        colors = []
-        for h in hues:
-            sat = random.uniform(0.7, 1.0)
-            r, g, b = colorsys.hls_to_rgb(h, 0.3, sat)
-            colors.append(rgb_to_hex(int(r*255), int(g*255), int(b*255)))
-        return colors
+        hues = rng.random(4)
+        sats = rng.uniform(0.7, 1.0, 4)
+        rgb = _hls_to_rgb_vec(hues, [0.3] * 4, sats)
+        return [rgb_to_hex(*c) for c in rgb.tolist()]
     else:  # random
-        hues = [random.random() for _ in range(4)]
+        hues = rng.random(4)
 
-    colors = []
-    for i, h in enumerate(hues):
-        sat = random.uniform(0.6, 1.0)
-        light = random.uniform(0.35, 0.65)
-        r, g, b = colorsys.hls_to_rgb(h, light, sat)
-        colors.append(rgb_to_hex(int(r*255), int(g*255), int(b*255)))
-    return colors
+    sats = rng.uniform(0.6, 1.0, 4)
+    lights = rng.uniform(0.35, 0.65, 4)
+    rgb = _hls_to_rgb_vec(hues, lights, sats)
+    return [rgb_to_hex(*c) for c in rgb.tolist()]
 
 
 HARMONY_TYPES = [
@@ -726,6 +963,184 @@ HARMONY_TYPES = [
 # FRAME RENDERING ENGINE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_cupy = None
+_cupy_checked = False
+
+
+def _get_cupy():
+    """Return the cupy module if it's installed and a CUDA device is present."""
+    global _cupy, _cupy_checked
+    if not _cupy_checked:
+        try:
+            import cupy
+            if cupy.cuda.runtime.getDeviceCount() > 0:
+                _cupy = cupy
+                logger.info("CuPy found — rendering heavy patterns on the GPU")
+        except Exception as e:
+            logger.debug("CuPy not available: %s", e)
+        _cupy_checked = True
+    return _cupy
+
+
+# 1-D Gaussian kernels by size, shared by all renderers
+_SEP_KERNELS = {}
+
+
+def _gaussian_kernel(ksize: int) -> np.ndarray:
+    """Cached cv2.getGaussianKernel(ksize, 0) as float32."""
+    k = _SEP_KERNELS.get(ksize)
+    if k is None:
+        k = cv2.getGaussianKernel(ksize, 0, ktype=cv2.CV_32F)
+        _SEP_KERNELS[ksize] = k
+    return k
+
+
+def _box_gaussian(img: np.ndarray, ksize: int) -> np.ndarray:
+    """Three box-filter passes approximating cv2.GaussianBlur(img, (ksize, ksize), 0).
+
+    Box filters cost the same per pixel at any width, so this is several times
+    faster than a true kernel for the very large glow blurs, at the price of
+    an error of a level or two.
+    """
+    sigma = 0.3 * ((ksize - 1) * 0.5 - 1) + 0.8
+    width = int(round(math.sqrt(4 * sigma * sigma + 1))) | 1
+    for _ in range(3):
+        img = cv2.boxFilter(img, -1, (width, width))
+    return img
+
+
+def _to_u8(frame: np.ndarray) -> np.ndarray:
+    """Saturate a non-negative float frame to uint8 in one cv2.convertScaleAbs pass.
+
+    Same as np.clip(frame, 0, 255).astype(np.uint8) to within one level
+    (values round instead of truncating) at about a third of the cost.
+    Negative values come out as their absolute value, so frames that can dip
+    below zero must keep the NumPy clip.
+    """
+    return cv2.convertScaleAbs(frame)
+
+
+# Fixed-point scale of the int16 glow overlays: 6 fractional bits keep box
+# blur rounding well under a level while the brightest flare stays below 2**15
+_GLOW_ONE = 64
+
+
+def _affine_lut(mul: float, add: float) -> np.ndarray:
+    """256-entry table for np.clip(v * mul + add, 0, 255).astype(np.uint8).
+
+    cv2.LUT through this table remaps a uint8 frame exactly like the float
+    round trip, but as a single byte lookup pass.
+    """
+    return np.clip(np.arange(256, dtype=np.float32) * mul + add, 0, 255).astype(np.uint8)
+
+
+def _affine_lut3(mul: float, adds) -> np.ndarray:
+    """(256, 1, 3) per-channel _affine_lut, for cv2.LUT on a 3-channel frame."""
+    return np.stack([_affine_lut(mul, add) for add in adds], axis=-1)[:, np.newaxis, :]
+
+
+# Anti-aliased glyph coverage masks by (char, font, scale), shared by all renderers
+_GLYPHS = {}
+
+
+def _glyph(ch: str, font: int, scale: float) -> tuple:
+    """Cached ``(alpha, dx, dy)`` of ``ch`` as cv2.putText would draw it.
+
+    ``alpha`` is the float32 (h, w, 1) coverage of the glyph, and (dx, dy)
+    its top-left corner relative to the putText origin.
+    """
+    key = (ch, font, scale)
+    glyph = _GLYPHS.get(key)
+    if glyph is None:
+        (tw, th), baseline = cv2.getTextSize(ch, font, scale, 1)
+        pad = 2  # room for the line thickness and AA fringe
+        mask = np.zeros((th + baseline + 2 * pad, tw + 2 * pad), dtype=np.uint8)
+        cv2.putText(mask, ch, (pad, pad + th), font, scale, 255, 1, cv2.LINE_AA)
+        alpha = (mask.astype(np.float32) * np.float32(1 / 255))[..., np.newaxis]
+        glyph = (alpha, -pad, -pad - th)
+        _GLYPHS[key] = glyph
+    return glyph
+
+
+def _blit_glyph(frame: np.ndarray, glyph: tuple, x: int, y: int, color: np.ndarray) -> None:
+    """Blend a _glyph into ``frame`` at putText origin (x, y), clipped to the frame."""
+    alpha, dx, dy = glyph
+    x0, y0 = x + dx, y + dy
+    gh, gw = alpha.shape[:2]
+    top, left = max(0, -y0), max(0, -x0)
+    bottom, right = min(gh, frame.shape[0] - y0), min(gw, frame.shape[1] - x0)
+    if bottom <= top or right <= left:
+        return
+    patch = frame[y0 + top:y0 + bottom, x0 + left:x0 + right]
+    a = alpha[top:bottom, left:right]
+    patch[:] = patch + (color - patch) * a + 0.5
+
+
+def _distance_field(x_row: np.ndarray, y_col: np.ndarray, cx: float, cy: float) -> np.ndarray:
+    """Distance from (cx, cy) over the grid spanned by a (1, W) row and an (H, 1) column.
+
+    The squared offsets are taken on the 1-D axes and broadcast once, so the
+    only full-frame passes are one add and one in-place sqrt.
+    """
+    d = np.add(np.square(x_row - cx), np.square(y_col - cy))
+    return np.sqrt(d, out=d)
+
+
+def _separable_sum(cols, rows) -> np.ndarray:
+    """sum(c[:, None] * r[None, :] for c, r in zip(cols, rows)) as one float32 matmul.
+
+    Sines of arguments linear in x and y split, by the angle-sum identities,
+    into a few products of 1-D sin/cos axes, so a whole (H, W) plane is written
+    in one pass instead of once per arithmetic step.
+    """
+    return np.stack(cols, axis=1).astype(np.float32) @ np.stack(rows).astype(np.float32)
+
+
+# Pixels per band for AbstractVideoRenderer._tiled
+_TILE_PIXELS = 1 << 15
+
+
+_cuda_blur_checked = False
+_cuda_blur_ok = False
+
+
+def _cuda_blur_available() -> bool:
+    """True if this OpenCV build has CUDA support and sees a CUDA device."""
+    global _cuda_blur_checked, _cuda_blur_ok
+    if not _cuda_blur_checked:
+        try:
+            _cuda_blur_ok = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except Exception:
+            _cuda_blur_ok = False
+        if _cuda_blur_ok:
+            logger.info("OpenCV CUDA found — pattern blurs run on the GPU")
+        _cuda_blur_checked = True
+    return _cuda_blur_ok
+
+
+_opencl_blur_checked = False
+_opencl_blur_ok = False
+
+# Below this size the UMat upload/download costs more than the CPU filter
+_OPENCL_BLUR_MIN_KSIZE = 11
+
+
+def _opencl_blur_available() -> bool:
+    """True if OpenCV's T-API can run filters on an OpenCL device."""
+    global _opencl_blur_checked, _opencl_blur_ok
+    if not _opencl_blur_checked:
+        try:
+            if cv2.ocl.haveOpenCL():
+                cv2.ocl.setUseOpenCL(True)
+                _opencl_blur_ok = cv2.ocl.useOpenCL()
+        except Exception:
+            _opencl_blur_ok = False
+        if _opencl_blur_ok:
+            logger.info("OpenCL found — large pattern blurs run through cv2.UMat")
+        _opencl_blur_checked = True
+    return _opencl_blur_ok
+
+
 class AbstractVideoRenderer:
     """
     Renders individual frames for abstract video backgrounds.
@@ -736,95 +1151,480 @@ class AbstractVideoRenderer:
         self.w = width
         self.h = height
         self.colors = colors  # List of 4 (R, G, B) tuples
+        # Palette as a (4, 3) float32 table, shared by every pattern
+        self._c_arr = np.asarray(colors, dtype=np.float32)
+        # Same table with color 0 repeated at the end, so the "next" color of a
+        # clipped index is _colors_padded[idx + 1] with no modulo wrap
+        self._colors_padded = np.vstack([self._c_arr, self._c_arr[:1]])
+        # Step from each color to the next, for lerping as c + step * frac
+        self._c_step = self._colors_padded[1:] - self._c_arr
+        # Palette rotated by one, so c_arr[(i + 1) & 3] is self._c_next[i & 3]
+        self._c_next = np.ascontiguousarray(self._colors_padded[1:])
+        # Per-channel (base, step) tables so the lerp runs on contiguous planes
+        self._c_planes = tuple(
+            (np.ascontiguousarray(self._c_arr[:, ch]), np.ascontiguousarray(self._c_step[:, ch]))
+            for ch in range(3)
+        )
+        for table in (self._c_arr, self._colors_padded, self._c_step, self._c_next):
+            table.flags.writeable = False
+        # Palette as int tuples, the color form cv2 drawing calls take
+        self._c_int = [tuple(int(c) for c in col) for col in colors]
         # Pre-compute coordinate grids
         self.y_grid, self.x_grid = np.mgrid[0:height, 0:width].astype(np.float32)
         self.cx = width / 2.0
         self.cy = height / 2.0
+        # (1, W) / (H, 1) normalized axes for terms that depend on one axis
+        # only. The full-frame normalized grids are cached properties below.
+        self._nx_row = self.x_grid[:1] / width
+        self._ny_col = self.y_grid[:, :1] / height
+        # Scratch uint8 frame for pre-blur output. Only ever handed to
+        # cv2 filters that allocate their own result, never returned as-is,
+        # since rendered frames are queued while the next one is drawn.
+        self._frame_buf = np.empty((height, width, 3), dtype=np.uint8)
+        # Per-renderer RNG and particle indices for the batched particle patterns
+        self._rng = np.random.default_rng()
+        self._particle_idx = np.arange(200, dtype=np.float64)
+        # nebula_cloud star pixels and phases, filled on first use
+        self._nebula_stars = None
+        # sphere_3d's time-invariant geometry and background, filled on first use
+        self._sphere_geo = None
+        # cubes_3d's uint8 background gradient, filled on first use
+        self._cubes_bg = None
+        # holographic's aspect-normalized angle around the center, filled on first use
+        self._holo_angle = None
+        # rainbow_flow's time-invariant phase planes, filled on first use
+        self._rainbow_base = None
+        # crystal_facets' uint8 edge highlight (60 on facet edges, else 0), filled on first use
+        self._facet_edges = None
+        # Fixed-seed uniform draws by (seed, shape), see _seeded_random
+        self._seeded_draws = {}
+        # Fixed-seed per-pattern parameter arrays by pattern, see _seeded_params
+        self._rand_cache = {}
+        # (nx, ny) grids scaled by a constant, see _scaled_norm
+        self._scaled_grids = {}
+        # 256-entry uint8 palette tables by (alpha, beta), see _palette_lut_u8
+        self._palette_luts = {}
+        # Half-size twin for _render_half, created on first use
+        self._half = None
+        # (H, W, 3) float32 targets for _gather_pair, allocated on first use
+        self._c1_buf = None
+        self._c2_buf = None
+        # cv2.cuda Gaussian filters by size, when OpenCV was built with CUDA
+        self._use_cuda_blur = _cuda_blur_available()
+        self._cuda_filters = {}
+        # Otherwise OpenCL through the T-API, for the larger kernels
+        self._use_opencl_blur = not self._use_cuda_blur and _opencl_blur_available()
+        # Array backend for the trig-heavy per-pixel patterns: CuPy on an NVIDIA
+        # GPU when installed, NumPy otherwise. The *_d arrays are the backend's
+        # copies and simply alias the host arrays on NumPy.
+        self.xp = _get_cupy() or np
+        self._x_grid_d = self.xp.asarray(self.x_grid)
+        self._y_grid_d = self.xp.asarray(self.y_grid)
+        self._colors_padded_d = self.xp.asarray(self._colors_padded)
+        self._c_arr_d = self.xp.asarray(self._c_arr)
+        self._c_step_d = self.xp.asarray(self._c_step)
+
+    # Normalized full-frame grids. Each is an (H, W) float32 array that only
+    # a few patterns read, so it is built on first use instead of in
+    # __init__ and a worker renderer only pays for the grids its pattern needs.
+
+    @functools.cached_property
+    def nx4(self) -> np.ndarray:
+        """x scaled to [0, 4)."""
+        return self.x_grid * np.float32(4.0 / self.w)
+
+    @functools.cached_property
+    def ny4(self) -> np.ndarray:
+        """y scaled to [0, 4)."""
+        return self.y_grid * np.float32(4.0 / self.h)
+
+    @functools.cached_property
+    def _nx_norm(self) -> np.ndarray:
+        """x scaled to [0, 1)."""
+        return self.x_grid / self.w
+
+    @functools.cached_property
+    def _ny_norm(self) -> np.ndarray:
+        """y scaled to [0, 1)."""
+        return self.y_grid / self.h
+
+    @functools.cached_property
+    def ygrad(self) -> np.ndarray:
+        """Vertical 0..1 gradient."""
+        return self.y_grid / np.float32(self.h)
+
+    @functools.cached_property
+    def radial(self) -> np.ndarray:
+        """Distance of (nx4, ny4) from the top-left corner."""
+        return np.sqrt(self.nx4 * self.nx4 + self.ny4 * self.ny4)
+
+    # Offsets from the frame center with their polar form, for the radial
+    # patterns. Shared by every frame, so they are read-only.
+
+    @functools.cached_property
+    def _dx(self) -> np.ndarray:
+        """x offset from the frame center."""
+        dx = self.x_grid - np.float32(self.cx)
+        dx.flags.writeable = False
+        return dx
+
+    @functools.cached_property
+    def _dy(self) -> np.ndarray:
+        """y offset from the frame center."""
+        dy = self.y_grid - np.float32(self.cy)
+        dy.flags.writeable = False
+        return dy
+
+    @functools.cached_property
+    def _dist(self) -> np.ndarray:
+        """Distance from the frame center."""
+        dist = np.sqrt(self._dx * self._dx + self._dy * self._dy)
+        dist.flags.writeable = False
+        return dist
+
+    @functools.cached_property
+    def _angle(self) -> np.ndarray:
+        """Angle around the frame center."""
+        angle = np.arctan2(self._dy, self._dx)
+        angle.flags.writeable = False
+        return angle
+
+    @functools.cached_property
+    def _dist_norm(self) -> np.ndarray:
+        """Center distance as a fraction of the longer frame side."""
+        dist_norm = self._dist * np.float32(1.0 / max(self.w, self.h))
+        dist_norm.flags.writeable = False
+        return dist_norm
+
+    @functools.cached_property
+    def _dist_d(self):
+        """_dist on the array backend."""
+        return self.xp.asarray(self._dist)
+
+    @functools.cached_property
+    def _angle_d(self):
+        """_angle on the array backend."""
+        return self.xp.asarray(self._angle)
+
+    @functools.cached_property
+    def _nx4_d(self):
+        """nx4 on the array backend."""
+        return self.xp.asarray(self.nx4)
+
+    @functools.cached_property
+    def _ny4_d(self):
+        """ny4 on the array backend."""
+        return self.xp.asarray(self.ny4)
+
+    @functools.cached_property
+    def _radial_d(self):
+        """radial on the array backend."""
+        return self.xp.asarray(self.radial)
+
+    def _blur(self, frame: np.ndarray, ksize: int) -> np.ndarray:
+        """Square Gaussian blur (sigma from ksize) via a cached separable kernel.
+
+        Same result as cv2.GaussianBlur(frame, (ksize, ksize), 0) to within
+        one level, without rebuilding the kernel every frame.  uint8 RGB
+        frames are blurred on the GPU when OpenCV has CUDA support, and
+        larger kernels go through OpenCL when that is available instead.
+        """
+        if self._use_cuda_blur and frame.dtype == np.uint8 and frame.ndim == 3:
+            try:
+                gpu_filter = self._cuda_filters.get(ksize)
+                if gpu_filter is None:
+                    gpu_filter = cv2.cuda.createGaussianFilter(
+                        cv2.CV_8UC3, cv2.CV_8UC3, (ksize, ksize), 0)
+                    self._cuda_filters[ksize] = gpu_filter
+                gpu_frame = cv2.cuda_GpuMat()
+                gpu_frame.upload(frame)
+                return gpu_filter.apply(gpu_frame).download()
+            except cv2.error as e:
+                logger.debug("CUDA blur failed, using CPU: %s", e)
+                self._use_cuda_blur = False
+
+        k = _gaussian_kernel(ksize)
+        if self._use_opencl_blur and ksize >= _OPENCL_BLUR_MIN_KSIZE:
+            try:
+                return cv2.sepFilter2D(cv2.UMat(frame), -1, k, k).get()
+            except cv2.error as e:
+                logger.debug("OpenCL blur failed, using CPU: %s", e)
+                self._use_opencl_blur = False
+        return cv2.sepFilter2D(frame, -1, k, k)
+
+    def _render_half(self, layer: Callable, t: float, ksize: int) -> np.ndarray:
+        """Render ``layer(renderer, t)`` at half size, blur there and upscale.
+
+        For patterns that finish with a heavy ``ksize`` blur: the detail lost
+        at half size is blurred away anyway, and half the kernel on the small
+        frame gives the same softness for a quarter of the work.
+        """
+        half = self._half
+        if half is None:
+            half = AbstractVideoRenderer(max(1, self.w // 2), max(1, self.h // 2), self.colors)
+            self._half = half
+        frame = half._blur(layer(half, t), ksize // 2 | 1)
+        return cv2.resize(frame, (self.w, self.h), interpolation=cv2.INTER_LINEAR)
+
+    def _tiled(self, band_fn: Callable) -> np.ndarray:
+        """Assemble a uint8 frame from ``band_fn(rows)`` over horizontal bands.
+
+        ``band_fn`` gets a row slice and returns that band's (rows, W, 3)
+        uint8 pixels.  Bands of ~32k pixels keep every per-pixel
+        intermediate in cache instead of streaming a full-frame array through
+        memory for each operation.  On the CuPy backend the whole frame is
+        one band.
+        """
+        if self.xp is not np:
+            return band_fn(slice(None))
+        out = np.empty((self.h, self.w, 3), dtype=np.uint8)
+        band = max(1, _TILE_PIXELS // self.w)
+        for y0 in range(0, self.h, band):
+            rows = slice(y0, y0 + band)
+            out[rows] = band_fn(rows)
+        return out
+
+    def _to_host_u8(self, frame) -> np.ndarray:
+        """Truncate a float frame from either backend to a new host uint8 array."""
+        frame = frame.astype(np.uint8)
+        return frame if isinstance(frame, np.ndarray) else frame.get()
+
+    def _to_frame_buf(self, blended) -> np.ndarray:
+        """Quantize a float (H, W, 3) blend from self.xp into the scratch frame."""
+        if self.xp is np:
+            np.copyto(self._frame_buf, blended, casting='unsafe')
+        else:
+            blended.astype(np.uint8).get(out=self._frame_buf)
+        return self._frame_buf
 
     def _blend_colors(self, t: float, idx1: int, idx2: int) -> np.ndarray:
         """Blend between two colors based on t (0-1)."""
-        c1 = np.array(self.colors[idx1 % 4], dtype=np.float32)
-        c2 = np.array(self.colors[idx2 % 4], dtype=np.float32)
+        c1 = self._c_arr[idx1 % 4]
+        c2 = self._c_arr[idx2 % 4]
         return (c1 * (1 - t) + c2 * t).astype(np.uint8)
 
-    # ── PATTERN: Gradient Flow ──
-    def gradient_flow(self, t: float) -> np.ndarray:
-        frame = np.zeros((self.h, self.w, 3), dtype=np.uint8)
-        # Multi-directional gradient that shifts over time
-        angle = t * 0.5
-        dx = math.cos(angle)
-        dy = math.sin(angle)
-        grad = (self.x_grid * dx + self.y_grid * dy)
-        grad = (grad - grad.min()) / (grad.max() - grad.min() + 1e-6)
-        # Map gradient through 4 colors
-        phase = (grad + t * 0.3) % 1.0
-        for y in range(self.h):
-            for x in range(0, self.w, 4):
-                end_x = min(x + 4, self.w)
-                p = phase[y, x]
-                idx = int(p * 3.99)
-                frac = (p * 3.99) - idx
-                c1 = np.array(self.colors[idx % 4], dtype=np.float32)
-                c2 = np.array(self.colors[(idx + 1) % 4], dtype=np.float32)
-                color = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-                frame[y, x:end_x] = color
-        # Gaussian blur for smoothness
-        frame = cv2.GaussianBlur(frame, (31, 31), 0)
+    def _seeded_random(self, seed: int, shape: tuple) -> np.ndarray:
+        """What ``np.random.seed(seed); np.random.random(shape)`` returns, drawn once.
+
+        Patterns that reseed every frame get identical numbers each time, so
+        they are cached per renderer (read-only) and the global RNG state is
+        left alone.
+        """
+        key = (seed, shape)
+        draws = self._seeded_draws.get(key)
+        if draws is None:
+            draws = np.random.RandomState(seed).random_sample(shape)
+            draws.flags.writeable = False
+            self._seeded_draws[key] = draws
+        return draws
+
+    def _seeded_params(self, key: str, seed: int, draw: Callable) -> tuple:
+        """``draw(np.random.RandomState(seed))``, evaluated once per renderer.
+
+        For patterns that rebuild the same seeded parameter arrays (mixing
+        rand and randint draws) every frame.  ``draw`` returns a tuple of
+        arrays, cached under ``key`` and marked read-only.
+        """
+        params = self._rand_cache.get(key)
+        if params is None:
+            params = draw(np.random.RandomState(seed))
+            for arr in params:
+                arr.flags.writeable = False
+            self._rand_cache[key] = params
+        return params
+
+    def _scaled_norm(self, scale: float) -> tuple:
+        """``(_nx_norm * scale, _ny_norm * scale)``, built once per scale (read-only).
+
+        Only the scales a renderer's pattern actually asks for are kept, so a
+        worker renderer holds one or two extra grid pairs, not one per pattern.
+        """
+        grids = self._scaled_grids.get(scale)
+        if grids is None:
+            grids = (self._nx_norm * scale, self._ny_norm * scale)
+            for grid in grids:
+                grid.flags.writeable = False
+            self._scaled_grids[scale] = grids
+        return grids
+
+    def _gather_pair(self, idx: np.ndarray) -> tuple:
+        """Gather palette colors ``idx`` and the next color of each, as float32.
+
+        Both results land in per-renderer buffers that are reused on the next
+        call, so callers may blend them in place but must not keep them.
+        """
+        if self._c1_buf is None:
+            self._c1_buf = np.empty((self.h, self.w, 3), dtype=np.float32)
+            self._c2_buf = np.empty((self.h, self.w, 3), dtype=np.float32)
+        # mode='wrap' lets np.take write straight into out= (the default
+        # 'raise' mode goes through a temporary); it also wraps any index
+        np.take(self._c_arr, idx, axis=0, out=self._c1_buf, mode='wrap')
+        np.take(self._c_next, idx, axis=0, out=self._c2_buf, mode='wrap')
+        return self._c1_buf, self._c2_buf
+
+    def _palette_planes(self, scaled: np.ndarray, smoothstep: bool) -> list:
+        """Per-channel float32 (H, W) planes of the palette blend (NumPy only).
+
+        Each channel is lerped as its own contiguous plane; strided
+        (H, W, 3) math vectorizes poorly.
+        """
+        idx = scaled.astype(np.int32)
+        np.clip(idx, 0, 3, out=idx)
+        frac = np.subtract(scaled, idx, dtype=np.float32)
+        if smoothstep:
+            frac = frac * frac * (3 - 2 * frac)
+        planes = []
+        for base, step in self._c_planes:
+            plane = np.take(base, idx)
+            plane += np.take(step, idx) * frac
+            planes.append(plane)
+        return planes
+
+    def _palette_lut_u8(self, scaled: np.ndarray, alpha: float = 1.0,
+                        beta: float = 0.0) -> np.ndarray:
+        """cv2.convertScaleAbs(_palette_lerp(scaled), alpha, beta) via a 256-entry table.
+
+        ``scaled`` (0-3.99) is rounded to steps of 1/64 and every pixel becomes
+        one cv2.LUT lookup into the blended, shaded palette, instead of two
+        gathers and a float lerp per channel.  Within a level or two of the
+        exact blend (NumPy only).
+        """
+        key = (alpha, beta)
+        table = self._palette_luts.get(key)
+        if table is None:
+            pos = np.arange(256, dtype=np.float32)[np.newaxis, :] * np.float32(1 / 64)
+            table = cv2.convertScaleAbs(cv2.merge(self._palette_planes(pos, False)),
+                                        alpha=alpha, beta=beta)
+            self._palette_luts[key] = table
+        idx = cv2.convertScaleAbs(scaled, alpha=64.0)
+        return cv2.LUT(cv2.merge([idx, idx, idx]), table)
+
+    def _fill_masked_u8(self, bg, mask: np.ndarray, planes: list) -> np.ndarray:
+        """uint8 frame of ``bg`` with the pixels under ``mask`` taken from ``planes``.
+
+        ``planes`` are three float channels holding only the masked pixels
+        (in mask order); they are clipped and cast on their own, so nothing
+        is computed or written at full-frame size for the pixels ``bg`` keeps.
+        """
+        frame = np.empty(mask.shape + (3,), dtype=np.uint8)
+        frame[:] = bg
+        fg = np.empty(planes[0].shape + (3,), dtype=np.uint8)
+        for ch, plane in enumerate(planes):
+            np.clip(plane, 0, 255, out=plane)
+            fg[..., ch] = plane
+        frame[mask] = fg
         return frame
 
+    def _palette_lerp(self, scaled: np.ndarray, smoothstep: bool = False) -> np.ndarray:
+        """Blend the palette at positions ``scaled`` (0-4) into a float32 (H, W, 3) frame.
+
+        The integer part picks the color and the fraction blends toward the
+        next one, wrapping from the last color back to the first.
+        """
+        if isinstance(scaled, np.ndarray):
+            return cv2.merge(self._palette_planes(scaled, smoothstep))
+        xp = self.xp
+        idx = scaled.astype(np.int32)
+        xp.clip(idx, 0, 3, out=idx)
+        frac = xp.subtract(scaled, idx, dtype=np.float32)
+        if smoothstep:
+            frac = frac * frac * (3 - 2 * frac)
+        frame = xp.take(self._c_arr_d, idx, axis=0)
+        frame += xp.take(self._c_step_d, idx, axis=0) * frac[..., np.newaxis]
+        return frame
+
+    def _palette_lerp_u8(self, scaled: np.ndarray, smoothstep: bool = False) -> np.ndarray:
+        """_palette_lerp truncated straight to a host uint8 frame.
+
+        The planes are cast before interleaving, so no float32 (H, W, 3)
+        frame is ever built.
+        """
+        if isinstance(scaled, np.ndarray):
+            return cv2.merge([p.astype(np.uint8) for p in self._palette_planes(scaled, smoothstep)])
+        return self._to_host_u8(self._palette_lerp(scaled, smoothstep))
+
+    def _palette_shade_u8(self, scaled: np.ndarray, gain=None, bias=0.0,
+                          smoothstep: bool = False) -> np.ndarray:
+        """Palette blend scaled by ``gain`` plus ``bias``, clipped to uint8 (NumPy only).
+
+        ``gain`` and ``bias`` are scalars or (H, W) planes applied to every
+        channel, so shading runs on the per-channel planes before they are
+        interleaved instead of broadcasting over an (H, W, 3) frame.
+        """
+        planes = self._palette_planes(scaled, smoothstep)
+        for plane in planes:
+            if gain is not None:
+                plane *= gain
+            plane += bias
+            np.clip(plane, 0, 255, out=plane)
+        return cv2.merge([p.astype(np.uint8) for p in planes])
+
+    # ── PATTERN: Gradient Flow ──
     def _fast_gradient_flow(self, t: float) -> np.ndarray:
         """Optimized gradient flow using vectorized operations."""
+        xp = self.xp
         angle = t * 0.5
         dx = math.cos(angle)
         dy = math.sin(angle)
-        grad = (self.x_grid * dx + self.y_grid * dy)
-        grad = (grad - grad.min()) / (grad.max() - grad.min() + 1e-6)
-        phase = (grad + t * 0.3) % 1.0
+        grad = self._x_grid_d * dx
+        grad += self._y_grid_d * dy
+        # A linear ramp peaks at the frame corners, so skip the full-frame
+        # min()/max() reductions
+        corners = grad[[0, 0, -1, -1], [0, -1, 0, -1]]
+        g_min = corners.min()
+        grad -= g_min
+        grad /= corners.max() - g_min + 1e-6
+        grad += t * 0.3
+        phase = xp.mod(grad, 1.0, out=grad)
 
         # Vectorized color mapping
         scaled = phase * 3.99
         idx = scaled.astype(np.int32)
-        idx = np.clip(idx, 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (31, 31), 0)
-        return frame
+        idx = xp.clip(idx, 0, 3)
+        frac = xp.subtract(scaled, idx, dtype=np.float32)[..., np.newaxis]
+
+        c_pad = self._colors_padded_d
+        c1 = c_pad[idx]
+        c2 = c_pad[idx + 1]
+        return self._blur(self._to_frame_buf(c1 * (1 - frac) + c2 * frac), 31)
+
+    # The per-pixel Python loop version was ~130k interpreter iterations per
+    # frame at 1080p; the vectorized implementation is the only one now.
+    gradient_flow = _fast_gradient_flow
 
     # ── PATTERN: Particle Wave ──
     def particle_wave(self, t: float) -> np.ndarray:
-        frame = np.zeros((self.h, self.w, 3), dtype=np.uint8)
-        # Background gradient
-        bg_grad = self.y_grid / self.h
-        c_bg1 = np.array(self.colors[0], dtype=np.float32) * 0.3
-        c_bg2 = np.array(self.colors[1], dtype=np.float32) * 0.3
-        frame = (c_bg1[np.newaxis, np.newaxis, :] * (1 - bg_grad[..., np.newaxis]) +
-                 c_bg2[np.newaxis, np.newaxis, :] * bg_grad[..., np.newaxis]).astype(np.uint8)
-
-        # Draw particles along wave
-        num_particles = 200
-        for i in range(num_particles):
-            px = (i / num_particles * self.w + t * 80) % self.w
-            wave_y = self.cy + math.sin(px * 0.02 + t * 2 + i * 0.1) * self.h * 0.2
-            wave_y += math.sin(px * 0.006 + t * 0.5) * self.h * 0.1
-            py = int(wave_y)
-            if 0 <= py < self.h:
-                color_idx = i % 4
-                radius = random.randint(2, 6)
-                color = tuple(int(c) for c in self.colors[color_idx])
-                cv2.circle(frame, (int(px), py), radius, color, -1, cv2.LINE_AA)
-
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        # Background gradient only varies along y: blend one column, then
+        # broadcast it across the width
+        bg_grad = self.ygrad[:, :1, np.newaxis]
+        c_bg1 = self._c_arr[0] * 0.3
+        c_bg2 = self._c_arr[1] * 0.3
+        bg_col = (c_bg1 * (1 - bg_grad) + c_bg2 * bg_grad).astype(np.uint8)
+        frame = np.ascontiguousarray(np.broadcast_to(bg_col, (self.h, self.w, 3)))
+
+        # Particle positions along the wave, computed for all particles at once
+        idx = self._particle_idx
+        num_particles = len(idx)
+        px = (idx / num_particles * self.w + t * 80) % self.w
+        wave_y = self.cy + np.sin(px * 0.02 + t * 2 + idx * 0.1) * self.h * 0.2
+        wave_y += np.sin(px * 0.006 + t * 0.5) * self.h * 0.1
+        py = wave_y.astype(np.int32)
+        visible = np.nonzero((py >= 0) & (py < self.h))[0]
+        radii = self._rng.integers(2, 7, size=len(visible))
+
+        colors = self._c_int
+        for i, x, y, radius in zip(visible.tolist(), px[visible].astype(np.int32).tolist(),
+                                   py[visible].tolist(), radii.tolist()):
+            cv2.circle(frame, (x, y), radius, colors[i % 4], -1, cv2.LINE_AA)
+
+        frame = self._blur(frame, 7)
         return frame
 
     # ── PATTERN: Geometric Mesh ──
     def geometric_mesh(self, t: float) -> np.ndarray:
         frame = np.zeros((self.h, self.w, 3), dtype=np.uint8)
         # Dark background
-        frame[:] = (np.array(self.colors[0]) * 0.15).astype(np.uint8)
+        frame[:] = (self._c_arr[0] * 0.15).astype(np.uint8)
 
         spacing = 80
         offset_x = (t * 30) % spacing
@@ -837,46 +1637,62 @@ class AbstractVideoRenderer:
                 py = int(gy * spacing + offset_y + math.cos(t + gx * 0.5) * 15)
                 points.append((px, py))
 
-        # Draw connections
-        for i, p1 in enumerate(points):
-            for j, p2 in enumerate(points):
-                if i >= j:
-                    continue
-                dist = math.sqrt((p1[0]-p2[0])**2 + (p1[1]-p2[1])**2)
-                if dist < spacing * 1.5:
-                    alpha = max(0, 1 - dist / (spacing * 1.5))
-                    color = tuple(int(c * alpha * 0.6) for c in self.colors[(i+j) % 4])
-                    cv2.line(frame, p1, p2, color, 1, cv2.LINE_AA)
+        # Draw connections — pairwise distances in one broadcast, then
+        # only the surviving (i < j, close enough) edges reach cv2.line
+        max_link = spacing * 1.5
+        pts = np.array(points, dtype=np.float64)
+        diff = pts[:, np.newaxis, :] - pts[np.newaxis, :, :]
+        dist = np.sqrt((diff * diff).sum(axis=-1))
+        ii, jj = np.nonzero(np.triu(dist < max_link, k=1))
+        alpha = 1 - dist[ii, jj] / max_link
+        edge_colors = (self._c_arr[(ii + jj) & 3] * alpha[:, np.newaxis] * 0.6).astype(np.int32)
+        for i, j, color in zip(ii.tolist(), jj.tolist(), edge_colors.tolist()):
+            cv2.line(frame, points[i], points[j], color, 1, cv2.LINE_AA)
 
         # Draw nodes
         for i, p in enumerate(points):
             if 0 <= p[0] < self.w and 0 <= p[1] < self.h:
-                color = tuple(int(c) for c in self.colors[i % 4])
+                color = self._c_int[i & 3]
                 cv2.circle(frame, p, 4, color, -1, cv2.LINE_AA)
 
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: Liquid Marble ──
     def liquid_marble(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 4
-        ny = self.y_grid / self.h * 4
-
-        val = (np.sin(nx * 2 + t) + np.sin(ny * 3 + t * 0.7) +
-               np.sin((nx + ny) * 1.5 + t * 1.3) +
-               np.sin(np.sqrt(nx**2 + ny**2) * 2 + t * 0.5)) / 4.0
-
-        val = (val + 1) / 2.0  # Normalize to 0-1
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (15, 15), 0)
-        return frame
+        xp = self.xp
+        nx = self._nx4_d
+        ny = self._ny4_d
+
+        # Accumulate the four sine layers in place: one scratch buffer and
+        # one accumulator instead of a fresh (H, W) temporary per operation
+        val = nx * 2
+        val += t
+        xp.sin(val, out=val)
+        tmp = ny * 3
+        tmp += t * 0.7
+        val += xp.sin(tmp, out=tmp)
+        xp.add(nx, ny, out=tmp)
+        tmp *= 1.5
+        tmp += t * 1.3
+        val += xp.sin(tmp, out=tmp)
+        xp.multiply(self._radial_d, 2, out=tmp)
+        tmp += t * 0.5
+        val += xp.sin(tmp, out=tmp)
+
+        # Normalize to 0-1 and scale onto the palette in the same buffer
+        val /= 4.0
+        val += 1
+        val /= 2.0
+        scaled = val
+        scaled *= 3.99
+        idx = xp.clip(scaled.astype(np.int32), 0, 3)
+        frac = xp.subtract(scaled, idx, dtype=np.float32)[..., np.newaxis]
+
+        c_pad = self._colors_padded_d
+        c1 = c_pad[idx]
+        c2 = c_pad[idx + 1]
+        return self._blur(self._to_frame_buf(c1 * (1 - frac) + c2 * frac), 15)
 
     # ── PATTERN: Neon Glow ──
     def neon_glow(self, t: float) -> np.ndarray:
@@ -884,54 +1700,57 @@ class AbstractVideoRenderer:
         # Dark base
         frame[:] = (10, 5, 20)
 
-        for i in range(6):
-            cx = self.w * (0.2 + 0.6 * math.sin(t * 0.3 + i * 1.2))
-            cy = self.h * (0.2 + 0.6 * math.cos(t * 0.4 + i * 0.8))
-            radius = int(self.w * 0.15 + self.w * 0.1 * math.sin(t + i))
+        # Blob centers and radii for all six blobs in one vectorized pass
+        blob = np.arange(6)
+        cxs = (self.w * (0.2 + 0.6 * np.sin(t * 0.3 + blob * 1.2))).astype(int).tolist()
+        cys = (self.h * (0.2 + 0.6 * np.cos(t * 0.4 + blob * 0.8))).astype(int).tolist()
+        radii = (self.w * 0.15 + self.w * 0.1 * np.sin(t + blob)).astype(int).tolist()
+
+        for i, (cx, cy, radius) in enumerate(zip(cxs, cys, radii)):
             color = self.colors[i % 4]
 
             overlay = np.zeros_like(frame, dtype=np.float32)
-            cv2.circle(overlay, (int(cx), int(cy)), radius, color, -1, cv2.LINE_AA)
-            overlay = cv2.GaussianBlur(overlay, (101, 101), 0)
-            frame = np.clip(frame.astype(np.float32) + overlay * 0.7, 0, 255).astype(np.uint8)
+            cv2.circle(overlay, (cx, cy), radius, color, -1, cv2.LINE_AA)
+            overlay = _box_gaussian(overlay, 101)
+            overlay *= 0.7
+            overlay += frame
+            frame = _to_u8(overlay)
 
         return frame
 
     # ── PATTERN: Bokeh Circles ──
     def bokeh_circles(self, t: float) -> np.ndarray:
-        frame = np.zeros((self.h, self.w, 3), dtype=np.float32)
-        # Gradient background
-        bg = self.y_grid / self.h
-        c1 = np.array(self.colors[0], dtype=np.float32) * 0.2
-        c2 = np.array(self.colors[1], dtype=np.float32) * 0.2
-        frame = c1[np.newaxis, np.newaxis, :] * (1 - bg[..., np.newaxis]) + \
-                c2[np.newaxis, np.newaxis, :] * bg[..., np.newaxis]
+        # Gradient background: one (H, 1, 3) column broadcast across the width
+        bg = self._ny_col[..., np.newaxis]
+        c1 = self._c_arr[0] * 0.2
+        c2 = self._c_arr[1] * 0.2
+        frame = np.empty((self.h, self.w, 3), dtype=np.float32)
+        frame[:] = c1 * (1 - bg) + c2 * bg
 
         np.random.seed(42)
         num_bokeh = 25
         positions = np.random.random((num_bokeh, 2))
         radii = np.random.randint(15, 60, num_bokeh)
 
-        for i in range(num_bokeh):
-            bx = int((positions[i, 0] * self.w + t * (20 + i * 3)) % self.w)
-            by = int((positions[i, 1] * self.h + math.sin(t * 0.5 + i) * 30) % self.h)
-            radius = int(radii[i])
-            alpha = 0.15 + 0.15 * math.sin(t * 2 + i)
-            color = self.colors[i % 4]
-
+        # Per-circle parameters in one vectorized pass; the loop only draws
+        i = np.arange(num_bokeh)
+        bxs = ((positions[:, 0] * self.w + t * (20 + i * 3)) % self.w).astype(np.int32)
+        bys = ((positions[:, 1] * self.h + np.sin(t * 0.5 + i) * 30) % self.h).astype(np.int32)
+        colors = self._c_arr[i & 3] * (0.15 + 0.15 * np.sin(t * 2 + i))[:, np.newaxis]
+        for bx, by, radius, color, inner_color in zip(bxs.tolist(), bys.tolist(), radii.tolist(),
+                                                      colors.tolist(), (colors * 0.3).tolist()):
             # Draw directly on float frame
-            cv2.circle(frame, (bx, by), radius, tuple(float(c) * alpha for c in color), 2, cv2.LINE_AA)
-            inner_color = tuple(float(c) * 0.3 * alpha for c in color)
+            cv2.circle(frame, (bx, by), radius, color, 2, cv2.LINE_AA)
             cv2.circle(frame, (bx, by), max(1, radius - 4), inner_color, -1, cv2.LINE_AA)
 
-        frame = cv2.GaussianBlur(frame, (11, 11), 0)
-        return np.clip(frame, 0, 255).astype(np.uint8)
+        frame = self._blur(frame, 11)
+        return _to_u8(frame)
 
     # ── PATTERN: Aurora Borealis (vectorized) ──
     def aurora_borealis(self, t: float) -> np.ndarray:
         # Dark sky base
         frame = np.zeros((self.h, self.w, 3), dtype=np.float32)
-        bg_val = self.y_grid / self.h * 20
+        bg_val = self._ny_norm * 20
         frame[:, :, 0] = bg_val
         frame[:, :, 1] = bg_val * 0.5
         frame[:, :, 2] = bg_val * 2
@@ -939,7 +1758,7 @@ class AbstractVideoRenderer:
         # Aurora curtains - vectorized along x
         x_range = np.arange(self.w, dtype=np.float32)
         for layer in range(4):
-            color = np.array(self.colors[layer], dtype=np.float32)
+            color = self._c_arr[layer]
             wave = np.sin(x_range * 0.01 + t * (0.5 + layer * 0.2) + layer) * 0.3
             wave += np.sin(x_range * 0.005 + t * 0.3 + layer * 2) * 0.2
             center_y = (self.h * (0.25 + wave)).astype(np.float32)  # (W,)
@@ -953,53 +1772,41 @@ class AbstractVideoRenderer:
 
             frame += alpha[..., np.newaxis] * color[np.newaxis, np.newaxis, :]
 
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (9, 9), 0)
+        frame = _to_u8(frame)
+        frame = self._blur(frame, 9)
         return frame
 
     # ── PATTERN: Smoke Plume ──
     def smoke_plume(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 5
-        ny = self.y_grid / self.h * 5
+        return self._render_half(AbstractVideoRenderer._smoke_plume_layer, t, 21)
+
+    def _smoke_plume_layer(self, t: float) -> np.ndarray:
+        nx, ny = self._scaled_norm(5)
+        nx_row = self._nx_row * 5
+        ny_col = self._ny_col * 5
 
         # Multiple noise layers simulating smoke
-        v1 = np.sin(nx * 1.5 + t * 0.8) * np.cos(ny * 2 - t * 0.5)
+        v1 = np.sin(nx_row * 1.5 + t * 0.8) * np.cos(ny_col * 2 - t * 0.5)
         v2 = np.sin(nx * 3 + ny * 2 + t * 1.2) * 0.5
         v3 = np.cos(nx * 0.5 + ny * 3 - t * 0.3) * 0.3
         val = (v1 + v2 + v3 + 1.5) / 3.0
         val = np.clip(val, 0, 1)
 
-        c_arr = np.array(self.colors, dtype=np.float32)
         scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (21, 21), 0)
-        return frame
+        return self._palette_lerp_u8(scaled)
 
     # ── PATTERN: Fractal Tunnel ──
     def fractal_tunnel(self, t: float) -> np.ndarray:
-        dx = self.x_grid - self.cx
-        dy = self.y_grid - self.cy
-        dist = np.sqrt(dx**2 + dy**2) + 1e-6
-        angle = np.arctan2(dy, dx)
+        dist_d = self._dist_d + 1e-6
 
         # Tunnel mapping
-        tunnel_val = (1.0 / dist * self.w * 2 + t * 50) % 1.0
-        spiral = (angle / (2 * math.pi) + t * 0.2 + tunnel_val * 0.5) % 1.0
-
-        scaled = spiral * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
+        tunnel_val = (1.0 / dist_d * self.w * 2 + t * 50) % 1.0
+        spiral = (self._angle_d / (2 * math.pi) + t * 0.2 + tunnel_val * 0.5) % 1.0
 
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
+        frame = self._palette_lerp_u8(spiral * 3.99)
 
         # Darken edges
+        dist = self._dist + 1e-6
         vignette = np.clip(dist / (max(self.w, self.h) * 0.5), 0, 1)
         vignette = (1 - vignette * 0.6)[..., np.newaxis]
         frame = (frame.astype(np.float32) * vignette).astype(np.uint8)
@@ -1008,22 +1815,20 @@ class AbstractVideoRenderer:
 
     # ── PATTERN: Wave Interference ──
     def wave_interference(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 8
-        ny = self.y_grid / self.h * 8
+        xp = self.xp
 
-        val = (np.sin(nx * 2 + t * 3) + np.sin(ny * 2 + t * 2) +
-               np.sin((nx + ny) + t * 1.5) + np.sin(np.sqrt(nx**2 + ny**2) * 3 + t * 2)) / 4.0
-        val = (val + 1) / 2.0
+        def band(rows):
+            nx = self._x_grid_d[rows] / self.w * 8
+            ny = self._y_grid_d[rows] / self.h * 8
+            nx_row = nx[:1]
+            ny_col = ny[:, :1]
 
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
+            val = (xp.sin(nx_row * 2 + t * 3) + xp.sin(ny_col * 2 + t * 2) +
+                   xp.sin((nx + ny) + t * 1.5) + xp.sin(xp.sqrt(nx**2 + ny**2) * 3 + t * 2)) / 4.0
+            val = (val + 1) / 2.0
+            return self._palette_lerp_u8(val * 3.99)
 
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-        return frame
+        return self._tiled(band)
 
     # ── PATTERN: Diamond Grid ──
     def diamond_grid(self, t: float) -> np.ndarray:
@@ -1038,168 +1843,153 @@ class AbstractVideoRenderer:
         # Color based on position
         grid_x = ((self.x_grid + offset) // size).astype(np.int32)
         grid_y = ((self.y_grid + offset * 0.7) // size).astype(np.int32)
-        color_idx = (grid_x + grid_y) % 4
-
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[color_idx % 4]
-        c2 = c_arr[(color_idx + 1) % 4]
-        frame = (c1 * (1 - diamond[..., np.newaxis]) + c2 * diamond[..., np.newaxis]).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        # Power-of-two wrap as a bitmask (also right for negative indices)
+        color_idx = (grid_x + grid_y) & 3
+
+        c1, c2 = self._gather_pair(color_idx)
+        c1 *= (1 - diamond)[..., np.newaxis]
+        c2 *= diamond[..., np.newaxis]
+        frame = np.add(c1, c2, out=c1).astype(np.uint8)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: Plasma Field ──
     def plasma_field(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 6
-        ny = self.y_grid / self.h * 6
+        xp = self.xp
 
-        v1 = np.sin(nx + t)
-        v2 = np.sin(ny + t * 0.7)
-        v3 = np.sin(nx + ny + t * 1.3)
-        v4 = np.sin(np.sqrt((nx - 3)**2 + (ny - 3)**2) + t)
+        def band(rows):
+            nx = self._x_grid_d[rows] / self.w * 6
+            ny = self._y_grid_d[rows] / self.h * 6
+            nx_row = nx[:1]
+            ny_col = ny[:, :1]
 
-        val = (v1 + v2 + v3 + v4) / 4.0
-        val = (val + 1) / 2.0
+            v1 = xp.sin(nx_row + t)
+            v2 = xp.sin(ny_col + t * 0.7)
+            v3 = xp.sin(nx + ny + t * 1.3)
+            v4 = xp.sin(xp.sqrt((nx - 3)**2 + (ny - 3)**2) + t)
 
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
+            val = (v1 + v2 + v3 + v4) / 4.0
+            val = (val + 1) / 2.0
+            return self._palette_lerp_u8(val * 3.99)
 
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-        return frame
+        return self._tiled(band)
 
     # ── PATTERN: Spiral Vortex ──
     def spiral_vortex(self, t: float) -> np.ndarray:
-        dx = self.x_grid - self.cx
-        dy = self.y_grid - self.cy
-        dist = np.sqrt(dx**2 + dy**2)
-        angle = np.arctan2(dy, dx)
-
-        spiral = (angle + dist * 0.02 - t * 2) / (2 * math.pi) % 1.0
+        spiral = (self._angle_d + self._dist_d * 0.02 - t * 2) / (2 * math.pi) % 1.0
 
-        scaled = spiral * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
+        frame = self._palette_lerp_u8(spiral * 3.99)
 
         # Center glow
+        dist = self._dist
         glow = np.exp(-dist**2 / (self.w * 100))
-        frame = np.clip(frame.astype(np.float32) + glow[..., np.newaxis] * 60, 0, 255).astype(np.uint8)
+        glow *= 60
+        boosted = frame.astype(np.float32)
+        boosted += glow[..., np.newaxis]
+        frame = _to_u8(boosted)
         return frame
 
     # ── PATTERN: Stripe Cascade ──
     def stripe_cascade(self, t: float) -> np.ndarray:
         stripe_w = 60
         diag = (self.x_grid * 0.7 + self.y_grid * 0.7 + t * 100)
-        stripe_idx = (diag / stripe_w).astype(np.int32) % 4
+        stripe_idx = (diag / stripe_w).astype(np.int32) & 3
         frac = (diag / stripe_w) % 1.0
 
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[stripe_idx % 4]
-        c2 = c_arr[(stripe_idx + 1) % 4]
+        c1, c2 = self._gather_pair(stripe_idx)
 
         # Smooth stripe edges
         edge = np.clip(frac * 5, 0, 1)
         edge = np.where(frac > 0.8, np.clip((1 - frac) * 5, 0, 1), edge)[..., np.newaxis]
 
-        frame = (c1 * edge + c2 * (1 - edge)).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        c1 *= edge
+        c2 *= 1 - edge
+        frame = np.add(c1, c2, out=c1).astype(np.uint8)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: Dot Matrix ──
     def dot_matrix(self, t: float) -> np.ndarray:
         frame = np.zeros((self.h, self.w, 3), dtype=np.uint8)
-        frame[:] = (np.array(self.colors[0]) * 0.1).astype(np.uint8)
+        frame[:] = (self._c_arr[0] * 0.1).astype(np.uint8)
 
         spacing = 30
         max_radius = spacing // 2 - 2
 
-        for gy in range(0, self.h + spacing, spacing):
-            for gx in range(0, self.w + spacing, spacing):
-                px = gx + int(math.sin(t + gy * 0.05) * 5)
-                py = gy + int(math.cos(t + gx * 0.05) * 5)
-                cx_d = abs(px - self.cx) / self.cx
-                cy_d = abs(py - self.cy) / self.cy
-                dist_factor = 1 - math.sqrt(cx_d**2 + cy_d**2) * 0.5
-                pulse = 0.5 + 0.5 * math.sin(t * 3 + gx * 0.02 + gy * 0.02)
-                radius = int(max_radius * dist_factor * pulse)
-                radius = max(2, min(max_radius, radius))
-
-                color_idx = (gx // spacing + gy // spacing) % 4
-                color = tuple(int(c) for c in self.colors[color_idx])
-                if 0 <= px < self.w and 0 <= py < self.h:
-                    cv2.circle(frame, (px, py), radius, color, -1, cv2.LINE_AA)
-
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        # Whole dot lattice at once; only the visible dots reach cv2.circle
+        gy, gx = np.mgrid[0:self.h + spacing:spacing, 0:self.w + spacing:spacing]
+        px = gx + (np.sin(t + gy * 0.05) * 5).astype(np.int32)
+        py = gy + (np.cos(t + gx * 0.05) * 5).astype(np.int32)
+        cx_d = np.abs(px - self.cx) / self.cx
+        cy_d = np.abs(py - self.cy) / self.cy
+        dist_factor = 1 - np.sqrt(cx_d**2 + cy_d**2) * 0.5
+        pulse = 0.5 + 0.5 * np.sin(t * 3 + gx * 0.02 + gy * 0.02)
+        radius = (max_radius * dist_factor * pulse).astype(np.int32)
+        np.clip(radius, 2, max_radius, out=radius)
+        color_idx = (gx // spacing + gy // spacing) & 3
+
+        visible = (px >= 0) & (px < self.w) & (py >= 0) & (py < self.h)
+        colors = self._c_int
+        for x, y, r, ci in zip(px[visible].tolist(), py[visible].tolist(),
+                               radius[visible].tolist(), color_idx[visible].tolist()):
+            cv2.circle(frame, (x, y), r, colors[ci], -1, cv2.LINE_AA)
+
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: Nebula Cloud ──
     def nebula_cloud(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 3
-        ny = self.y_grid / self.h * 3
+        nx, ny = self._scaled_norm(3)
+        nx_row = self._nx_row * 3
+        ny_col = self._ny_col * 3
         # Multiple noise octaves for cloud-like structure
-        v1 = np.sin(nx * 1.5 + t * 0.3) * np.cos(ny * 2.0 - t * 0.2) * 0.5
+        v1 = np.sin(nx_row * 1.5 + t * 0.3) * np.cos(ny_col * 2.0 - t * 0.2) * 0.5
         v2 = np.sin(nx * 3.0 + ny * 1.5 + t * 0.5) * 0.3
-        v3 = np.cos(np.sqrt((nx - 1.5)**2 + (ny - 1.5)**2) * 2 + t * 0.4) * 0.4
-        v4 = np.sin(nx * 5 + t) * np.sin(ny * 5 - t * 0.7) * 0.15
+        v3 = np.cos(_distance_field(nx_row, ny_col, 1.5, 1.5) * 2 + t * 0.4) * 0.4
+        v4 = np.sin(nx_row * 5 + t) * np.sin(ny_col * 5 - t * 0.7) * 0.15
         val = (v1 + v2 + v3 + v4 + 1) / 2.0
         val = np.clip(val, 0, 1)
         # Dark space background with nebula colors
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
         # Darken edges for space look
-        dist = np.sqrt((self.x_grid - self.cx)**2 + (self.y_grid - self.cy)**2)
-        vignette = 1 - np.clip(dist / max(self.w, self.h) * 0.8, 0, 0.6)
-        frame = (frame * vignette[..., np.newaxis]).astype(np.uint8)
-        # Add subtle stars
-        np.random.seed(42)
-        star_mask = np.random.random((self.h, self.w)) > 0.9997
-        twinkle = (0.5 + 0.5 * np.sin(t * 5 + np.random.random((self.h, self.w)) * 10))
-        frame[star_mask] = np.clip(frame[star_mask].astype(np.float32) + 200 * twinkle[star_mask, np.newaxis], 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        vignette = 1 - np.clip(self._dist_norm * 0.8, 0, 0.6)
+        frame = self._palette_shade_u8(val * 3.99, gain=vignette)
+        # Add subtle stars. The seeded draws are identical every frame, so the
+        # few hundred star pixels and their twinkle phases are picked once
+        if self._nebula_stars is None:
+            rng = np.random.RandomState(42)
+            star_mask = rng.random_sample((self.h, self.w)) > 0.9997
+            phase = rng.random_sample((self.h, self.w))[star_mask] * 10
+            self._nebula_stars = (np.nonzero(star_mask), phase)
+        (sy, sx), phase = self._nebula_stars
+        twinkle = 0.5 + 0.5 * np.sin(t * 5 + phase)
+        frame[sy, sx] = np.clip(frame[sy, sx].astype(np.float32) + 200 * twinkle[:, np.newaxis], 0, 255).astype(np.uint8)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: Kaleidoscope ──
     def kaleidoscope(self, t: float) -> np.ndarray:
-        dx = self.x_grid - self.cx
-        dy = self.y_grid - self.cy
-        angle = np.arctan2(dy, dx)
-        dist = np.sqrt(dx**2 + dy**2)
+        xp = self.xp
+        angle = self._angle_d
+        dist = self._dist_d
         # Create kaleidoscope symmetry (6 segments)
         segments = 6
-        mirror_angle = np.abs(((angle + t * 0.5) % (2 * math.pi / segments)) - math.pi / segments)
+        mirror_angle = xp.abs(((angle + t * 0.5) % (2 * math.pi / segments)) - math.pi / segments)
         # Map to color
-        val1 = np.sin(mirror_angle * segments + dist * 0.015 - t * 2) * 0.5 + 0.5
-        val2 = np.cos(dist * 0.02 + t * 1.5) * 0.5 + 0.5
+        val1 = xp.sin(mirror_angle * segments + dist * 0.015 - t * 2) * 0.5 + 0.5
+        val2 = xp.cos(dist * 0.02 + t * 1.5) * 0.5 + 0.5
         val = (val1 + val2) / 2.0
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        frame = self._palette_lerp_u8(val * 3.99)
+        frame = self._blur(frame, 7)
         return frame
 
     # ── PATTERN: Fluid Ink ──
     def fluid_ink(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 4
-        ny = self.y_grid / self.h * 4
+        nx, ny = self._scaled_norm(4)
+        nx_row = self._nx_row * 4
+        ny_col = self._ny_col * 4
         # Turbulent flow simulation
-        u = np.sin(ny * 2 + t * 0.8) * np.cos(nx * 1.5 + t * 0.3)
-        v = np.cos(nx * 2 - t * 0.6) * np.sin(ny * 1.5 + t * 0.5)
+        u = np.sin(ny_col * 2 + t * 0.8) * np.cos(nx_row * 1.5 + t * 0.3)
+        v = np.cos(nx_row * 2 - t * 0.6) * np.sin(ny_col * 1.5 + t * 0.5)
         distorted_x = nx + u * 0.5
         distorted_y = ny + v * 0.5
         val = (np.sin(distorted_x * 3 + t) + np.cos(distorted_y * 3 + t * 0.7) +
@@ -1207,42 +1997,52 @@ class AbstractVideoRenderer:
         val = (val + 1) / 2.0
         # Create ink-like contrast
         val = np.clip(val * 1.3 - 0.15, 0, 1)
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (9, 9), 0)
+        frame = self._palette_lerp_u8(val * 3.99)
+        frame = self._blur(frame, 9)
         return frame
 
     # ── PATTERN: Electric Storm ──
     def electric_storm(self, t: float) -> np.ndarray:
-        frame = np.zeros((self.h, self.w, 3), dtype=np.float32)
-        frame[:] = np.array(self.colors[0], dtype=np.float32) * 0.06
-        dx = self.x_grid - self.cx
-        dy = self.y_grid - self.cy
-        dist = np.sqrt(dx**2 + dy**2) / max(self.w, self.h)
-        angle = np.arctan2(dy, dx)
+        dist = self._dist_norm
+        angle = self._angle
+        # Per-palette-color weight planes; every layer below only adds to
+        # these (H, W) planes and they are mixed into RGB once at the end
+        weights = [np.zeros((self.h, self.w), dtype=np.float32) for _ in range(4)]
+        # Electric arcs — sharp, contained bolts. Angles and pulse amplitudes
+        # for all 8 arcs come from one vector expression; each arc is then
+        # built in a single scratch plane, and the shared distance falloff is
+        # applied once per weight plane instead of once per arc.
+        arc_i = np.arange(8)
+        arc_angles = (arc_i * math.pi / 4 + t * 0.3 + np.sin(t * 2 + arc_i) * 0.5).astype(np.float32)
+        arc_amps = (0.5 + 0.5 * np.sin(t * 8 + arc_i * 2)).astype(np.float32)
+        arc = np.empty((self.h, self.w), dtype=np.float32)
+        wrap = np.empty((self.h, self.w), dtype=np.float32)
+        for i in range(8):
+            np.subtract(angle, arc_angles[i], out=arc)
+            np.abs(arc, out=arc)
+            np.subtract(np.float32(2 * math.pi), arc, out=wrap)
+            np.minimum(arc, wrap, out=arc)
+            # Sharper falloff, stronger distance decay
+            arc *= np.float32(-25)
+            np.exp(arc, out=arc)
+            arc *= arc_amps[i]
+            weights[i & 3] += arc
+        arc_falloff = np.exp(-dist * 4) * 0.7
+        for w in weights:
+            w *= arc_falloff
         # Pulsating energy field (subtle background)
         energy = np.sin(dist * 20 - t * 4) * np.cos(angle * 3 + t * 2) * 0.5 + 0.5
         energy *= np.exp(-dist * 3)
-        frame += energy[..., np.newaxis] * np.array(self.colors[1], dtype=np.float32) * 0.15
-        # Electric arcs — sharp, contained bolts
-        for i in range(8):
-            arc_angle = i * math.pi / 4 + t * 0.3 + math.sin(t * 2 + i) * 0.5
-            arc_dist = np.abs(angle - arc_angle)
-            arc_dist = np.minimum(arc_dist, 2 * math.pi - arc_dist)
-            # Sharper falloff, stronger distance decay
-            arc = np.exp(-arc_dist * 25) * np.exp(-dist * 4) * (0.5 + 0.5 * np.sin(t * 8 + i * 2))
-            color = np.array(self.colors[i % 4], dtype=np.float32)
-            frame += arc[..., np.newaxis] * color[np.newaxis, np.newaxis, :] * 0.7
+        weights[1] += energy * 0.15
         # Subtle central glow
-        glow = np.exp(-dist * 8) * (0.3 + 0.2 * np.sin(t * 3))
-        frame += glow[..., np.newaxis] * np.array(self.colors[2], dtype=np.float32) * 0.3
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        glow = np.exp(-dist * 8) * (0.3 + 0.2 * math.sin(t * 3))
+        weights[2] += glow * 0.3
+        frame = cv2.merge(weights) @ self._c_arr
+        frame += self._c_arr[0] * 0.06
+        # Arcs can overflow far past 255 (and int32) right at the center, so
+        # this one keeps the NumPy clip instead of cv2.convertScaleAbs
+        frame = np.clip(frame, 0, 255, out=frame).astype(np.uint8)
+        frame = self._blur(frame, 7)
         return frame
 
     # ── PATTERN: Ripple Pond ──
@@ -1256,24 +2056,19 @@ class AbstractVideoRenderer:
             (self.w * 0.6, self.h * 0.2, 4.5),
         ]
         for sx, sy, phase in sources:
-            d = np.sqrt((self.x_grid - sx)**2 + (self.y_grid - sy)**2)
+            d = _distance_field(self.x_grid[:1], self.y_grid[:, :1], sx, sy)
             ripple = np.sin(d * 0.05 - t * 4 + phase) * np.exp(-d * 0.003)
             val += ripple
         val = (val / 4 + 1) / 2.0
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        frame = self._palette_lerp_u8(val * 3.99)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: Morphing Blobs ──
     def morphing_blobs(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
+        return self._render_half(AbstractVideoRenderer._morphing_blobs_layer, t, 15)
+
+    def _morphing_blobs_layer(self, t: float) -> np.ndarray:
         # Metaball-like field function
         field = np.zeros((self.h, self.w), dtype=np.float32)
         blob_positions = [
@@ -1284,80 +2079,68 @@ class AbstractVideoRenderer:
             (0.6 + 0.1 * math.sin(t * 0.9), 0.6 + 0.1 * math.cos(t * 0.3), 0.09),
         ]
         for bx, by, radius in blob_positions:
-            d = np.sqrt((nx - bx)**2 + (ny - by)**2)
+            d = _distance_field(self._nx_row, self._ny_col, bx, by)
             field += radius / (d + 0.01)
         # Threshold and smooth
         val = np.clip((field - 2.0) * 0.5, 0, 1)
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        bg = np.array(self.colors[0], dtype=np.float32) * 0.1
+        bg = self._c_arr[0] * 0.1
         frame = np.where(val[..., np.newaxis] > 0.01,
-                         (c1 * (1 - frac) + c2 * frac),
+                         self._palette_lerp(val * 3.99),
                          bg[np.newaxis, np.newaxis, :])
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (15, 15), 0)
-        return frame
+        return _to_u8(frame)
 
     # ── PATTERN: Holographic ──
     def holographic(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-        # Iridescent color shifting based on angle and position
-        angle = np.arctan2(ny - 0.5, nx - 0.5)
-        dist = np.sqrt((nx - 0.5)**2 + (ny - 0.5)**2)
+        nx = self._nx_norm
+        ny = self._ny_norm
+        nx_row = self._nx_row
+        ny_col = self._ny_col
+        # Iridescent color shifting based on angle and position. The angle
+        # only feeds hue mod 1, so cv2.phase's [0, 2pi) range is as good
+        if self._holo_angle is None:
+            self._holo_angle = cv2.phase(nx - 0.5, ny - 0.5)
+        angle = self._holo_angle
+        dist = _distance_field(nx_row, ny_col, 0.5, 0.5)
         # Rainbow hue shift
         hue = (angle / (2 * math.pi) + dist * 2 + t * 0.3) % 1.0
         # Convert HSV-like to color index with smooth shifting
         val = (np.sin(hue * 2 * math.pi + t) * 0.3 +
                np.sin(dist * 15 - t * 3) * 0.2 +
-               np.cos(nx * 10 + t * 2) * 0.15 + 0.5)
+               np.cos(nx_row * 10 + t * 2) * 0.15 + 0.5)
         val = np.clip(val, 0, 1)
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
+        frame = self._palette_lerp(val * 3.99)
         # Add shimmer
-        shimmer = (np.sin(nx * 40 + t * 5) * np.sin(ny * 40 - t * 3) * 30)
-        frame = np.clip(frame + shimmer[..., np.newaxis], 0, 255).astype(np.uint8)
+        shimmer = (np.sin(nx_row * 40 + t * 5) * np.sin(ny_col * 40 - t * 3) * 30)
+        frame += shimmer[..., np.newaxis]
+        # Signed, so this keeps the NumPy clip rather than _to_u8
+        frame = np.clip(frame, 0, 255, out=frame).astype(np.uint8)
         return frame
 
     # ── PATTERN: Topographic ──
     def topographic(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 5
-        ny = self.y_grid / self.h * 5
+        nx, ny = self._scaled_norm(5)
+        nx_row = self._nx_row * 5
+        ny_col = self._ny_col * 5
         # Elevation map
-        elev = (np.sin(nx + t * 0.3) * np.cos(ny * 0.8 + t * 0.2) +
+        elev = (np.sin(nx_row + t * 0.3) * np.cos(ny_col * 0.8 + t * 0.2) +
                 np.sin(nx * 2 + ny + t * 0.5) * 0.5 +
-                np.cos(np.sqrt((nx - 2.5)**2 + (ny - 2.5)**2) + t * 0.4) * 0.3)
+                np.cos(_distance_field(nx_row, ny_col, 2.5, 2.5) + t * 0.4) * 0.3)
         elev = (elev + 2) / 4.0
         num_contours = 15
         contour_val = (elev * num_contours) % 1.0
         edge = np.abs(contour_val - 0.5) < 0.05
-        scaled = elev * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac) * 0.6
+        frame = self._palette_lerp(elev * 3.99) * 0.6
         frame[edge] = np.clip(frame[edge] * 2.5 + 40, 0, 255)
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        frame = _to_u8(frame)
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: Hexagon Grid ──
     def hexagon_grid(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 8
-        ny = self.y_grid / self.h * 8
-        # Offset every other row for honeycomb
-        offset = np.where((ny.astype(int) % 2) == 0, 0.5, 0.0)
+        nx, ny = self._scaled_norm(8)
+        nx_row = self._nx_row * 8
+        # Offset every other row for honeycomb; depends on y only
+        offset = np.where((ny[:, :1].astype(int) % 2) == 0, np.float32(0.5), np.float32(0.0))
         hx = (nx + offset) % 1.0
         hy = ny % 1.0
         # Distance to hex center
@@ -1369,116 +2152,123 @@ class AbstractVideoRenderer:
         pulse = (np.sin(nx * 2 + ny * 2 + t * 2) * 0.5 + 0.5) * edge
         # Color mapping
         val = pulse * 0.7 + (1 - edge) * 0.3
-        val = np.clip(val + np.sin(t + nx) * 0.1, 0, 1)
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        val = np.clip(val + np.sin(t + nx_row) * 0.1, 0, 1)
+        frame = self._palette_lerp_u8(val * 3.99)
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: Matrix Rain ──
     def matrix_rain(self, t: float) -> np.ndarray:
         frame = np.zeros((self.h, self.w, 3), dtype=np.float32)
         # Dark background with subtle color
-        frame[:] = np.array(self.colors[0], dtype=np.float32) * 0.03
-        np.random.seed(99)
+        frame[:] = self._c_arr[0] * 0.03
         n_columns = self.w // 12
-        for i in range(n_columns):
-            x = int((i + 0.5) * 12)
-            speed = 40 + np.random.random() * 80
-            col_offset = np.random.random() * 500
-            # Rain drop position
-            head_y = (t * speed + col_offset) % (self.h + 200) - 100
-            trail_len = 80 + int(np.random.random() * 120)
-            color = np.array(self.colors[i % 4], dtype=np.float32)
-            for j in range(trail_len):
-                py = int(head_y - j * 4)
-                if 0 <= py < self.h and 0 <= x < self.w:
-                    fade = 1.0 - (j / trail_len)
-                    bright = fade * fade * (0.3 + 0.7 * (j == 0))
-                    for dx_off in range(min(8, self.w - x)):
-                        frame[py, x + dx_off] = np.clip(
-                            frame[py, x + dx_off] + color * bright, 0, 255)
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        # speed, col_offset and trail_len draws, in the same order per column
+        rnd = self._seeded_random(99, (n_columns, 3))
+        col = np.arange(n_columns)
+        x = ((col + 0.5) * 12).astype(np.int64)
+        speed = 40 + rnd[:, 0] * 80
+        # Rain drop position
+        head_y = (t * speed + rnd[:, 1] * 500) % (self.h + 200) - 100
+        trail_len = 80 + (rnd[:, 2] * 120).astype(np.int64)
+        # Flatten every (column, trail step) pair into one batch
+        owner = np.repeat(col, trail_len)
+        j = np.arange(owner.size) - np.repeat(np.cumsum(trail_len) - trail_len, trail_len)
+        py = (head_y[owner] - j * 4).astype(np.int64)
+        keep = (py >= 0) & (py < self.h)
+        owner, j, py = owner[keep], j[keep], py[keep]
+        fade = 1.0 - j / trail_len[owner]
+        bright = fade * fade * np.where(j == 0, 1.0, 0.3)
+        drops = self._c_arr[owner & 3] * bright[:, np.newaxis].astype(np.float32)
+        # Each drop is 8 px wide; columns are 12 px apart and trail steps
+        # 4 px apart, so no pixel is written twice and plain += is safe
+        for dx_off in range(8):
+            px = x[owner] + dx_off
+            inside = px < self.w
+            frame[py[inside], px[inside]] += drops[inside]
+        frame = _to_u8(frame)
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: Voronoi Cells ──
     def voronoi_cells(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
         # Moving seed points
-        np.random.seed(55)
         n_seeds = 20
-        seed_x = np.random.random(n_seeds)
-        seed_y = np.random.random(n_seeds)
+        seed_x, seed_y = self._seeded_random(55, (2, n_seeds))
         # Animate seeds
         sx = seed_x + 0.05 * np.sin(t * 0.5 + np.arange(n_seeds) * 0.7)
         sy = seed_y + 0.05 * np.cos(t * 0.4 + np.arange(n_seeds) * 0.9)
-        # Find closest and second-closest seed for each pixel
-        min_dist = np.full((self.h, self.w), 999.0, dtype=np.float32)
-        min_idx = np.zeros((self.h, self.w), dtype=np.int32)
-        second_dist = np.full((self.h, self.w), 999.0, dtype=np.float32)
-        for i in range(n_seeds):
-            d = np.sqrt((nx - sx[i])**2 + (ny - sy[i])**2)
-            mask = d < min_dist
-            second_dist = np.where(mask, min_dist, np.where(d < second_dist, d, second_dist))
-            min_idx = np.where(mask, i, min_idx)
-            min_dist = np.where(mask, d, min_dist)
-        # Edge detection (difference between closest and second-closest)
-        edge = np.clip((second_dist - min_dist) * 15, 0, 1)
-        # Color by cell index
-        cell_val = (min_idx / n_seeds + t * 0.1) % 1.0
-        scaled = cell_val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac) * edge[..., np.newaxis] * 0.8
-        # Bright edges
-        border = np.clip(1 - edge, 0, 1) * 0.3
-        frame += border[..., np.newaxis] * 255
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        # Find closest and second-closest seed for each pixel. Squared
+        # distances split into an x-only row plus a y-only column, so each
+        # seed costs one broadcast add and a few in-place passes; the sqrt is
+        # taken once at the end.
+        dx2 = np.square(self._nx_row - sx[:, np.newaxis, np.newaxis], dtype=np.float32)
+        dy2 = np.square(self._ny_col - sy[:, np.newaxis, np.newaxis], dtype=np.float32)
+
+        def band(rows):
+            shape = (len(range(self.h)[rows]), self.w)
+            min_dist = np.full(shape, 999.0, dtype=np.float32)
+            min_idx = np.zeros(shape, dtype=np.int32)
+            second_dist = np.full(shape, 999.0, dtype=np.float32)
+            d = np.empty(shape, dtype=np.float32)
+            tmp = np.empty(shape, dtype=np.float32)
+            mask = np.empty(shape, dtype=bool)
+            for i in range(n_seeds):
+                np.add(dx2[i], dy2[i, rows], out=d)
+                np.less(d, min_dist, out=mask)
+                np.maximum(min_dist, d, out=tmp)
+                np.minimum(second_dist, tmp, out=second_dist)
+                np.copyto(min_idx, i, where=mask)
+                np.minimum(min_dist, d, out=min_dist)
+            np.sqrt(min_dist, out=min_dist)
+            np.sqrt(second_dist, out=second_dist)
+            # Edge detection (difference between closest and second-closest)
+            edge = np.clip((second_dist - min_dist) * 15, 0, 1)
+            # Color by cell index
+            cell_val = (np.divide(min_idx, n_seeds, dtype=np.float32) + t * 0.1) % 1.0
+            scaled = cell_val * 3.99
+            frame = self._palette_lerp(scaled) * edge[..., np.newaxis] * 0.8
+            # Bright edges
+            border = np.clip(1 - edge, 0, 1) * 0.3
+            frame += border[..., np.newaxis] * 255
+            return _to_u8(frame)
+
+        frame = self._tiled(band)
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: Fiber Optic ──
     def fiber_optic(self, t: float) -> np.ndarray:
         frame = np.zeros((self.h, self.w, 3), dtype=np.float32)
-        frame[:] = np.array(self.colors[0], dtype=np.float32) * 0.05
+        frame[:] = self._c_arr[0] * 0.05
         n_fibers = 30
-        np.random.seed(33)
-        for i in range(n_fibers):
-            # Each fiber is a curved line
-            phase = np.random.random() * 10
-            amp = 0.1 + np.random.random() * 0.3
-            freq = 1.5 + np.random.random() * 2
-            base_x = np.random.random()
-            color = np.array(self.colors[i % 4], dtype=np.float32)
-            bright = 0.4 + 0.6 * (0.5 + 0.5 * math.sin(t * 2 + phase))
-            # Sample points along the fiber
-            for y_frac in np.linspace(0, 1, 80):
-                x_frac = base_x + amp * math.sin(y_frac * freq * math.pi + t * 1.5 + phase)
-                px = int(x_frac * self.w) % self.w
-                py = int(y_frac * self.h)
-                if 0 <= py < self.h and 0 <= px < self.w:
-                    r = max(1, int(3 * bright))
-                    cv2.circle(frame, (px, py), r, (float(color[0]*bright), float(color[1]*bright), float(color[2]*bright)), -1, cv2.LINE_AA)
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        # Same draw order as one phase/amp/freq/base_x quadruple per fiber
+        phase, amp, freq, base_x = self._seeded_random(33, (n_fibers, 4)).T
+        phase = phase * 10
+        amp = 0.1 + amp * 0.3
+        freq = 1.5 + freq * 2
+        bright = 0.4 + 0.6 * (0.5 + 0.5 * np.sin(t * 2 + phase))
+        colors = self._c_arr[np.arange(n_fibers) & 3] * bright[:, np.newaxis]
+        radii = np.maximum(1, (3 * bright).astype(np.int32))
+        # Sample points along every fiber at once: (n_fibers, 80)
+        y_frac = np.linspace(0, 1, 80)
+        x_frac = base_x[:, np.newaxis] + amp[:, np.newaxis] * np.sin(
+            y_frac * freq[:, np.newaxis] * math.pi + t * 1.5 + phase[:, np.newaxis])
+        pxs = (x_frac * self.w).astype(np.int64) % self.w
+        pys = (y_frac * self.h).astype(np.int64)
+        # Only y_frac == 1 falls off the bottom edge
+        pys = pys[pys < self.h]
+        for fiber_px, r, color in zip(pxs.tolist(), radii.tolist(), colors.tolist()):
+            for px, py in zip(fiber_px, pys.tolist()):
+                cv2.circle(frame, (px, py), r, color, -1, cv2.LINE_AA)
+        frame = _to_u8(frame)
+        frame = self._blur(frame, 7)
         return frame
 
     # ── PATTERN: Color Explosion ──
     def color_explosion(self, t: float) -> np.ndarray:
-        dx = (self.x_grid - self.cx) / max(self.w, self.h)
-        dy = (self.y_grid - self.cy) / max(self.w, self.h)
-        dist = np.sqrt(dx**2 + dy**2)
-        angle = np.arctan2(dy, dx)
+        dist = self._dist_norm
+        angle = self._angle
         # Radial burst with multiple color bands
         burst = np.sin(dist * 25 - t * 4) * 0.3
         rays = np.sin(angle * 8 + t * 1.5) * 0.2
@@ -1488,24 +2278,19 @@ class AbstractVideoRenderer:
         # Full saturation color mapping — 4 colors cycled densely
         scaled = (val * 8 + t * 0.3) % 4
         scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
+        frame = self._palette_lerp(scaled)
         # Brighten everything — no dark areas
-        frame = frame * 0.85 + 30
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        frame = cv2.convertScaleAbs(frame, alpha=0.85, beta=30)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: Tie Dye ──
     def tie_dye(self, t: float) -> np.ndarray:
-        dx = (self.x_grid - self.cx) / max(self.w, self.h)
-        dy = (self.y_grid - self.cy) / max(self.w, self.h)
-        dist = np.sqrt(dx**2 + dy**2)
-        angle = np.arctan2(dy, dx)
+        return self._render_half(AbstractVideoRenderer._tie_dye_layer, t, 21)
+
+    def _tie_dye_layer(self, t: float) -> np.ndarray:
+        dist = self._dist_norm
+        angle = self._angle
         # Gentle spiral — fewer turns for smoother look
         spiral = angle + dist * 8 - t * 0.8
         # Multiple soft sine layers blended together
@@ -1517,23 +2302,13 @@ class AbstractVideoRenderer:
         # Smooth color mapping with gentle cycling
         scaled = (val * 3 + t * 0.15) % 4
         scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
         # Smooth the fraction for softer transitions
-        frac = frac * frac * (3 - 2 * frac)  # smoothstep
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
-        frame = frame * 0.9 + 20
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (21, 21), 0)
-        return frame
+        frame = self._palette_lerp(scaled, smoothstep=True)
+        return cv2.convertScaleAbs(frame, alpha=0.9, beta=20)
 
     # ── PATTERN: Oil Slick ──
     def oil_slick(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 6
-        ny = self.y_grid / self.h * 6
+        nx, ny = self._scaled_norm(6)
         # Thin-film interference simulation
         film1 = np.sin(nx * 2 + ny * 1.5 + t * 0.5) * 0.5 + 0.5
         film2 = np.sin(nx * 3 - ny * 2 + t * 0.7) * 0.5 + 0.5
@@ -1542,46 +2317,49 @@ class AbstractVideoRenderer:
         r = (film1 * 0.5 + film2 * 0.3 + 0.2)
         g = (film2 * 0.5 + film3 * 0.3 + 0.2)
         b = (film3 * 0.5 + film1 * 0.3 + 0.2)
-        # Map through palette colors
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = (c_arr[0] * r[..., np.newaxis] +
-                 c_arr[1] * g[..., np.newaxis] +
-                 c_arr[2] * b[..., np.newaxis] +
-                 c_arr[3][np.newaxis, np.newaxis, :] * 0.15)
         # Iridescent shimmer
         shimmer = np.sin(nx * 15 + ny * 10 + t * 3) * 20
-        frame += shimmer[..., np.newaxis]
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        # Map through palette colors one channel plane at a time. The shimmer
+        # can push dark pixels below zero, so each plane is clipped in place
+        # rather than going through _to_u8.
+        c_arr = self._c_arr
+        planes = []
+        for ch in range(3):
+            plane = r * c_arr[0, ch]
+            plane += g * c_arr[1, ch]
+            plane += b * c_arr[2, ch]
+            plane += c_arr[3, ch] * 0.15
+            plane += shimmer
+            np.clip(plane, 0, 255, out=plane)
+            planes.append(plane.astype(np.uint8))
+        frame = cv2.merge(planes)
+        frame = self._blur(frame, 7)
         return frame
 
     # ── PATTERN: Prismatic Waves ──
     def prismatic_waves(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
+        nx = self._nx_norm
+        ny = self._ny_norm
         # Multiple flowing wave layers
         w1 = np.sin(nx * 6 + t * 1.2 + ny * 2) * 0.5 + 0.5
         w2 = np.sin(ny * 8 - t * 0.8 + nx * 3) * 0.5 + 0.5
         w3 = np.cos((nx + ny) * 5 + t * 1.5) * 0.5 + 0.5
         w4 = np.sin(nx * 4 - ny * 3 + t * 0.6) * 0.5 + 0.5
         # Blend into full-color spectrum
-        c_arr = np.array(self.colors, dtype=np.float32)
+        c_arr = self._c_arr
         frame = (c_arr[0] * w1[..., np.newaxis] +
                  c_arr[1] * w2[..., np.newaxis] +
                  c_arr[2] * w3[..., np.newaxis] +
                  c_arr[3] * w4[..., np.newaxis])
         # Normalize to prevent darkness
-        frame = frame * 0.55 + 30
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        frame = cv2.convertScaleAbs(frame, alpha=0.55, beta=30)
+        frame = self._blur(frame, 7)
         return frame
 
     # ── PATTERN: Gradient Mesh ──
     def gradient_mesh(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
         # Multiple overlapping radial gradients with animated centers
-        c_arr = np.array(self.colors, dtype=np.float32)
+        c_arr = self._c_arr
         frame = np.zeros((self.h, self.w, 3), dtype=np.float32)
         centers = [
             (0.25 + 0.15 * math.sin(t * 0.4), 0.25 + 0.15 * math.cos(t * 0.3)),
@@ -1590,125 +2368,126 @@ class AbstractVideoRenderer:
             (0.75 + 0.15 * math.cos(t * 0.3), 0.75 + 0.15 * math.sin(t * 0.4)),
         ]
         for i, (cx, cy) in enumerate(centers):
-            d = np.sqrt((nx - cx)**2 + (ny - cy)**2)
+            d = _distance_field(self._nx_row, self._ny_col, cx, cy)
             weight = np.exp(-d * 3)[..., np.newaxis]
             frame += c_arr[i] * weight
         # Normalize — ensures always full color
         max_val = np.maximum(frame.max(axis=2, keepdims=True), 1)
-        frame = frame / max_val * 230 + 20
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (15, 15), 0)
+        frame /= max_val
+        frame *= 230
+        frame += 20
+        frame = _to_u8(frame)
+        frame = self._blur(frame, 15)
         return frame
 
     # ── PATTERN: Chromatic Pulse ──
     def chromatic_pulse(self, t: float) -> np.ndarray:
-        dx = (self.x_grid - self.cx) / max(self.w, self.h)
-        dy = (self.y_grid - self.cy) / max(self.w, self.h)
-        dist = np.sqrt(dx**2 + dy**2)
-        # Concentric pulsating rings
-        rings = np.sin(dist * 30 - t * 3) * 0.5 + 0.5
-        # Slow color rotation
-        color_phase = (dist * 8 + t * 0.5) % 4
-        scaled = np.clip(color_phase, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
-        # Brighten ring peaks, but keep base colorful
-        frame = frame * (0.6 + rings[..., np.newaxis] * 0.4) + 15
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        def band(rows):
+            dist = self._dist_norm[rows]
+            # Concentric pulsating rings
+            rings = np.sin(dist * 30 - t * 3) * 0.5 + 0.5
+            # Slow color rotation
+            color_phase = (dist * 8 + t * 0.5) % 4
+            scaled = np.clip(color_phase, 0, 3.99)
+            # Brighten ring peaks, but keep base colorful
+            return self._palette_shade_u8(scaled, gain=0.6 + rings * 0.4, bias=15)
+
+        frame = self._blur(self._tiled(band), 5)
         return frame
 
     # ── PATTERN: Watercolor Blend ──
     def watercolor_blend(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 3
-        ny = self.y_grid / self.h * 3
-        # Multiple soft noise layers simulating paint spread
-        v1 = np.sin(nx * 1.2 + t * 0.2) * np.cos(ny * 1.5 - t * 0.15) * 0.4
-        v2 = np.cos(nx * 2 + ny + t * 0.3) * 0.3
-        v3 = np.sin((nx + ny) * 0.8 + t * 0.25) * 0.3
-        val = (v1 + v2 + v3 + 1) / 2.0
-        val = np.clip(val, 0, 1)
-        # Soft edges (watercolor look)
-        val = val ** 0.7  # Compress tones
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
-        # Add white paper base bleed through
-        paper = (1 - val) * 0.15
-        frame = frame * (1 - paper[..., np.newaxis]) + 240 * paper[..., np.newaxis]
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (15, 15), 0)
-        return frame
+        return self._render_half(AbstractVideoRenderer._watercolor_blend_layer, t, 15)
+
+    def _watercolor_blend_layer(self, t: float) -> np.ndarray:
+        nx_row = self._nx_row * 3
+        # Only the x-only row term is shared across bands
+        row_term = np.sin(nx_row * 1.2 + t * 0.2)
+        nx3, ny3 = self._scaled_norm(3)
+
+        def band(rows):
+            nx = nx3[rows]
+            ny = ny3[rows]
+            ny_col = self._ny_col[rows] * 3
+            # Multiple soft noise layers simulating paint spread
+            v1 = row_term * np.cos(ny_col * 1.5 - t * 0.15) * 0.4
+            v2 = np.cos(nx * 2 + ny + t * 0.3) * 0.3
+            v3 = np.sin((nx + ny) * 0.8 + t * 0.25) * 0.3
+            val = (v1 + v2 + v3 + 1) / 2.0
+            np.clip(val, 0, 1, out=val)
+            # Soft edges (watercolor look)
+            np.power(val, 0.7, out=val)  # Compress tones
+            scaled = val * 3.99
+            # Add white paper base bleed through
+            paper = (1 - val) * 0.15
+            return self._palette_shade_u8(scaled, gain=1 - paper, bias=240 * paper)
+
+        return self._tiled(band)
 
     # ── PATTERN: Ocean Waves ──
     def ocean_waves(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-        # Multiple wave layers at different frequencies
-        w1 = np.sin(nx * 8 + t * 1.5) * np.cos(ny * 3 + t * 0.5) * 0.3
-        w2 = np.sin(nx * 15 + ny * 5 + t * 2.5) * 0.15
-        w3 = np.cos(nx * 4 - t * 1.0 + ny * 2) * 0.2
-        wave = w1 + w2 + w3
-        # Depth gradient (darker at bottom)
-        depth = ny * 0.6 + 0.2
-        val = np.clip((wave + 0.5) * depth + 0.2, 0, 1)
-        # Foam at wave peaks
-        foam = np.clip((wave - 0.25) * 5, 0, 1)
-        scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
-        # Add white foam
-        frame += foam[..., np.newaxis] * 80
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        row_term = np.sin(self._nx_row * 8 + t * 1.5)
+
+        def band(rows):
+            nx = self._nx_norm[rows]
+            ny = self._ny_norm[rows]
+            ny_col = self._ny_col[rows]
+            # Multiple wave layers at different frequencies
+            w1 = row_term * np.cos(ny_col * 3 + t * 0.5) * 0.3
+            w2 = np.sin(nx * 15 + ny * 5 + t * 2.5) * 0.15
+            w3 = np.cos(nx * 4 - t * 1.0 + ny * 2) * 0.2
+            wave = w1 + w2 + w3
+            # Depth gradient (darker at bottom)
+            depth = ny * 0.6 + 0.2
+            val = np.clip((wave + 0.5) * depth + 0.2, 0, 1)
+            # Foam at wave peaks
+            foam = np.clip((wave - 0.25) * 5, 0, 1)
+            scaled = val * 3.99
+            # Add white foam
+            return self._palette_shade_u8(scaled, bias=foam * 80)
+
+        frame = self._blur(self._tiled(band), 7)
         return frame
 
     # ── PATTERN: Rolling Clouds ──
     def rolling_clouds(self, t: float) -> np.ndarray:
-        nx = (self.x_grid / self.w + t * 0.03) * 4  # Drift right
-        ny = self.y_grid / self.h * 4
-        # Multi-octave cloud noise
-        v1 = np.sin(nx + t * 0.2) * np.cos(ny * 0.8) * 0.5
-        v2 = np.sin(nx * 2 + ny * 1.5 + t * 0.3) * 0.25
-        v3 = np.cos(nx * 4 + ny * 3 - t * 0.4) * 0.125
-        v4 = np.sin(nx * 8 + ny * 6 + t * 0.5) * 0.0625
-        cloud = (v1 + v2 + v3 + v4 + 0.5)
-        cloud = np.clip(cloud, 0, 1)
-        # Sky base color
-        sky_grad = 1 - (self.y_grid / self.h) * 0.3
-        bg = np.array(self.colors[0], dtype=np.float32) * 0.4
-        frame = bg[np.newaxis, np.newaxis, :] * sky_grad[..., np.newaxis]
+        row_term = np.sin((self._nx_row + t * 0.03) * 4 + t * 0.2)  # Drift right
+        bg = self._c_arr[0] * 0.4
         # Cloud color (mix of palette)
-        cloud_color = (np.array(self.colors[1], dtype=np.float32) * 0.5 +
-                       np.array(self.colors[2], dtype=np.float32) * 0.5)
-        # Blend cloud over sky
-        cloud_alpha = np.clip(cloud * 1.5 - 0.2, 0, 1)[..., np.newaxis]
-        frame = frame * (1 - cloud_alpha) + cloud_color * cloud_alpha
-        # Highlight bright edges
-        bright = np.clip(cloud - 0.6, 0, 1) * 100
-        frame += bright[..., np.newaxis]
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (11, 11), 0)
+        cloud_color = (self._c_arr[1] * 0.5 +
+                       self._c_arr[2] * 0.5)
+        ny4 = self._scaled_norm(4)[1]
+
+        def band(rows):
+            nx = (self._nx_norm[rows] + t * 0.03) * 4  # Drift right
+            ny = ny4[rows]
+            ny_col = self._ny_col[rows] * 4
+            # Multi-octave cloud noise
+            v1 = row_term * np.cos(ny_col * 0.8) * 0.5
+            v2 = np.sin(nx * 2 + ny * 1.5 + t * 0.3) * 0.25
+            v3 = np.cos(nx * 4 + ny * 3 - t * 0.4) * 0.125
+            v4 = np.sin(nx * 8 + ny * 6 + t * 0.5) * 0.0625
+            cloud = (v1 + v2 + v3 + v4 + 0.5)
+            cloud = np.clip(cloud, 0, 1)
+            # Sky base color
+            sky_grad = 1 - (self._ny_norm[rows]) * 0.3
+            frame = bg[np.newaxis, np.newaxis, :] * sky_grad[..., np.newaxis]
+            # Blend cloud over sky
+            cloud_alpha = np.clip(cloud * 1.5 - 0.2, 0, 1)[..., np.newaxis]
+            frame *= 1 - cloud_alpha
+            frame += cloud_color * cloud_alpha
+            # Highlight bright edges
+            bright = np.clip(cloud - 0.6, 0, 1) * 100
+            frame += bright[..., np.newaxis]
+            return _to_u8(frame)
+
+        frame = self._blur(self._tiled(band), 11)
         return frame
 
     # ── PATTERN: Geometric Bloom ──
     def geometric_bloom(self, t: float) -> np.ndarray:
-        dx = self.x_grid - self.cx
-        dy = self.y_grid - self.cy
-        dist = np.sqrt(dx**2 + dy**2)
-        angle = np.arctan2(dy, dx)
+        dist = self._dist
+        angle = self._angle
         # Sacred geometry: multiple petal layers
         petals = 6
         bloom1 = np.cos(angle * petals + t) * 0.5 + 0.5
@@ -1717,28 +2496,38 @@ class AbstractVideoRenderer:
         rings = (np.sin(dist * 0.03 - t * 2) * 0.5 + 0.5) * 0.5
         val = (bloom1 * 0.4 + bloom2 * 0.3 + rings * 0.3)
         # Fade at edges
-        fade = np.clip(1 - dist / max(self.w, self.h) * 1.2, 0, 1)
+        fade = np.clip(1 - self._dist_norm * 1.2, 0, 1)
         val *= fade
         scaled = val * 3.99
-        idx = np.clip(scaled.astype(np.int32), 0, 3)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        frame = self._palette_lerp_u8(scaled)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: 3D Sphere ──
     def sphere_3d(self, t: float) -> np.ndarray:
-        nx = (self.x_grid - self.cx) / (min(self.w, self.h) * 0.4)
-        ny = (self.y_grid - self.cy) / (min(self.w, self.h) * 0.4)
-        r2 = nx**2 + ny**2
-        # Sphere mask
-        sphere_mask = r2 <= 1.0
-        # Normal z-component for lighting
-        nz = np.sqrt(np.clip(1.0 - r2, 0, 1))
+        # Everything but the light and the UV scroll is fixed for a given
+        # frame size, so the sphere's pixels, their normals and UVs and the
+        # background are worked out once; each frame shades only the ~30%
+        # of pixels that lie on the sphere
+        if self._sphere_geo is None:
+            nx = self._dx / (min(self.w, self.h) * 0.4)
+            ny = self._dy / (min(self.w, self.h) * 0.4)
+            r2 = nx**2 + ny**2
+            # Sphere mask
+            sphere_mask = r2 <= 1.0
+            nx, ny, r2 = nx[sphere_mask], ny[sphere_mask], r2[sphere_mask]
+            # Normal z-component for lighting
+            nz = np.sqrt(np.clip(1.0 - r2, 0, 1))
+            # UV mapping on sphere for color (before the scroll)
+            u = self._angle[sphere_mask] / (2 * math.pi) + 0.5
+            v = np.arcsin(np.clip(ny, -1, 1)) / math.pi + 0.5
+            # Background gradient
+            c_arr = self._c_arr
+            bg_val = (self._ny_norm)
+            bg = c_arr[0] * (1 - bg_val)[..., np.newaxis] * 0.15 + c_arr[3] * bg_val[..., np.newaxis] * 0.15
+            bg = np.clip(bg, 0, 255).astype(np.uint8)
+            self._sphere_geo = (sphere_mask, nx, ny, nz, u, v, bg)
+        sphere_mask, nx, ny, nz, u, v, bg = self._sphere_geo
         # Rotate light source
         lx = math.cos(t * 0.5) * 0.6
         ly = math.sin(t * 0.5) * 0.4
@@ -1747,31 +2536,23 @@ class AbstractVideoRenderer:
         dot = np.clip(nx * lx + ny * ly + nz * lz, 0, 1)
         # Specular highlight
         spec = np.clip(dot, 0, 1) ** 32 * 0.8
-        # UV mapping on sphere for color
-        u = (np.arctan2(ny, nx) + t * 0.3) / (2 * math.pi) + 0.5
-        v = np.arcsin(np.clip(ny, -1, 1)) / math.pi + 0.5
-        color_val = (u * 4 + v * 2) % 4
+        color_val = ((u + t * 0.3 / (2 * math.pi)) * 4 + v * 2) % 4
         scaled = np.clip(color_val, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        surface = (c1 * (1 - frac) + c2 * frac)
         # Apply lighting
-        lit = surface * (dot[..., np.newaxis] * 0.7 + 0.3) + spec[..., np.newaxis] * 200
-        # Background gradient
-        bg_val = (self.y_grid / self.h)
-        bg = c_arr[0] * (1 - bg_val)[..., np.newaxis] * 0.15 + c_arr[3] * bg_val[..., np.newaxis] * 0.15
-        frame = np.where(sphere_mask[..., np.newaxis], lit, bg)
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        gain = dot * 0.7 + 0.3
+        spec *= 200
+        planes = self._palette_planes(scaled, False)
+        for plane in planes:
+            plane *= gain
+            plane += spec
+        frame = self._fill_masked_u8(bg, sphere_mask, planes)
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: 3D Terrain ──
     def terrain_3d(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 6
-        ny = self.y_grid / self.h
+        nx = self._scaled_norm(6)[0]
+        ny = self._ny_norm
         # Perspective projection — compress Y based on depth
         depth = np.clip(ny, 0.01, 1.0)
         world_x = (nx - 3) / depth
@@ -1783,70 +2564,61 @@ class AbstractVideoRenderer:
         # Color by elevation
         val = (elev + 1) / 2.0
         scaled = np.clip(val * 3.99, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
+        c_arr = self._c_arr
+        frame = self._palette_lerp(scaled)
         # Depth fog — fade distant areas
         fog = np.clip(1 - depth * 0.6, 0.2, 1.0)[..., np.newaxis]
-        frame = frame * fog + c_arr[0] * 0.2 * (1 - fog)
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        frame *= fog
+        frame += c_arr[0] * 0.2 * (1 - fog)
+        frame = _to_u8(frame)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: 3D Cubes ──
     def cubes_3d(self, t: float) -> np.ndarray:
-        c_arr = np.array(self.colors, dtype=np.float32)
-        # Dark gradient background
-        ny = self.y_grid / self.h
-        frame = (c_arr[0] * 0.1 * (1 - ny)[..., np.newaxis] +
-                 c_arr[1] * 0.1 * ny[..., np.newaxis])
-        frame = np.broadcast_to(frame, (self.h, self.w, 3)).copy().astype(np.float32)
-        np.random.seed(42)
+        c_arr = self._c_arr
+        # Dark gradient background, fixed for the renderer. Faces are drawn
+        # straight onto a uint8 copy with their colors clipped and truncated
+        # up front, which is what the float canvas came out as.
+        if self._cubes_bg is None:
+            ny = self._ny_norm
+            bg = (c_arr[0] * 0.1 * (1 - ny)[..., np.newaxis] +
+                  c_arr[1] * 0.1 * ny[..., np.newaxis])
+            self._cubes_bg = np.clip(bg, 0, 255).astype(np.uint8)
+        frame = self._cubes_bg.copy()
         n_cubes = 12
-        for i in range(n_cubes):
-            # Cube center position (animated)
-            cx = int(self.w * (0.1 + np.random.random() * 0.8))
-            cy_base = np.random.random()
-            cy = int(self.h * ((cy_base + t * 0.02 * (i % 3 + 1)) % 1.0))
-            size = int(min(self.w, self.h) * (0.04 + np.random.random() * 0.06))
-            # 3D rotation angle
-            a = t * (0.5 + i * 0.2)
-            cos_a, sin_a = math.cos(a), math.sin(a)
-            # Simple isometric cube — 3 visible faces
-            depth_val = 0.3 + 0.7 * (i / n_cubes)
-            color = c_arr[i % 4] * depth_val
-            # Top face (brighter)
-            pts_top = np.array([
-                [cx - size, cy - size], [cx + size, cy - size],
-                [cx + size + size//3, cy - size - size//2],
-                [cx - size + size//3, cy - size - size//2]
-            ], dtype=np.int32)
-            cv2.fillPoly(frame, [pts_top], (float(color[0]*1.3), float(color[1]*1.3), float(color[2]*1.3)))
-            # Front face
-            pts_front = np.array([
-                [cx - size, cy - size], [cx + size, cy - size],
-                [cx + size, cy + size], [cx - size, cy + size]
-            ], dtype=np.int32)
-            cv2.fillPoly(frame, [pts_front], (float(color[0]), float(color[1]), float(color[2])))
-            # Side face (darker)
-            pts_side = np.array([
-                [cx + size, cy - size], [cx + size + size//3, cy - size - size//2],
-                [cx + size + size//3, cy + size - size//2], [cx + size, cy + size]
-            ], dtype=np.int32)
-            cv2.fillPoly(frame, [pts_side], (float(color[0]*0.6), float(color[1]*0.6), float(color[2]*0.6)))
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        i = np.arange(n_cubes)
+        # Per-cube draws in the original order: x, y base, size
+        cx_rand, cy_base, size_rand = self._seeded_random(42, (n_cubes, 3)).T
+        # Cube center positions (animated) and sizes for all cubes at once
+        cx = (self.w * (0.1 + cx_rand * 0.8)).astype(np.int32)
+        cy = (self.h * ((cy_base + t * 0.02 * (i % 3 + 1)) % 1.0)).astype(np.int32)
+        size = (min(self.w, self.h) * (0.04 + size_rand * 0.06)).astype(np.int32)
+        # Simple isometric cube — 3 visible faces
+        depth_val = 0.3 + 0.7 * (i / n_cubes)
+        color = c_arr[i & 3] * depth_val[:, np.newaxis]
+        # Top face (brighter), front face, side face (darker)
+        face_colors = [np.clip(color * k, 0, 255).astype(np.int32).tolist() for k in (1.3, 1.0, 0.6)]
+        left, right = cx - size, cx + size
+        top, bottom = cy - size, cy + size
+        dx, dy = size // 3, size // 2
+        faces = [
+            np.stack([left, top, right, top, right + dx, top - dy, left + dx, top - dy], axis=1),
+            np.stack([left, top, right, top, right, bottom, left, bottom], axis=1),
+            np.stack([right, top, right + dx, top - dy, right + dx, bottom - dy, right, bottom], axis=1),
+        ]
+        faces = [f.reshape(n_cubes, 4, 2).astype(np.int32) for f in faces]
+        # Cubes overlap, so they still go down one at a time in order
+        for c in range(n_cubes):
+            for pts, colors in zip(faces, face_colors):
+                cv2.fillPoly(frame, [pts[c]], colors[c])
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: 3D Tunnel ──
     def tunnel_3d(self, t: float) -> np.ndarray:
-        dx = (self.x_grid - self.cx) / max(self.w, self.h) * 2
-        dy = (self.y_grid - self.cy) / max(self.w, self.h) * 2
-        dist = np.sqrt(dx**2 + dy**2)
-        angle = np.arctan2(dy, dx)
+        dist = self._dist_norm * 2
+        angle = self._angle
         # Tunnel mapping — inverse distance gives depth illusion
         safe_dist = np.clip(dist, 0.01, 10)
         tunnel_z = 1.0 / safe_dist + t * 2
@@ -1857,62 +2629,50 @@ class AbstractVideoRenderer:
         val = (tex * 0.6 + tex2 * 0.4)
         # Color mapping
         scaled = np.clip((val * 4 + t * 0.2) % 4, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        frame = (c1 * (1 - frac) + c2 * frac)
         # Depth darkening at edges (far = bright center)
         depth_shade = np.clip(1 - dist * 0.3, 0.2, 1.0)
-        frame = frame * depth_shade[..., np.newaxis]
         # Bright center glow
         center_glow = np.exp(-dist * 5) * 60
-        frame += center_glow[..., np.newaxis]
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        frame = self._palette_shade_u8(scaled, gain=depth_shade, bias=center_glow)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: 3D Crystal ──
     def crystal_3d(self, t: float) -> np.ndarray:
-        dx = (self.x_grid - self.cx) / (min(self.w, self.h) * 0.35)
-        dy = (self.y_grid - self.cy) / (min(self.w, self.h) * 0.35)
-        angle = np.arctan2(dy, dx)
-        dist = np.sqrt(dx**2 + dy**2)
+        angle = self._angle
+        dist = self._dist / (min(self.w, self.h) * 0.35)
         # Crystal facets — hexagonal sections
         n_facets = 6
         facet_angle = ((angle + t * 0.2) % (2 * math.pi / n_facets))
-        facet_id = ((angle + t * 0.2) / (2 * math.pi / n_facets)).astype(np.int32) % n_facets
         # Crystal shape — tapered hexagon
         crystal_radius = 0.7 + 0.15 * np.cos(facet_angle * n_facets) - dist * 0.1
         inside = dist < crystal_radius
-        # Each facet has different brightness (simulates 3D normals)
-        facet_bright = 0.4 + 0.6 * np.abs(np.sin(facet_id * 1.5 + t * 0.5))
+        # The rest only matters inside the crystal
+        angle, dist, facet_angle = angle[inside], dist[inside], facet_angle[inside]
+        facet_id = ((angle + t * 0.2) / (2 * math.pi / n_facets)).astype(np.int32) % n_facets
+        # Each facet has different brightness (simulates 3D normals); only
+        # n_facets distinct values, so build them once and gather
+        facet_bright = np.take((0.4 + 0.6 * np.abs(np.sin(np.arange(n_facets) * 1.5 + t * 0.5)))
+                               .astype(np.float32), facet_id)
         # Refraction rainbow effect inside crystal
         refract = np.sin(angle * 8 + dist * 10 - t * 3) * 0.5 + 0.5
-        val = (facet_id / n_facets + refract * 0.3 + t * 0.1) % 1.0
+        val = (np.divide(facet_id, n_facets, dtype=np.float32) + refract * 0.3 + t * 0.1) % 1.0
         scaled = np.clip(val * 3.99, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        crystal_color = (c1 * (1 - frac) + c2 * frac) * facet_bright[..., np.newaxis]
         # Specular highlights on facet edges
         edge_highlight = np.exp(-np.abs(facet_angle - math.pi / n_facets) * 20) * 150
-        crystal_color += edge_highlight[..., np.newaxis]
+        planes = self._palette_planes(scaled, False)
+        for plane in planes:
+            plane *= facet_bright
+            plane += edge_highlight
         # Background
-        bg = c_arr[0] * 0.08
-        frame = np.where(inside[..., np.newaxis], crystal_color, bg)
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        bg = np.clip(self._c_arr[0] * 0.08, 0, 255).astype(np.uint8)
+        frame = self._fill_masked_u8(bg, inside, planes)
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: 3D Metaballs ──
     def metaballs_3d(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-        c_arr = np.array(self.colors, dtype=np.float32)
+        c_arr = self._c_arr
         # Metaball centers (animated)
         balls = [
             (0.35 + 0.15 * math.sin(t * 0.6), 0.4 + 0.15 * math.cos(t * 0.5), 0.12),
@@ -1921,510 +2681,523 @@ class AbstractVideoRenderer:
             (0.4 + 0.1 * math.cos(t * 0.8 + 1), 0.35 + 0.15 * math.sin(t * 0.5 + 3), 0.11),
             (0.6 + 0.15 * math.sin(t * 0.5 + 4), 0.45 + 0.1 * math.cos(t * 0.7 + 2), 0.08),
         ]
-        # Compute metaball field
-        field = np.zeros((self.h, self.w), dtype=np.float32)
-        color_field = np.zeros((self.h, self.w, 3), dtype=np.float32)
-        for i, (bx, by, br) in enumerate(balls):
-            d = np.sqrt((nx - bx)**2 + (ny - by)**2)
-            influence = br**2 / (d**2 + 0.001)
-            field += influence
-            color_field += influence[..., np.newaxis] * c_arr[i % 4]
-        # Normalize color by field
-        safe_field = np.maximum(field, 0.001)[..., np.newaxis]
-        color_field = color_field / safe_field
-        # 3D shading — fake normal from field gradient
-        shade = np.clip(field * 0.5, 0, 1)
-        # Specular-like highlights where field is strongest
-        highlight = np.clip((field - 1.5) * 3, 0, 1)
-        frame = color_field * shade[..., np.newaxis] * 0.8 + highlight[..., np.newaxis] * 120
-        # Background
-        bg_mask = (field < 0.5)[..., np.newaxis]
-        bg = c_arr[0] * 0.08
-        frame = np.where(bg_mask, bg, frame)
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (9, 9), 0)
+        bx, by, br = (np.array(col, dtype=np.float32) for col in zip(*balls))
+        # Squared distances straight from x rows and y columns (no sqrt)
+        dx2 = np.square(self._nx_row - bx[:, np.newaxis, np.newaxis])
+        dy2 = np.square(self._ny_col - by[:, np.newaxis, np.newaxis])
+        bg = np.clip(c_arr[0] * 0.08, 0, 255).astype(np.uint8)
+
+        def band(rows):
+            shape = (len(range(self.h)[rows]), self.w)
+            # Compute metaball field, with the color pull of each ball kept
+            # as a weight per palette color and mixed into RGB once
+            field = np.zeros(shape, dtype=np.float32)
+            weights = [np.zeros(shape, dtype=np.float32) for _ in range(4)]
+            influence = np.empty(shape, dtype=np.float32)
+            for i in range(len(balls)):
+                np.add(dx2[i], dy2[i, rows], out=influence)
+                influence += np.float32(0.001)
+                np.divide(br[i] * br[i], influence, out=influence)
+                field += influence
+                weights[i & 3] += influence
+            # Background wherever the field is weak; only the blobs are shaded
+            fg = field >= 0.5
+            field = field[fg]
+            # Normalize color by field
+            safe_field = np.maximum(field, 0.001)
+            # 3D shading — fake normal from field gradient
+            shade = np.clip(field * 0.5, 0, 1)
+            # Specular-like highlights where field is strongest
+            highlight = np.clip((field - 1.5) * 3, 0, 1) * 120
+            gain = shade * 0.8 / safe_field
+            color_field = np.stack([w[fg] for w in weights], axis=-1) @ c_arr
+            planes = [color_field[:, ch] * gain + highlight for ch in range(3)]
+            return self._fill_masked_u8(bg, fg, planes)
+
+        frame = self._tiled(band)
+        frame = self._blur(frame, 9)
         return frame
 
     # ── PATTERN: Color Smoke ──
     def color_smoke(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 4
-        ny = self.y_grid / self.h * 4
-        v1 = np.sin(nx * 1.5 + t * 0.3) * np.cos(ny * 2 - t * 0.2) * 0.4
-        v2 = np.cos(nx * 2.5 + ny + t * 0.4) * 0.3
-        v3 = np.sin((nx - ny) * 1.8 + t * 0.5) * 0.3
-        val = (v1 + v2 + v3 + 1) / 2.0
-        val = np.clip(val ** 0.6, 0, 1)
-        scaled = (val * 4 + t * 0.1) % 4
-        scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = frac = (scaled - idx)[..., np.newaxis]
-        frac = frac * frac * (3 - 2 * frac)
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.85 + 25
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (21, 21), 0)
-        return frame
+        return self._render_half(AbstractVideoRenderer._color_smoke_layer, t, 21)
+
+    def _color_smoke_layer(self, t: float) -> np.ndarray:
+        row_term = np.sin(self._nx_row * 4 * 1.5 + t * 0.3)
+        nx4, ny4 = self._scaled_norm(4)
+
+        def band(rows):
+            nx = nx4[rows]
+            ny = ny4[rows]
+            ny_col = self._ny_col[rows] * 4
+            v1 = row_term * np.cos(ny_col * 2 - t * 0.2) * 0.4
+            v2 = np.cos(nx * 2.5 + ny + t * 0.4) * 0.3
+            v3 = np.sin((nx - ny) * 1.8 + t * 0.5) * 0.3
+            val = (v1 + v2 + v3 + 1) / 2.0
+            np.power(val, 0.6, out=val)
+            np.clip(val, 0, 1, out=val)
+            scaled = (val * 4 + t * 0.1) % 4
+            scaled = np.clip(scaled, 0, 3.99)
+            frame = self._palette_lerp(scaled, smoothstep=True)
+            return cv2.convertScaleAbs(frame, alpha=0.85, beta=25)
+
+        return self._tiled(band)
 
     # ── PATTERN: Rainbow Flow ──
     def rainbow_flow(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-        val = (nx * 2 + ny + t * 0.15) % 1.0
-        scaled = val * 3.99
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        frac = frac * frac * (3 - 2 * frac)
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        wave = np.sin(nx * 8 + ny * 4 + t * 2) * 20
-        frame += wave[..., np.newaxis]
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (11, 11), 0)
+        if self._rainbow_base is None:
+            nx = self._nx_norm
+            ny = self._ny_norm
+            self._rainbow_base = (nx * 2 + ny, nx * 8 + ny * 4)
+        val_base, wave_base = self._rainbow_base
+        scaled = val_base + np.float32(t * 0.15)
+        scaled %= 1.0
+        scaled *= 3.99
+        wave = wave_base + np.float32(t * 2)
+        np.sin(wave, out=wave)
+        wave *= 20
+        frame = self._palette_shade_u8(scaled, bias=wave, smoothstep=True)
+        frame = self._blur(frame, 11)
         return frame
 
     # ── PATTERN: Paint Pour ──
     def paint_pour(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 5
-        ny = self.y_grid / self.h * 5
+        return self._render_half(AbstractVideoRenderer._paint_pour_layer, t, 15)
+
+    def _paint_pour_layer(self, t: float) -> np.ndarray:
+        nx, ny = self._scaled_norm(5)
         v1 = np.sin(nx * 1.3 + ny * 0.7 + t * 0.2)
         v2 = np.cos(nx * 0.9 - ny * 1.1 + t * 0.3)
         v3 = np.sin((nx + ny) * 0.6 + t * 0.15)
         val = (v1 + v2 + v3 + 3) / 6.0
         scaled = (val * 6 + t * 0.1) % 4
         scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        frac = frac * frac * (3 - 2 * frac)
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.9 + 15
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (15, 15), 0)
+        frame = self._palette_lerp(scaled, smoothstep=True)
+        frame = cv2.convertScaleAbs(frame, alpha=0.9, beta=15)
         return frame
 
     # ── PATTERN: Silk Fabric ──
     def silk_fabric(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-        fold1 = np.sin(nx * 12 + t * 0.8) * np.cos(ny * 3 + t * 0.3) * 0.5 + 0.5
+        nx = self._nx_norm
+        ny = self._ny_norm
+        nx_row = self._nx_row
+        ny_col = self._ny_col
+        fold1 = np.sin(nx_row * 12 + t * 0.8) * np.cos(ny_col * 3 + t * 0.3) * 0.5 + 0.5
         fold2 = np.sin(ny * 8 - t * 0.5 + nx * 2) * 0.3 + 0.5
         val = fold1 * 0.6 + fold2 * 0.4
         highlight = np.clip((fold1 - 0.7) * 5, 0, 1) * 40
         scaled = (val * 3 + t * 0.1) % 4
         scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame += highlight[..., np.newaxis]
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (9, 9), 0)
+        frame = self._palette_shade_u8(scaled, bias=highlight)
+        frame = self._blur(frame, 9)
         return frame
 
     # ── PATTERN: Neon Waves ──
     def neon_waves(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-        w1 = np.sin(nx * 10 + t * 2) * 0.5 + 0.5
+        nx = self._nx_norm
+        ny = self._ny_norm
+        nx_row = self._nx_row
+        w1 = np.sin(nx_row * 10 + t * 2) * 0.5 + 0.5
         w2 = np.sin(ny * 8 - t * 1.5 + nx * 3) * 0.5 + 0.5
         w3 = np.cos((nx - ny) * 6 + t * 1.8) * 0.5 + 0.5
         val = (w1 + w2 + w3) / 3.0
         scaled = (val * 5 + t * 0.2) % 4
         scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
+        frame = self._palette_lerp(scaled)
         glow = np.clip(val - 0.6, 0, 1) * 60
         frame += glow[..., np.newaxis]
-        frame = frame * 0.9 + 20
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        frame = cv2.convertScaleAbs(frame, alpha=0.9, beta=20)
+        frame = self._blur(frame, 7)
         return frame
 
     # ── PATTERN: Lava Flow ──
     def lava_flow(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 4
-        ny = (self.y_grid / self.h + t * 0.05) * 4
-        v1 = np.sin(nx * 2 + ny * 1.5 + t * 0.3) * 0.4
-        v2 = np.cos(nx * 1.5 - ny * 0.8 + t * 0.4) * 0.3
-        v3 = np.sin((nx + ny) * 0.7 + t * 0.2) * 0.3
-        val = (v1 + v2 + v3 + 1) / 2.0
-        val = np.clip(val ** 0.8, 0, 1)
-        scaled = (val * 3 + t * 0.05) % 4
-        scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        bright = np.clip(val - 0.5, 0, 1) * 50
-        frame += bright[..., np.newaxis]
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (13, 13), 0)
+        nx4 = self._scaled_norm(4)[0]
+
+        def band(rows):
+            nx = nx4[rows]
+            ny = (self._ny_norm[rows] + t * 0.05) * 4
+            v1 = np.sin(nx * 2 + ny * 1.5 + t * 0.3) * 0.4
+            v2 = np.cos(nx * 1.5 - ny * 0.8 + t * 0.4) * 0.3
+            v3 = np.sin((nx + ny) * 0.7 + t * 0.2) * 0.3
+            val = (v1 + v2 + v3 + 1) / 2.0
+            np.power(val, 0.8, out=val)
+            np.clip(val, 0, 1, out=val)
+            scaled = (val * 3 + t * 0.05) % 4
+            scaled = np.clip(scaled, 0, 3.99)
+            bright = np.clip(val - 0.5, 0, 1) * 50
+            return self._palette_shade_u8(scaled, bias=bright)
+
+        frame = self._blur(self._tiled(band), 13)
         return frame
 
     # ── PATTERN: Candy Swirl ──
     def candy_swirl(self, t: float) -> np.ndarray:
-        dx = (self.x_grid - self.cx) / max(self.w, self.h)
-        dy = (self.y_grid - self.cy) / max(self.w, self.h)
-        dist = np.sqrt(dx**2 + dy**2)
-        angle = np.arctan2(dy, dx)
+        dist = self._dist_norm
+        angle = self._angle
         swirl = angle * 3 + dist * 12 - t * 1.2
         val = np.sin(swirl) * 0.5 + 0.5
         val2 = np.cos(swirl * 0.5 + math.pi / 4) * 0.5 + 0.5
         combined = val * 0.6 + val2 * 0.4
         scaled = (combined * 4 + t * 0.15) % 4
         scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        frac = frac * frac * (3 - 2 * frac)
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.9 + 20
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (11, 11), 0)
+        frame = self._palette_lerp(scaled, smoothstep=True)
+        frame = cv2.convertScaleAbs(frame, alpha=0.9, beta=20)
+        frame = self._blur(frame, 11)
         return frame
 
     # ── PATTERN: Aurora Curtain ──
     def aurora_curtain(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-        curtain = np.sin(nx * 6 + t * 0.8) * 0.15
+        nx = self._nx_norm
+        ny = self._ny_norm
+        nx_row = self._nx_row
+        curtain = np.sin(nx_row * 6 + t * 0.8) * 0.15
         val = ny + curtain
         v1 = np.sin(val * 8 + t * 0.5) * 0.5 + 0.5
         v2 = np.cos(nx * 4 + val * 3 - t * 0.3) * 0.3 + 0.5
         combined = v1 * 0.7 + v2 * 0.3
         scaled = (combined * 4 + t * 0.1) % 4
         scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.85 + 25
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (11, 11), 0)
+        frame = self._palette_lerp(scaled)
+        frame = cv2.convertScaleAbs(frame, alpha=0.85, beta=25)
+        frame = self._blur(frame, 11)
         return frame
 
     # ── PATTERN: Color Vortex ──
     def color_vortex(self, t: float) -> np.ndarray:
-        dx = (self.x_grid - self.cx) / max(self.w, self.h)
-        dy = (self.y_grid - self.cy) / max(self.w, self.h)
-        dist = np.sqrt(dx**2 + dy**2)
-        angle = np.arctan2(dy, dx)
+        dist = self._dist_norm
+        angle = self._angle
         vortex = angle + dist * 6 + t * 1.5
         val = np.sin(vortex * 2) * 0.3 + np.cos(vortex + dist * 10) * 0.2 + 0.5
         val = np.clip(val, 0, 1)
         scaled = (val * 5 + t * 0.2) % 4
         scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.85 + 25
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (9, 9), 0)
+        frame = self._palette_lerp(scaled)
+        frame = cv2.convertScaleAbs(frame, alpha=0.85, beta=25)
+        frame = self._blur(frame, 9)
         return frame
 
     # ── PATTERN: Marble Ink ──
     def marble_ink(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 4
-        ny = self.y_grid / self.h * 4
-        v1 = np.sin(nx + ny * 0.5 + t * 0.2) * np.cos(ny - nx * 0.3 + t * 0.15)
-        v2 = np.sin(nx * 2.5 + t * 0.3) * 0.3
-        v3 = np.cos(ny * 2 + nx + t * 0.25) * 0.3
-        val = (v1 + v2 + v3 + 1.5) / 3.0
-        val = np.clip(val, 0, 1)
-        scaled = (val * 5 + t * 0.08) % 4
-        scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        frac = frac * frac * (3 - 2 * frac)
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.9 + 15
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (13, 13), 0)
-        return frame
+        return self._render_half(AbstractVideoRenderer._marble_ink_layer, t, 13)
+
+    def _marble_ink_layer(self, t: float) -> np.ndarray:
+        v2 = np.sin(self._nx_row * 4 * 2.5 + t * 0.3) * 0.3
+        nx4, ny4 = self._scaled_norm(4)
+
+        def band(rows):
+            nx = nx4[rows]
+            ny = ny4[rows]
+            v1 = np.sin(nx + ny * 0.5 + t * 0.2) * np.cos(ny - nx * 0.3 + t * 0.15)
+            v3 = np.cos(ny * 2 + nx + t * 0.25) * 0.3
+            val = (v1 + v2 + v3 + 1.5) / 3.0
+            val = np.clip(val, 0, 1)
+            scaled = (val * 5 + t * 0.08) % 4
+            scaled = np.clip(scaled, 0, 3.99)
+            frame = self._palette_lerp(scaled, smoothstep=True)
+            return cv2.convertScaleAbs(frame, alpha=0.9, beta=15)
+
+        return self._tiled(band)
 
     # ── PATTERN: Electric Gradient ──
     def electric_gradient(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
+        nx = self._nx_norm
+        ny = self._ny_norm
+        nx_row = self._nx_row
         val = (nx + ny * 0.5 + t * 0.1) % 1.0
         sharp = np.abs(np.sin(val * math.pi * 6 + t * 2))
         scaled = (sharp * 4 + t * 0.15) % 4
         scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        pulse = np.sin(nx * 20 + t * 5) * 15
-        frame += pulse[..., np.newaxis]
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        # The pulse can push dark pixels below zero, so it is added and
+        # clipped on the palette planes rather than through _to_u8
+        pulse = np.sin(nx_row * 20 + t * 5) * 15
+        frame = self._palette_shade_u8(scaled, bias=pulse)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: Color Cells ──
     def color_cells(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-        np.random.seed(77)
         n_seeds = 25
-        sx = np.random.random(n_seeds) + 0.03 * np.sin(t * 0.5 + np.arange(n_seeds) * 0.5)
-        sy = np.random.random(n_seeds) + 0.03 * np.cos(t * 0.4 + np.arange(n_seeds) * 0.7)
-        min_dist = np.full((self.h, self.w), 999.0, dtype=np.float32)
-        min_idx = np.zeros((self.h, self.w), dtype=np.int32)
-        for i in range(n_seeds):
-            d = np.sqrt((nx - sx[i])**2 + (ny - sy[i])**2)
-            mask = d < min_dist
-            min_idx = np.where(mask, i, min_idx)
-            min_dist = np.where(mask, d, min_dist)
-        val = (min_idx / n_seeds + t * 0.05) % 1.0
-        scaled = np.clip(val * 3.99, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.9 + 15
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        sx0, sy0 = self._seeded_random(77, (2, n_seeds))
+        sx = sx0 + 0.03 * np.sin(t * 0.5 + np.arange(n_seeds) * 0.5)
+        sy = sy0 + 0.03 * np.cos(t * 0.4 + np.arange(n_seeds) * 0.7)
+        # float32 seeds keep the per-seed distance fields out of float64
+        sx = sx.astype(np.float32)
+        sy = sy.astype(np.float32)
+        # Nearest seed by squared distance; the sqrt would not change the order.
+        # Each seed's field is a broadcast add of an x row and a y column, and
+        # the scan runs in place one cache-sized band at a time.
+        dx2 = np.square(self._nx_row - sx[:, np.newaxis, np.newaxis])
+        dy2 = np.square(self._ny_col - sy[:, np.newaxis, np.newaxis])
+
+        def band(rows):
+            shape = (len(range(self.h)[rows]), self.w)
+            min_dist = np.full(shape, 999.0, dtype=np.float32)
+            min_idx = np.zeros(shape, dtype=np.int32)
+            d = np.empty(shape, dtype=np.float32)
+            mask = np.empty(shape, dtype=bool)
+            for i in range(n_seeds):
+                np.add(dx2[i], dy2[i, rows], out=d)
+                np.less(d, min_dist, out=mask)
+                np.copyto(min_idx, i, where=mask)
+                np.minimum(min_dist, d, out=min_dist)
+            val = (np.divide(min_idx, n_seeds, dtype=np.float32) + t * 0.05) % 1.0
+            scaled = np.clip(val * 3.99, 0, 3.99)
+            return cv2.convertScaleAbs(self._palette_lerp(scaled), alpha=0.9, beta=15)
+
+        frame = self._tiled(band)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: Neon Grid ──
     def neon_grid(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 10
-        ny = self.y_grid / self.h * 10
-        gx = np.abs(np.sin(nx * math.pi))
-        gy = np.abs(np.sin(ny * math.pi))
+        nx, ny = self._scaled_norm(10)
+        nx_row = self._nx_row * 10
+        ny_col = self._ny_col * 10
+        gx = np.abs(np.sin(nx_row * math.pi))
+        gy = np.abs(np.sin(ny_col * math.pi))
         grid = np.minimum(gx, gy)
         edge = np.clip(1 - grid * 8, 0, 1)
-        cell_val = ((nx.astype(int) + ny.astype(int) + int(t * 2)) % 4) / 4.0
-        scaled = np.clip(cell_val * 3.99, 0, 3.99).astype(np.float32)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        c1 = c_arr[idx % 4]
-        c2 = c_arr[(idx + 1) % 4]
-        fill = (c1 * (1 - frac) + c2 * frac) * 0.4
+        cell = (nx.astype(np.int32) + ny.astype(np.int32) + int(t * 2)) & 3
+        # cell / 4 * 3.99, already inside [0, 3.99]
+        scaled = np.multiply(cell, 3.99 / 4.0, dtype=np.float32)
+        c_arr = self._c_arr
+        fill = self._palette_lerp(scaled) * 0.4
         glow_color = c_arr[int(t * 0.5) % 4]
-        frame = fill + edge[..., np.newaxis] * glow_color * 0.8
-        frame = frame + 15
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        fill += edge[..., np.newaxis] * (glow_color * 0.8)
+        fill += 15
+        frame = _to_u8(fill)
+        frame = self._blur(frame, 5)
         return frame
 
     # ── PATTERN: Paint Drip ──
     def paint_drip(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-        c_arr = np.array(self.colors, dtype=np.float32)
+        nx = self._nx_norm
+        ny = self._ny_norm
+        c_arr = self._c_arr
         frame = np.zeros((self.h, self.w, 3), dtype=np.float32)
         frame += c_arr[0] * 0.3
-        np.random.seed(88)
         n_drips = 20
-        for i in range(n_drips):
-            dx = np.random.random()
-            speed = 0.02 + np.random.random() * 0.05
-            width = 0.02 + np.random.random() * 0.04
-            head_y = (t * speed + np.random.random()) % 1.2
+        # dx, speed, width and head offset draws, in the same order per drip
+        rnd = self._seeded_random(88, (n_drips, 4)).tolist()
+        for i, (dx, speed, width, head) in enumerate(rnd):
+            speed = 0.02 + speed * 0.05
+            width = 0.02 + width * 0.04
+            head_y = (t * speed + head) % 1.2
             d = np.abs(nx - dx)
             drip_mask = (d < width) & (ny < head_y) & (ny > head_y - 0.4)
             fade = np.clip(1 - (head_y - ny) * 4, 0, 1)
             drip_val = np.where(drip_mask, fade * (1 - d / width), 0)
             frame += drip_val[..., np.newaxis] * c_arr[i % 4] * 0.8
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (9, 9), 0)
+        frame = _to_u8(frame)
+        frame = self._blur(frame, 9)
         return frame
 
     # ── PATTERN: Crystal Facets ──
     def crystal_facets(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 6
-        ny = self.y_grid / self.h * 6
+        nx, ny = self._scaled_norm(6)
         fx = np.floor(nx + 0.5 * np.floor(ny)).astype(np.int32)
         fy = np.floor(ny).astype(np.int32)
-        cell_id = (fx * 7 + fy * 13 + int(t * 0.5)) % 4
-        bright = 0.6 + 0.4 * np.sin(fx * 2.0 + fy * 3.0 + t * 0.8)
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[cell_id] * bright[..., np.newaxis]
-        edge_x = np.abs((nx + 0.5 * np.floor(ny)) % 1.0 - 0.5) < 0.05
-        edge_y = np.abs(ny % 1.0 - 0.5) < 0.05
-        frame[edge_x | edge_y] = np.clip(frame[edge_x | edge_y] + 60, 0, 255)
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        cell_id = (fx * 7 + fy * 13 + int(t * 0.5)) & 3
+        # fx and fy are non-negative ints, so the phase takes a few dozen
+        # distinct values: take the sin of each once, then gather
+        phase = fx * 2 + fy * 3
+        bright = np.take((0.6 + 0.4 * np.sin(np.arange(int(phase.max()) + 1) + t * 0.8))
+                         .astype(np.float32), phase)
+        c_arr = self._c_arr
+        frame = _to_u8(c_arr[cell_id] * bright[..., np.newaxis])
+        if self._facet_edges is None:
+            edge_x = np.abs((nx + 0.5 * np.floor(ny)) % 1.0 - 0.5) < 0.05
+            edge_y = np.abs(ny % 1.0 - 0.5) < 0.05
+            edges = (edge_x | edge_y).astype(np.uint8) * np.uint8(60)
+            self._facet_edges = cv2.merge([edges, edges, edges])
+        # Saturating byte add in place of a masked gather/clip/scatter
+        frame = cv2.add(frame, self._facet_edges)
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: Thermal Map ──
     def thermal_map(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 5
-        ny = self.y_grid / self.h * 5
-        heat = (np.sin(nx * 1.5 + t * 0.3) * np.cos(ny * 2 + t * 0.2) * 0.4 +
-                np.sin(nx * 3 + ny + t * 0.5) * 0.3 +
-                np.cos(np.sqrt((nx - 2.5)**2 + (ny - 2.5)**2) * 2 + t * 0.4) * 0.3)
-        heat = (heat + 1) / 2.0
-        scaled = np.clip(heat * 3.99, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.9 + 15
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (9, 9), 0)
+        nx5, ny5 = self._scaled_norm(5)
+        nx_row = self._nx_row * 5
+        row_term = np.sin(nx_row * 1.5 + t * 0.3) * 0.4
+
+        def band(rows):
+            nx = nx5[rows]
+            ny = ny5[rows]
+            ny_col = self._ny_col[rows] * 5
+            heat = (row_term * np.cos(ny_col * 2 + t * 0.2) +
+                    np.sin(nx * 3 + ny + t * 0.5) * 0.3 +
+                    np.cos(_distance_field(nx_row, ny_col, 2.5, 2.5) * 2 + t * 0.4) * 0.3)
+            heat = (heat + 1) / 2.0
+            scaled = np.clip(heat * 3.99, 0, 3.99)
+            return self._palette_lut_u8(scaled, alpha=0.9, beta=15)
+
+        frame = self._blur(self._tiled(band), 9)
         return frame
 
     # ── PATTERN: Color Storm ──
     def color_storm(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 5
-        ny = self.y_grid / self.h * 5
-        v1 = np.sin(nx * 3 + t * 1.5) * np.cos(ny * 2 - t * 1.2) * 0.4
-        v2 = np.cos(nx * 2 - ny * 3 + t * 1.8) * 0.3
-        v3 = np.sin((nx + ny) * 2.5 + t * 2) * 0.2
-        v4 = np.cos(nx * 5 + ny * 4 - t * 1.5) * 0.1
-        val = (v1 + v2 + v3 + v4 + 1) / 2.0
-        val = np.clip(val, 0, 1)
-        scaled = (val * 6 + t * 0.3) % 4
-        scaled = np.clip(scaled, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.85 + 25
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        nx5, ny5 = self._scaled_norm(5)
+        row_term = np.sin(self._nx_row * 5 * 3 + t * 1.5) * 0.4
+
+        def band(rows):
+            nx = nx5[rows]
+            ny = ny5[rows]
+            v1 = row_term * np.cos(self._ny_col[rows] * 5 * 2 - t * 1.2)
+            v2 = np.cos(nx * 2 - ny * 3 + t * 1.8) * 0.3
+            v3 = np.sin((nx + ny) * 2.5 + t * 2) * 0.2
+            v4 = np.cos(nx * 5 + ny * 4 - t * 1.5) * 0.1
+            val = (v1 + v2 + v3 + v4 + 1) / 2.0
+            val = np.clip(val, 0, 1)
+            scaled = (val * 6 + t * 0.3) % 4
+            scaled = np.clip(scaled, 0, 3.99)
+            return self._palette_lut_u8(scaled, alpha=0.85, beta=25)
+
+        frame = self._blur(self._tiled(band), 7)
         return frame
 
     # ── PATTERN: Pixel Mosaic ──
     def pixel_mosaic(self, t: float) -> np.ndarray:
         block = max(8, int(min(self.w, self.h) * 0.03))
-        bx = (self.x_grid // block).astype(np.int32)
-        by = (self.y_grid // block).astype(np.int32)
+        # Block coordinates stay float32 (exact for these small integers) so
+        # the cell and wave math below never promotes to float64
+        bx = self.x_grid // block
+        by = self.y_grid // block
         cell_val = ((bx * 7 + by * 13 + int(t * 3)) % 4) / 4.0
         wave = np.sin(bx * 0.3 + by * 0.2 + t * 1.5) * 0.15
         val = np.clip(cell_val + wave, 0, 1)
         scaled = np.clip(val * 3.99, 0, 3.99)
-        idx = scaled.astype(np.int32)
-        frac = (scaled - idx)[..., np.newaxis]
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = c_arr[idx % 4] * (1 - frac) + c_arr[(idx + 1) % 4] * frac
-        frame = frame * 0.9 + 15
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
+        frame = self._palette_lut_u8(scaled, alpha=0.9, beta=15)
         return frame
 
     # ── PATTERN: Liquid Chrome ──
     def liquid_chrome(self, t: float) -> np.ndarray:
-        nx = self.x_grid / self.w * 4
-        ny = self.y_grid / self.h * 4
-        v1 = np.sin(nx * 2 + ny + t * 0.5) * 0.5 + 0.5
-        v2 = np.cos(nx + ny * 2 - t * 0.4) * 0.5 + 0.5
-        v3 = np.sin((nx - ny) * 3 + t * 0.6) * 0.5 + 0.5
-        chrome = (v1 + v2 + v3) / 3.0
-        reflect = np.abs(np.sin(chrome * math.pi * 4 + t)) * 0.4 + 0.6
-        c_arr = np.array(self.colors, dtype=np.float32)
-        frame = (c_arr[0] * v1[..., np.newaxis] + c_arr[1] * v2[..., np.newaxis] +
-                 c_arr[2] * v3[..., np.newaxis]) * 0.5
-        frame = frame * reflect[..., np.newaxis]
-        specular = np.clip((chrome - 0.7) * 8, 0, 1) * 100
-        frame += specular[..., np.newaxis]
-        frame = frame * 0.8 + 30
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        nx4, ny4 = self._scaled_norm(4)
+        c_arr = self._c_arr
+
+        def band(rows):
+            nx = nx4[rows]
+            ny = ny4[rows]
+            v1 = np.sin(nx * 2 + ny + t * 0.5) * 0.5 + 0.5
+            v2 = np.cos(nx + ny * 2 - t * 0.4) * 0.5 + 0.5
+            v3 = np.sin((nx - ny) * 3 + t * 0.6) * 0.5 + 0.5
+            chrome = (v1 + v2 + v3) / 3.0
+            reflect = np.abs(np.sin(chrome * math.pi * 4 + t)) * 0.4 + 0.6
+            frame = (c_arr[0] * v1[..., np.newaxis] + c_arr[1] * v2[..., np.newaxis] +
+                     c_arr[2] * v3[..., np.newaxis]) * 0.5
+            frame *= reflect[..., np.newaxis]
+            specular = np.clip((chrome - 0.7) * 8, 0, 1) * 100
+            frame += specular[..., np.newaxis]
+            return cv2.convertScaleAbs(frame, alpha=0.8, beta=30)
+
+        frame = self._blur(self._tiled(band), 7)
         return frame
 
     # ── PATTERN: Floating Particles ──
     def floating_particles(self, t: float) -> np.ndarray:
         """Elegant particles gently rising upward — #1 microstock seller."""
-        c_arr = np.array(self.colors, dtype=np.float32)
+        c_arr = self._c_arr
         # Dark background from first color, dimmed
         bg = (c_arr[0] * 0.15).astype(np.uint8)
         frame = np.full((self.h, self.w, 3), bg, dtype=np.uint8)
 
-        rng = np.random.RandomState(42)
         n_particles = 120
-        base_x = rng.rand(n_particles)
-        base_speed = rng.rand(n_particles) * 0.3 + 0.05
-        base_size = (rng.rand(n_particles) * 3 + 1).astype(int)
-        base_brightness = rng.rand(n_particles) * 0.6 + 0.4
-        color_idx = rng.randint(0, 4, n_particles)
-
-        for i in range(n_particles):
-            x = int((base_x[i] + math.sin(t * 0.3 + i) * 0.02) * self.w) % self.w
-            y = int((1.0 - ((t * base_speed[i] + i * 0.1) % 1.2)) * self.h)
-            if y < -10 or y > self.h + 10:
-                continue
-            r = base_size[i]
-            brightness = base_brightness[i] * (0.7 + 0.3 * math.sin(t * 2 + i))
-            color = (c_arr[color_idx[i]] * brightness).astype(int).tolist()
+        base_x, base_speed, base_size, base_brightness, color_idx = self._seeded_params(
+            "floating_particles", 42, lambda rng: (
+                rng.rand(n_particles),
+                rng.rand(n_particles) * 0.3 + 0.05,
+                (rng.rand(n_particles) * 3 + 1).astype(int),
+                rng.rand(n_particles) * 0.6 + 0.4,
+                rng.randint(0, 4, n_particles)))
+
+        # Positions and colors for every particle at once; only the draw
+        # calls stay in Python
+        idx = np.arange(n_particles)
+        xs = ((base_x + np.sin(t * 0.3 + idx) * 0.02) * self.w).astype(int) % self.w
+        ys = ((1.0 - ((t * base_speed + idx * 0.1) % 1.2)) * self.h).astype(int)
+        brightness = base_brightness * (0.7 + 0.3 * np.sin(t * 2 + idx))
+        colors = (c_arr[color_idx] * brightness[:, np.newaxis]).astype(int)
+        visible = (ys >= -10) & (ys <= self.h + 10)
+        for x, y, r, color, glow_color in zip(xs[visible].tolist(), ys[visible].tolist(),
+                                              base_size[visible].tolist(),
+                                              colors[visible].tolist(),
+                                              (colors[visible] // 4).tolist()):
             cv2.circle(frame, (x, y), r, color, -1, cv2.LINE_AA)
             # Glow
             if r >= 2:
-                cv2.circle(frame, (x, y), r * 3, [c // 4 for c in color], -1, cv2.LINE_AA)
+                cv2.circle(frame, (x, y), r * 3, glow_color, -1, cv2.LINE_AA)
 
-        frame = cv2.GaussianBlur(frame, (3, 3), 0)
+        frame = self._blur(frame, 3)
         return frame
 
     # ── PATTERN: Bokeh Lights ──
     def bokeh_lights(self, t: float) -> np.ndarray:
         """Beautiful out-of-focus light circles — top seller."""
-        c_arr = np.array(self.colors, dtype=np.float32)
+        c_arr = self._c_arr
         bg = (c_arr[0] * 0.1).astype(np.uint8)
         frame = np.full((self.h, self.w, 3), bg, dtype=np.uint8)
 
-        rng = np.random.RandomState(123)
         n_bokeh = 40
-        base_x = rng.rand(n_bokeh)
-        base_y = rng.rand(n_bokeh)
-        base_r = (rng.rand(n_bokeh) * 40 + 15).astype(int)
-        base_alpha = rng.rand(n_bokeh) * 0.3 + 0.1
-        color_idx = rng.randint(0, 4, n_bokeh)
-        drift_speed = rng.rand(n_bokeh) * 0.02 + 0.005
-
-        for i in range(n_bokeh):
-            x = int((base_x[i] + math.sin(t * drift_speed[i] * 10 + i) * 0.05) * self.w)
-            y = int((base_y[i] + math.cos(t * drift_speed[i] * 8 + i * 2) * 0.03) * self.h)
-            r = base_r[i]
-            pulse = 0.7 + 0.3 * math.sin(t * 1.5 + i * 0.8)
-            alpha = base_alpha[i] * pulse
-            color = (c_arr[color_idx[i]] * alpha).astype(int).tolist()
+        base_x, base_y, base_r, base_alpha, color_idx, drift_speed = self._seeded_params(
+            "bokeh_lights", 123, lambda rng: (
+                rng.rand(n_bokeh),
+                rng.rand(n_bokeh),
+                (rng.rand(n_bokeh) * 40 + 15).astype(int),
+                rng.rand(n_bokeh) * 0.3 + 0.1,
+                rng.randint(0, 4, n_bokeh),
+                rng.rand(n_bokeh) * 0.02 + 0.005))
+
+        idx = np.arange(n_bokeh)
+        xs = ((base_x + np.sin(t * drift_speed * 10 + idx) * 0.05) * self.w).astype(int)
+        ys = ((base_y + np.cos(t * drift_speed * 8 + idx * 2) * 0.03) * self.h).astype(int)
+        pulse = 0.7 + 0.3 * np.sin(t * 1.5 + idx * 0.8)
+        colors = (c_arr[color_idx] * (base_alpha * pulse)[:, np.newaxis]).astype(int)
+        inner_colors = (colors * 1.5).astype(int)
+        inner_r = np.maximum(1, base_r // 2)
+        for x, y, r, color, ir, inner_color in zip(xs.tolist(), ys.tolist(), base_r.tolist(),
+                                                   colors.tolist(), inner_r.tolist(),
+                                                   inner_colors.tolist()):
             cv2.circle(frame, (x, y), r, color, 2, cv2.LINE_AA)
             # Inner glow
-            cv2.circle(frame, (x, y), max(1, r // 2), [int(c * 1.5) for c in color], -1, cv2.LINE_AA)
+            cv2.circle(frame, (x, y), ir, inner_color, -1, cv2.LINE_AA)
 
-        frame = cv2.GaussianBlur(frame, (7, 7), 0)
+        frame = self._blur(frame, 7)
         return frame
 
     # ── PATTERN: Plexus Network ──
     def plexus_network(self, t: float) -> np.ndarray:
         """Connected nodes with dynamic linking lines — tech/corporate favorite."""
-        c_arr = np.array(self.colors, dtype=np.float32)
+        c_arr = self._c_arr
         bg = (c_arr[0] * 0.08).astype(np.uint8)
         frame = np.full((self.h, self.w, 3), bg, dtype=np.uint8)
 
-        rng = np.random.RandomState(77)
         n_nodes = 60
-        base_x = rng.rand(n_nodes)
-        base_y = rng.rand(n_nodes)
-        speed_x = (rng.rand(n_nodes) - 0.5) * 0.02
-        speed_y = (rng.rand(n_nodes) - 0.5) * 0.02
+        base_x, base_y, speed_x, speed_y = self._seeded_params(
+            "plexus_network", 77, lambda rng: (
+                rng.rand(n_nodes),
+                rng.rand(n_nodes),
+                (rng.rand(n_nodes) - 0.5) * 0.02,
+                (rng.rand(n_nodes) - 0.5) * 0.02))
 
         # Calculate node positions
-        nodes = []
-        for i in range(n_nodes):
-            x = ((base_x[i] + speed_x[i] * t + math.sin(t * 0.5 + i) * 0.02) % 1.0) * self.w
-            y = ((base_y[i] + speed_y[i] * t + math.cos(t * 0.4 + i) * 0.02) % 1.0) * self.h
-            nodes.append((int(x), int(y)))
+        idx = np.arange(n_nodes)
+        xs = (((base_x + speed_x * t + np.sin(t * 0.5 + idx) * 0.02) % 1.0) * self.w).astype(int)
+        ys = (((base_y + speed_y * t + np.cos(t * 0.4 + idx) * 0.02) % 1.0) * self.h).astype(int)
+        nodes = list(zip(xs.tolist(), ys.tolist()))
 
-        # Draw connections
+        # Draw connections. All pairwise distances come from one broadcast;
+        # np.nonzero on the upper triangle keeps the (i, j) draw order.
         max_dist = min(self.w, self.h) * 0.2
-        line_color = (c_arr[1] * 0.3).astype(int).tolist()
-        for i in range(n_nodes):
-            for j in range(i + 1, n_nodes):
-                dx = nodes[i][0] - nodes[j][0]
-                dy = nodes[i][1] - nodes[j][1]
-                dist = math.sqrt(dx * dx + dy * dy)
-                if dist < max_dist:
-                    alpha = 1.0 - dist / max_dist
-                    c = [int(v * alpha) for v in line_color]
-                    cv2.line(frame, nodes[i], nodes[j], c, 1, cv2.LINE_AA)
+        line_color = (c_arr[1] * 0.3).astype(int)
+        dx = xs[:, np.newaxis] - xs[np.newaxis, :]
+        dy = ys[:, np.newaxis] - ys[np.newaxis, :]
+        dist = np.sqrt(dx * dx + dy * dy)
+        ii, jj = np.nonzero(np.triu(dist < max_dist, 1))
+        alpha = 1.0 - dist[ii, jj] / max_dist
+        line_colors = (line_color * alpha[:, np.newaxis]).astype(int).tolist()
+        for i, j, c in zip(ii.tolist(), jj.tolist(), line_colors):
+            cv2.line(frame, nodes[i], nodes[j], c, 1, cv2.LINE_AA)
 
         # Draw nodes
         node_color = (c_arr[2] * 0.8).astype(int).tolist()
@@ -2438,70 +3211,82 @@ class AbstractVideoRenderer:
     # ── PATTERN: Soft Gradient Shift ──
     def soft_gradient_shift(self, t: float) -> np.ndarray:
         """Smooth slow-moving color gradient transitions — presentation staple."""
-        c_arr = np.array(self.colors, dtype=np.float32)
-        nx = self.x_grid / self.w
-        ny = self.y_grid / self.h
-
-        # Very slow, smooth weight transitions
-        w0 = (np.sin(nx * math.pi + t * 0.15) * 0.5 + 0.5) * (np.cos(ny * math.pi + t * 0.1) * 0.5 + 0.5)
-        w1 = (np.cos(nx * math.pi - t * 0.12) * 0.5 + 0.5) * (np.sin(ny * math.pi - t * 0.08) * 0.5 + 0.5)
-        w2 = (np.sin((nx + ny) * math.pi * 0.5 + t * 0.1) * 0.5 + 0.5)
-        w3 = 1.0 - (w0 + w1 + w2) / 3.0
-
-        total = w0 + w1 + w2 + w3 + 1e-6
-        w0 /= total
-        w1 /= total
-        w2 /= total
-        w3 /= total
-
-        frame = (c_arr[0] * w0[..., np.newaxis] +
-                 c_arr[1] * w1[..., np.newaxis] +
-                 c_arr[2] * w2[..., np.newaxis] +
-                 c_arr[3] * w3[..., np.newaxis])
-        frame = np.clip(frame, 0, 255).astype(np.uint8)
-        frame = cv2.GaussianBlur(frame, (15, 15), 0)
+        c_arr = self._c_arr
+        nx_row = self._nx_row
+        # Very slow, smooth weight transitions. w0 and w1 are products of an
+        # x-only row and a y-only column.
+        w0_row = np.sin(nx_row * math.pi + t * 0.15) * 0.5 + 0.5
+        w1_row = np.cos(nx_row * math.pi - t * 0.12) * 0.5 + 0.5
+
+        def band(rows):
+            ny_col = self._ny_col[rows]
+            w0 = w0_row * (np.cos(ny_col * math.pi + t * 0.1) * 0.5 + 0.5)
+            w1 = w1_row * (np.sin(ny_col * math.pi - t * 0.08) * 0.5 + 0.5)
+            w2 = (np.sin((self._nx_norm[rows] + self._ny_norm[rows]) * math.pi * 0.5 + t * 0.1) * 0.5 + 0.5)
+            w3 = 1.0 - (w0 + w1 + w2) / 3.0
+
+            # One (pixels x 4) @ (4 x 3) product mixes the colors; normalizing
+            # the three output channels is cheaper than the four weights
+            weights = np.stack([w0, w1, w2, w3], axis=-1)
+            total = weights.sum(axis=-1, keepdims=True)
+            total += 1e-6
+            frame = weights @ c_arr
+            frame /= total
+            return _to_u8(frame)
+
+        frame = self._blur(self._tiled(band), 15)
         return frame
 
     # ── PATTERN: Geometric Float ──
     def geometric_float(self, t: float) -> np.ndarray:
         """Floating geometric shapes drifting gently — modern/trendy."""
-        c_arr = np.array(self.colors, dtype=np.float32)
+        c_arr = self._c_arr
         bg = (c_arr[0] * 0.12).astype(np.uint8)
         frame = np.full((self.h, self.w, 3), bg, dtype=np.uint8)
 
-        rng = np.random.RandomState(55)
         n_shapes = 30
-        shape_type = rng.randint(0, 3, n_shapes)  # 0=triangle, 1=rect, 2=circle
-        base_x = rng.rand(n_shapes)
-        base_y = rng.rand(n_shapes)
-        base_size = (rng.rand(n_shapes) * 40 + 10).astype(int)
-        base_alpha = rng.rand(n_shapes) * 0.3 + 0.1
-        color_idx = rng.randint(0, 4, n_shapes)
-        rotation = rng.rand(n_shapes) * math.pi * 2
-
-        for i in range(n_shapes):
-            x = int((base_x[i] + math.sin(t * 0.2 + i * 0.5) * 0.05) * self.w)
-            y = int((base_y[i] + math.cos(t * 0.15 + i * 0.3) * 0.04) * self.h)
-            s = base_size[i]
-            alpha = base_alpha[i] * (0.6 + 0.4 * math.sin(t + i))
-            color = (c_arr[color_idx[i]] * alpha).astype(int).tolist()
-            angle = rotation[i] + t * 0.3
-
-            if shape_type[i] == 0:  # Triangle
-                pts = []
-                for k in range(3):
-                    a = angle + k * 2 * math.pi / 3
-                    pts.append([int(x + s * math.cos(a)), int(y + s * math.sin(a))])
-                cv2.polylines(frame, [np.array(pts)], True, color, 2, cv2.LINE_AA)
-            elif shape_type[i] == 1:  # Rectangle
-                half = s // 2
-                cos_a, sin_a = math.cos(angle), math.sin(angle)
-                pts = []
-                for dx, dy in [(-half, -half), (half, -half), (half, half), (-half, half)]:
-                    rx = int(x + dx * cos_a - dy * sin_a)
-                    ry = int(y + dx * sin_a + dy * cos_a)
-                    pts.append([rx, ry])
-                cv2.polylines(frame, [np.array(pts)], True, color, 2, cv2.LINE_AA)
+        # shape_type: 0=triangle, 1=rect, 2=circle
+        shape_type, base_x, base_y, base_size, base_alpha, color_idx, rotation = self._seeded_params(
+            "geometric_float", 55, lambda rng: (
+                rng.randint(0, 3, n_shapes),
+                rng.rand(n_shapes),
+                rng.rand(n_shapes),
+                (rng.rand(n_shapes) * 40 + 10).astype(int),
+                rng.rand(n_shapes) * 0.3 + 0.1,
+                rng.randint(0, 4, n_shapes),
+                rng.rand(n_shapes) * math.pi * 2))
+
+        # Centers, colors and the outline vertices of every shape at once;
+        # only the draw calls stay in Python
+        idx = np.arange(n_shapes)
+        xs = ((base_x + np.sin(t * 0.2 + idx * 0.5) * 0.05) * self.w).astype(int)
+        ys = ((base_y + np.cos(t * 0.15 + idx * 0.3) * 0.04) * self.h).astype(int)
+        alpha = base_alpha * (0.6 + 0.4 * np.sin(t + idx))
+        colors = (c_arr[color_idx] * alpha[:, np.newaxis]).astype(int).tolist()
+        angle = rotation + t * 0.3
+        x_col = xs[:, np.newaxis]
+        y_col = ys[:, np.newaxis]
+        # Triangle vertices at angle + k * 120 degrees
+        tri_a = angle[:, np.newaxis] + np.arange(3) * 2 * math.pi / 3
+        size_col = base_size[:, np.newaxis]
+        tri_pts = np.stack([(x_col + size_col * np.cos(tri_a)).astype(int),
+                            (y_col + size_col * np.sin(tri_a)).astype(int)], axis=-1).astype(np.int32)
+        # Rectangle corners rotated about the center
+        half = size_col // 2
+        corner_dx = half * np.array([-1, 1, 1, -1])
+        corner_dy = half * np.array([-1, -1, 1, 1])
+        cos_a = np.cos(angle)[:, np.newaxis]
+        sin_a = np.sin(angle)[:, np.newaxis]
+        rect_pts = np.stack([(x_col + corner_dx * cos_a - corner_dy * sin_a).astype(int),
+                             (y_col + corner_dx * sin_a + corner_dy * cos_a).astype(int)],
+                            axis=-1).astype(np.int32)
+
+        for i, (kind, x, y, s, color) in enumerate(zip(shape_type.tolist(), xs.tolist(), ys.tolist(),
+                                                        base_size.tolist(), colors)):
+            if kind == 0:  # Triangle
+                cv2.polylines(frame, [tri_pts[i]], True, color, 2, cv2.LINE_AA)
+            elif kind == 1:  # Rectangle
+                cv2.polylines(frame, [rect_pts[i]], True, color, 2, cv2.LINE_AA)
             else:  # Circle
                 cv2.circle(frame, (x, y), s, color, 2, cv2.LINE_AA)
 
@@ -2510,24 +3295,28 @@ class AbstractVideoRenderer:
     # ── PATTERN: Digital Data ──
     def digital_data(self, t: float) -> np.ndarray:
         """Subtle data stream with numbers — tech/AI/cybersecurity."""
-        c_arr = np.array(self.colors, dtype=np.float32)
+        c_arr = self._c_arr
         bg = (c_arr[0] * 0.05).astype(np.uint8)
         frame = np.full((self.h, self.w, 3), bg, dtype=np.uint8)
 
-        rng = np.random.RandomState(99)
         n_cols = 30
-        col_x = (rng.rand(n_cols) * self.w).astype(int)
-        col_speed = rng.rand(n_cols) * 0.5 + 0.1
-        col_chars = rng.randint(8, 20, n_cols)
-        color_idx = rng.randint(0, 4, n_cols)
+        col_x, col_speed, col_chars, color_idx = self._seeded_params(
+            "digital_data", 99, lambda rng: (
+                (rng.rand(n_cols) * self.w).astype(int),
+                rng.rand(n_cols) * 0.5 + 0.1,
+                rng.randint(8, 20, n_cols),
+                rng.randint(0, 4, n_cols)))
 
         chars = "0123456789ABCDEF<>{}[]#@$"
         font = cv2.FONT_HERSHEY_SIMPLEX
         font_scale = 0.35
         char_h = 16
 
+        # Each character is rasterized once and then alpha-blended into place,
+        # which is several times cheaper than a putText call per character
+        glyphs = [_glyph(ch, font, font_scale) for ch in chars]
         for i in range(n_cols):
-            x = col_x[i]
+            x = int(col_x[i])
             offset = (t * col_speed[i] * 100) % (self.h + col_chars[i] * char_h)
             base_color = c_arr[color_idx[i]]
 
@@ -2537,18 +3326,22 @@ class AbstractVideoRenderer:
                     continue
                 # Fade out trailing chars
                 fade = max(0.05, 1.0 - j / col_chars[i])
-                color = (base_color * fade * 0.7).astype(int).tolist()
+                color = (base_color * fade * 0.7).astype(int)
                 # Deterministic char selection that changes over time
                 char_idx = (int(t * 3 + i * 7 + j * 13) % len(chars))
-                ch = chars[char_idx]
-                cv2.putText(frame, ch, (x, y), font, font_scale, color, 1, cv2.LINE_AA)
+                _blit_glyph(frame, glyphs[char_idx], x, y, color)
 
         return frame
 
     # ── RENDER DISPATCHER ──
     def render_frame(self, pattern: str, t: float) -> np.ndarray:
         """Render a single frame for the given pattern at time t."""
-        renderers = {
+        return self.compile_for(pattern)(t)
+
+    @functools.cached_property
+    def _renderers(self) -> dict:
+        """Pattern name -> bound render method, built once per renderer."""
+        return {
             "gradient_flow": self._fast_gradient_flow,
             "particle_wave": self.particle_wave,
             "liquid_marble": self.liquid_marble,
@@ -2598,8 +3391,14 @@ class AbstractVideoRenderer:
             "liquid_chrome": self.liquid_chrome,
 
         }
-        renderer = renderers.get(pattern, self._fast_gradient_flow)
-        return renderer(t)
+
+    def compile_for(self, pattern: str) -> Callable[[float], np.ndarray]:
+        """Resolve ``pattern`` once and return its ``render(t) -> frame``.
+
+        Size and palette are fixed for a renderer, so a whole clip can call
+        the returned function per frame instead of re-dispatching by name.
+        """
+        return self._renderers.get(pattern, self._fast_gradient_flow)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -2612,13 +3411,116 @@ class OverlayRenderer:
     def __init__(self, width: int, height: int):
         self.w = width
         self.h = height
+        # (1, W) and (H, 1) pixel coordinates, for overlays whose terms
+        # depend on one axis only and can broadcast instead of using mgrid
+        self._x_row = np.arange(width, dtype=np.float32)[np.newaxis, :]
+        self._y_col = np.arange(height, dtype=np.float32)[:, np.newaxis]
+        # (distance, angle) around the frame center, filled on first use
+        self._polar = None
+        # Full (H, W) pixel coordinate grids, filled on first use
+        self._xy_grids = None
+        # Reused float32 (map_x, map_y) scratch planes for cv2.remap, see _remap_maps
+        self._maps = None
+        # Fixed-seed per-overlay draws by overlay, see _seeded_params
+        self._rand_cache = {}
+
+    def _polar_from(self, px: float, py: float) -> tuple:
+        """Distance and angle of every pixel around (px, py), in one cv2.cartToPolar pass.
+
+        Angles come out in [0, 2pi) rather than arctan2's (-pi, pi], which
+        the overlays using this only feed to periodic functions.
+        """
+        dx = np.empty((self.h, self.w), dtype=np.float32)
+        dy = np.empty((self.h, self.w), dtype=np.float32)
+        dx[:] = self._x_row - np.float32(px)
+        dy[:] = self._y_col - np.float32(py)
+        return cv2.cartToPolar(dx, dy)
+
+    def _center_polar(self) -> tuple:
+        """_polar_from the frame center, computed once (treat as read-only)."""
+        if self._polar is None:
+            self._polar = self._polar_from(self.w / 2, self.h / 2)
+        return self._polar
+
+    def _grids(self) -> tuple:
+        """(x_grid, y_grid) float32 pixel coordinates, built once (read-only).
+
+        Replaces the np.mgrid each full-grid overlay used to rebuild per frame.
+        """
+        if self._xy_grids is None:
+            y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
+            for grid in (x_grid, y_grid):
+                grid.flags.writeable = False
+            self._xy_grids = (x_grid, y_grid)
+        return self._xy_grids
 
-    def apply(self, frame: np.ndarray, effect: str, t: float) -> np.ndarray:
-        """Apply an overlay effect to the frame."""
-        if effect == "none" or not effect:
-            return frame
+    def _seeded_params(self, key: str, seed: int, draw: Callable) -> tuple:
+        """``draw(np.random.RandomState(seed))``, evaluated once per renderer (read-only).
+
+        Same as AbstractVideoRenderer._seeded_params, for the sprite overlays
+        that used to reseed and redraw identical particles every frame.
+        """
+        params = self._rand_cache.get(key)
+        if params is None:
+            params = draw(np.random.RandomState(seed))
+            for arr in params:
+                arr.flags.writeable = False
+            self._rand_cache[key] = params
+        return params
+
+    def _remap_maps(self) -> tuple:
+        """Preallocated (map_x, map_y) float32 buffers, overwritten by each remap overlay."""
+        if self._maps is None:
+            self._maps = (np.empty((self.h, self.w), dtype=np.float32),
+                          np.empty((self.h, self.w), dtype=np.float32))
+        return self._maps
+
+    @staticmethod
+    def _add_glow(frame: np.ndarray, plane: np.ndarray, gains) -> np.ndarray:
+        """``frame + plane * gain`` per channel, saturated, for a non-negative (H, W) ``plane``.
+
+        ``gains`` is one scale for every channel or one per channel.  Each
+        scaled plane is rounded to uint8 by convertScaleAbs and added with
+        cv2.add's saturating uint8 arithmetic, so no float (H, W, 3) frame is
+        built.  Within one level of the float sum.
+        """
+        if np.isscalar(gains):
+            layer = cv2.convertScaleAbs(plane, alpha=gains)
+            layer = cv2.merge([layer, layer, layer])
+        else:
+            layer = cv2.merge([cv2.convertScaleAbs(plane, alpha=g) for g in gains])
+        return cv2.add(frame, layer)
+
+    @staticmethod
+    def _blur(img: np.ndarray, kw: int, kh: Optional[int] = None) -> np.ndarray:
+        """cv2.GaussianBlur(img, (kw, kh), 0) through the cached separable kernels.
 
-        effects = {
+        Matches GaussianBlur to within a level or two on uint8 and is faster
+        there, since the kernels are not rebuilt every frame.
+        """
+        kx = _gaussian_kernel(kw)
+        ky = kx if kh is None or kh == kw else _gaussian_kernel(kh)
+        return cv2.sepFilter2D(img, -1, kx, ky)
+
+    def _blur_half(self, img: np.ndarray, kw: int, kh: Optional[int] = None) -> np.ndarray:
+        """_blur(img, kw, kh) for glow layers, run at half resolution.
+
+        Each axis with a wide kernel is shrunk 2x with INTER_AREA, blurred
+        with half the kernel and scaled back up.  The blur removes the detail
+        the round trip loses, and the filter touches a quarter of the pixels.
+        """
+        kh = kw if kh is None else kh
+        h, w = img.shape[:2]
+        sw = max(1, w // 2) if kw >= 15 else w
+        sh = max(1, h // 2) if kh >= 15 else h
+        small = cv2.resize(img, (sw, sh), interpolation=cv2.INTER_AREA)
+        small = self._blur(small, kw // 2 | 1 if sw < w else kw, kh // 2 | 1 if sh < h else kh)
+        return cv2.resize(small, (w, h), interpolation=cv2.INTER_LINEAR)
+
+    @functools.cached_property
+    def _effects(self) -> dict:
+        """Effect name -> bound overlay method, built once per renderer."""
+        return {
             "light_leak": self._light_leak,
             "film_grain": self._film_grain,
             "lens_flare": self._lens_flare,
@@ -2664,36 +3566,49 @@ class OverlayRenderer:
             "bloom_glow": self._bloom_glow,
 
         }
-        fn = effects.get(effect)
+
+    def apply(self, frame: np.ndarray, effect: str, t: float) -> np.ndarray:
+        """Apply an overlay effect to the frame."""
+        if effect == "none" or not effect:
+            return frame
+
+        fn = self._effects.get(effect)
         if fn:
             return fn(frame, t)
         return frame
 
     def _light_leak(self, frame: np.ndarray, t: float) -> np.ndarray:
-        overlay = np.zeros_like(frame, dtype=np.float32)
+        # Drawn as int16 fixed point with alpha already folded into the color
+        overlay = np.zeros_like(frame, dtype=np.int16)
         cx = int(self.w * (0.3 + 0.4 * math.sin(t * 0.5)))
         cy = int(self.h * 0.3)
-        color = (255, 200, 100)
-        cv2.circle(overlay, (cx, cy), self.w // 3, color, -1)
-        overlay = cv2.GaussianBlur(overlay, (151, 151), 0)
         alpha = 0.2 + 0.1 * math.sin(t * 2)
-        return np.clip(frame.astype(np.float32) + overlay * alpha, 0, 255).astype(np.uint8)
+        color = tuple(round(c * alpha * _GLOW_ONE) for c in (255, 200, 100))
+        cv2.circle(overlay, (cx, cy), self.w // 3, color, -1)
+        overlay = _box_gaussian(overlay, 151)
+        return cv2.add(frame, cv2.convertScaleAbs(overlay, alpha=1 / _GLOW_ONE))
 
     def _film_grain(self, frame: np.ndarray, t: float) -> np.ndarray:
-        grain = np.random.randint(-15, 15, frame.shape, dtype=np.int16)
-        return np.clip(frame.astype(np.int16) + grain, 0, 255).astype(np.uint8)
+        # Drawn at half size and upscaled like _noise_texture; cv2.add
+        # saturates the int16 grain straight back to uint8
+        grain = np.random.randint(-15, 15, (max(1, self.h // 2), max(1, self.w // 2), 3), dtype=np.int16)
+        grain = cv2.resize(grain, (self.w, self.h), interpolation=cv2.INTER_LINEAR)
+        return cv2.add(frame, grain, dtype=cv2.CV_8U)
 
     def _lens_flare(self, frame: np.ndarray, t: float) -> np.ndarray:
-        overlay = np.zeros_like(frame, dtype=np.float32)
+        # The blur is linear and the rings are concentric, so the summed
+        # discs are drawn largest first at their cumulative intensity into
+        # one int16 fixed-point overlay and blurred once
+        overlay = np.zeros_like(frame, dtype=np.int16)
         fx = int(self.w * (0.5 + 0.4 * math.cos(t * 0.3)))
         fy = int(self.h * (0.3 + 0.1 * math.sin(t * 0.4)))
+        level = 0.0
         for r, intensity in [(120, 0.3), (80, 0.5), (40, 0.8)]:
-            color = (255, 240, 200)
-            sub = np.zeros_like(overlay)
-            cv2.circle(sub, (fx, fy), r, color, -1)
-            sub = cv2.GaussianBlur(sub, (51, 51), 0)
-            overlay += sub * intensity
-        return np.clip(frame.astype(np.float32) + overlay * 0.3, 0, 255).astype(np.uint8)
+            level += intensity
+            color = tuple(round(c * level * 0.3 * _GLOW_ONE) for c in (255, 240, 200))
+            cv2.circle(overlay, (fx, fy), r, color, -1)
+        overlay = _box_gaussian(overlay, 51)
+        return cv2.add(frame, cv2.convertScaleAbs(overlay, alpha=1 / _GLOW_ONE))
 
     def _dust_particles(self, frame: np.ndarray, t: float) -> np.ndarray:
         result = frame.copy()
@@ -2707,10 +3622,7 @@ class OverlayRenderer:
         return result
 
     def _vignette_pulse(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        dx = x_grid - self.w / 2
-        dy = y_grid - self.h / 2
-        dist = np.sqrt(dx**2 + dy**2)
+        dist = self._center_polar()[0]
         max_dist = math.sqrt((self.w/2)**2 + (self.h/2)**2)
         strength = 0.5 + 0.3 * math.sin(t * 1.5)
         vignette = 1 - np.clip((dist / max_dist) ** 2 * strength * 2, 0, 1)
@@ -2750,7 +3662,8 @@ class OverlayRenderer:
         return result
 
     def _prism_rainbow(self, frame: np.ndarray, t: float) -> np.ndarray:
-        overlay = np.zeros_like(frame, dtype=np.float32)
+        overlay = np.zeros_like(frame, dtype=np.int16)
+        alpha = (0.15 + 0.05 * math.sin(t)) * _GLOW_ONE
         for i in range(7):
             hue = i / 7.0
             r, g, b = colorsys.hsv_to_rgb(hue, 0.8, 255)
@@ -2758,47 +3671,42 @@ class OverlayRenderer:
             stripe_h = self.h // 10
             y_start = max(0, y_center - stripe_h // 2)
             y_end = min(self.h, y_center + stripe_h // 2)
-            overlay[y_start:y_end, :] = (b, g, r)
-        overlay = cv2.GaussianBlur(overlay, (51, 51), 0)
-        alpha = 0.15 + 0.05 * math.sin(t)
-        return np.clip(frame.astype(np.float32) + overlay * alpha, 0, 255).astype(np.uint8)
+            overlay[y_start:y_end, :] = (round(b * alpha), round(g * alpha), round(r * alpha))
+        overlay = _box_gaussian(overlay, 51)
+        return cv2.add(frame, cv2.convertScaleAbs(overlay, alpha=1 / _GLOW_ONE))
 
     def _soft_blur_edge(self, frame: np.ndarray, t: float) -> np.ndarray:
-        blurred = cv2.GaussianBlur(frame, (51, 51), 0)
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        dx = (x_grid - self.w / 2) / (self.w / 2)
-        dy = (y_grid - self.h / 2) / (self.h / 2)
+        blurred = self._blur(frame, 51)
+        dx = (self._x_row - self.w / 2) / (self.w / 2)
+        dy = (self._y_col - self.h / 2) / (self.h / 2)
         dist = np.sqrt(dx**2 + dy**2)
         mask = np.clip((dist - 0.5) * 2, 0, 1)[..., np.newaxis]
         return (frame.astype(np.float32) * (1 - mask) + blurred.astype(np.float32) * mask).astype(np.uint8)
 
     def _radial_rays(self, frame: np.ndarray, t: float) -> np.ndarray:
-        overlay = np.zeros((self.h, self.w), dtype=np.float32)
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        angle = np.arctan2(y_grid - self.h/2, x_grid - self.w/2)
-        rays = (np.sin(angle * 12 + t * 2) + 1) / 2.0
-        dist = np.sqrt((x_grid - self.w/2)**2 + (y_grid - self.h/2)**2)
+        dist, angle = self._center_polar()
+        rays = np.sin(angle * 12 + t * 2)
+        rays += 1
+        rays *= 0.5
         dist_norm = dist / max(self.w, self.h)
-        rays *= np.clip(1 - dist_norm, 0, 1) * 0.3
-        result = np.clip(frame.astype(np.float32) + rays[..., np.newaxis] * 100, 0, 255).astype(np.uint8)
-        return result
+        rays *= np.clip(1 - dist_norm, 0, 1, out=dist_norm)
+        return self._add_glow(frame, rays, 0.3 * 100)
 
     def _scan_line(self, frame: np.ndarray, t: float) -> np.ndarray:
         result = frame.copy()
         offset = int(t * 60) % 4
-        result[offset::4, :, :] = (result[offset::4, :, :].astype(np.float32) * 0.7).astype(np.uint8)
+        result[offset::4] = cv2.LUT(result[offset::4], _affine_lut(0.7, 0))
         return result
 
     def _noise_texture(self, frame: np.ndarray, t: float) -> np.ndarray:
         noise = np.random.randint(0, 30, (self.h // 4, self.w // 4), dtype=np.uint8)
-        noise = cv2.resize(noise, (self.w, self.h), interpolation=cv2.INTER_LINEAR)
-        return np.clip(frame.astype(np.int16) + noise[..., np.newaxis].astype(np.int16) - 15, 0, 255).astype(np.uint8)
+        noise = cv2.resize(noise, (self.w, self.h), interpolation=cv2.INTER_LINEAR).astype(np.int16)
+        noise -= 15
+        return cv2.add(frame, cv2.merge([noise, noise, noise]), dtype=cv2.CV_8U)
 
     def _motion_streak(self, frame: np.ndarray, t: float) -> np.ndarray:
-        ksize = 15
-        kernel = np.zeros((ksize, ksize), dtype=np.float32)
-        kernel[ksize // 2, :] = 1.0 / ksize
-        blurred = cv2.filter2D(frame, -1, kernel)
+        # Horizontal 15-tap mean: a 1-D box filter, not a mostly-zero 2-D kernel
+        blurred = cv2.boxFilter(frame, -1, (15, 1))
         alpha = 0.3 + 0.1 * math.sin(t * 2)
         return cv2.addWeighted(frame, 1 - alpha, blurred, alpha, 0)
 
@@ -2816,70 +3724,68 @@ class OverlayRenderer:
             color = (int(200 * bright), int(220 * bright), int(255 * bright))
             cv2.circle(result, (x, y), r, color, -1, cv2.LINE_AA)
             cv2.circle(result, (x, y), r + 4, tuple(int(c * 0.3) for c in color), 2, cv2.LINE_AA)
-        result = cv2.GaussianBlur(result, (3, 3), 0)
+        result = self._blur(result, 3)
         return result
 
     # ── OVERLAY: God Rays ──
     def _god_rays(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
         # Light source position (moves slowly across top)
         src_x = self.w * (0.3 + 0.4 * math.sin(t * 0.3))
         src_y = -self.h * 0.1
-        dx = x_grid - src_x
-        dy = y_grid - src_y
-        angle = np.arctan2(dy, dx)
+        dist, angle = self._polar_from(src_x, src_y)
         # Create ray pattern
         num_rays = 8
-        rays = (np.sin(angle * num_rays + t * 0.5) + 1) / 2.0
-        rays = rays ** 3  # Sharpen rays
+        angle *= num_rays
+        angle += t * 0.5
+        rays = np.sin(angle, out=angle)
+        rays += 1
+        rays *= 0.5
+        np.multiply(rays, rays * rays, out=rays)  # Sharpen rays
         # Fade with distance
-        dist = np.sqrt(dx**2 + dy**2) / max(self.w, self.h)
-        rays *= np.clip(1.0 - dist * 0.5, 0, 1)
-        intensity = rays * 60 * (0.5 + 0.5 * math.sin(t * 0.7))
-        return np.clip(frame.astype(np.float32) + intensity[..., np.newaxis], 0, 255).astype(np.uint8)
+        dist *= -0.5 / max(self.w, self.h)
+        dist += 1.0
+        rays *= np.clip(dist, 0, 1, out=dist)
+        return self._add_glow(frame, rays, 60 * (0.5 + 0.5 * math.sin(t * 0.7)))
 
     # ── OVERLAY: Color Wash ──
     def _color_wash(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        # Sweeping gradient across frame
-        nx = x_grid / self.w
+        # Sweeping gradient across frame, a function of x only
+        nx = self._x_row / self.w
         phase = (nx + t * 0.15) % 1.0
-        # Warm to cool color wash
-        wash = np.zeros((self.h, self.w, 3), dtype=np.float32)
-        wash[:, :, 0] = np.sin(phase * math.pi * 2) * 30 + 10  # Blue channel
-        wash[:, :, 1] = np.sin(phase * math.pi * 2 + 2) * 20   # Green
-        wash[:, :, 2] = np.sin(phase * math.pi * 2 + 4) * 25   # Red
+        # Warm to cool color wash. It is the same down every column, so one
+        # signed int16 row is built and tiled for cv2.add's saturating sum
+        wash = np.empty((1, self.w, 3), dtype=np.float32)
+        wash[..., 0] = np.sin(phase * math.pi * 2) * 30 + 10  # Blue channel
+        wash[..., 1] = np.sin(phase * math.pi * 2 + 2) * 20   # Green
+        wash[..., 2] = np.sin(phase * math.pi * 2 + 4) * 25   # Red
         alpha = 0.25 + 0.1 * math.sin(t * 0.5)
-        return np.clip(frame.astype(np.float32) + wash * alpha, 0, 255).astype(np.uint8)
+        wash = np.rint(wash * alpha).astype(np.int16)
+        return cv2.add(frame, cv2.repeat(wash, self.h, 1), dtype=cv2.CV_8U)
 
     # ── OVERLAY: Kaleidoscope Refract ──
     def _kaleidoscope_overlay(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        cx, cy = self.w / 2, self.h / 2
-        dx = x_grid - cx
-        dy = y_grid - cy
-        angle = np.arctan2(dy, dx)
-        dist = np.sqrt(dx**2 + dy**2)
+        dist, angle = self._center_polar()
         # Prismatic refraction pattern
         segments = 6
         mirror_a = np.abs(((angle + t * 0.3) % (2 * math.pi / segments)) - math.pi / segments)
-        prism = np.sin(mirror_a * 10 + dist * 0.01) * 0.5 + 0.5
-        overlay = np.zeros((self.h, self.w, 3), dtype=np.float32)
-        overlay[:, :, 0] = prism * 15  # Blue tint
-        overlay[:, :, 1] = prism * 10
-        overlay[:, :, 2] = prism * 20  # Red tint
-        return np.clip(frame.astype(np.float32) + overlay, 0, 255).astype(np.uint8)
+        mirror_a *= 10
+        mirror_a += dist * 0.01
+        prism = np.sin(mirror_a, out=mirror_a)
+        prism *= 0.5
+        prism += 0.5
+        # Blue, green and red tints
+        return self._add_glow(frame, prism, (15, 10, 20))
 
     # ── OVERLAY: Heat Haze ──
     def _heat_haze(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        # Heat distortion - shift pixels
+        # Heat distortion - shift pixels. Each shift depends on one axis
+        # only, so the trig runs over a single row or column
         amplitude = 3.0
         freq = 0.02
-        dx_shift = (amplitude * np.sin(y_grid * freq + t * 3)).astype(np.float32)
-        dy_shift = (amplitude * 0.5 * np.cos(x_grid * freq + t * 2.5)).astype(np.float32)
-        map_x = np.clip(x_grid + dx_shift, 0, self.w - 1).astype(np.float32)
-        map_y = np.clip(y_grid + dy_shift, 0, self.h - 1).astype(np.float32)
+        dx_shift = (amplitude * np.sin(self._y_col * freq + t * 3)).astype(np.float32)
+        dy_shift = (amplitude * 0.5 * np.cos(self._x_row * freq + t * 2.5)).astype(np.float32)
+        map_x = np.clip(self._x_row + dx_shift, 0, self.w - 1).astype(np.float32)
+        map_y = np.clip(self._y_col + dy_shift, 0, self.h - 1).astype(np.float32)
         result = cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR)
         return result
 
@@ -2893,7 +3799,7 @@ class OverlayRenderer:
             y = int((np.random.random() * self.h + t * 80 * (0.5 + np.random.random())) % self.h)
             sz = np.random.randint(2, 5)
             cv2.circle(result, (x, y), sz, (255, 255, 255), -1, cv2.LINE_AA)
-        return cv2.GaussianBlur(result, (3, 3), 0)
+        return self._blur(result, 3)
 
     def _rain_drops(self, frame: np.ndarray, t: float) -> np.ndarray:
         result = frame.copy()
@@ -2907,30 +3813,38 @@ class OverlayRenderer:
         return result
 
     def _bubble_float(self, frame: np.ndarray, t: float) -> np.ndarray:
-        overlay = frame.astype(np.float32)
-        np.random.seed(55)
-        for _ in range(20):
-            x = np.random.randint(0, self.w)
-            y = int((1 - ((np.random.random() + t * 0.03 * (0.5 + np.random.random())) % 1.0)) * self.h)
-            r = np.random.randint(8, 25)
-            cv2.circle(overlay, (x, y), r, (255, 255, 255), 1, cv2.LINE_AA)
-            cv2.circle(overlay, (x - r // 3, y - r // 3), r // 4, (255, 255, 255), -1, cv2.LINE_AA)
-        return np.clip(overlay, 0, 255).astype(np.uint8)
+        # Per bubble: x, phase, speed, radius, in the order seed 55 used to draw them
+        xs, phase, speed, radii = self._seeded_params("bubble_float", 55, lambda rng: tuple(
+            np.array(col) for col in zip(*[(rng.randint(0, self.w), rng.random_sample(),
+                                            rng.random_sample(), rng.randint(8, 25))
+                                           for _ in range(20)])))
+        ys = ((1 - ((phase + t * 0.03 * (0.5 + speed)) % 1.0)) * self.h).astype(int)
+        # Drawn on uint8 with LINE_8: OpenCV only antialiases 8-bit images, so
+        # the float32 canvas this used to draw on got LINE_8 edges anyway
+        overlay = frame.copy()
+        for x, y, r in zip(xs.tolist(), ys.tolist(), radii.tolist()):
+            cv2.circle(overlay, (x, y), r, (255, 255, 255), 1, cv2.LINE_8)
+            cv2.circle(overlay, (x - r // 3, y - r // 3), r // 4, (255, 255, 255), -1, cv2.LINE_8)
+        return overlay
 
     def _confetti(self, frame: np.ndarray, t: float) -> np.ndarray:
         result = frame.copy()
-        np.random.seed(99)
         colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255), (255, 255, 100), (255, 100, 255)]
-        for _ in range(50):
-            x = np.random.randint(0, self.w)
-            y = int((np.random.random() * self.h + t * 60 * (0.3 + np.random.random())) % self.h)
-            w_c, h_c = np.random.randint(3, 8), np.random.randint(3, 8)
-            color = colors[np.random.randint(0, len(colors))]
-            cv2.rectangle(result, (x, y), (x + w_c, y + h_c), color, -1)
+        # Per piece: x, start, speed, width, height, color, in seed 99's draw order
+        xs, start, speed, widths, heights, color_idx = self._seeded_params("confetti", 99, lambda rng: tuple(
+            np.array(col) for col in zip(*[(rng.randint(0, self.w), rng.random_sample(), rng.random_sample(),
+                                            rng.randint(3, 8), rng.randint(3, 8), rng.randint(0, len(colors)))
+                                           for _ in range(50)])))
+        ys = ((start * self.h + t * 60 * (0.3 + speed)) % self.h).astype(int)
+        for x, y, w_c, h_c, c in zip(xs.tolist(), ys.tolist(), widths.tolist(), heights.tolist(),
+                                     color_idx.tolist()):
+            cv2.rectangle(result, (x, y), (x + w_c, y + h_c), colors[c], -1)
         return result
 
     def _golden_dust(self, frame: np.ndarray, t: float) -> np.ndarray:
-        overlay = frame.astype(np.float32)
+        # The size draw only happens for lit specks, so the draw sequence
+        # depends on t and stays per frame; the dust is drawn straight onto uint8
+        overlay = frame.copy()
         np.random.seed(33)
         for _ in range(80):
             x = np.random.randint(0, self.w)
@@ -2939,16 +3853,19 @@ class OverlayRenderer:
             if brightness > 0.3:
                 sz = np.random.randint(1, 3)
                 cv2.circle(overlay, (x, y), sz, (255 * brightness, 220 * brightness, 100 * brightness), -1)
-        return np.clip(overlay, 0, 255).astype(np.uint8)
+        return overlay
 
     def _fog_drift(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        nx = x_grid / self.w * 3  + t * 0.2
-        ny = y_grid / self.h * 2
-        fog = np.sin(nx * 2 + ny) * 0.3 + np.cos(nx + ny * 1.5 + t * 0.3) * 0.2 + 0.5
-        fog = np.clip(fog, 0, 1) * 0.25
-        fog_layer = (fog * 255)[..., np.newaxis]
-        return np.clip(frame.astype(np.float32) + fog_layer, 0, 255).astype(np.uint8)
+        # sin(nx * 2 + ny) * 0.3 + cos(nx + ny * 1.5 + t * 0.3) * 0.2 + 0.5
+        # with nx = x / w * 3 + t * 0.2 and ny = y / h * 2, split into x and y terms
+        xs = np.arange(self.w) / self.w
+        ys = np.arange(self.h) / self.h
+        ax, ay = xs * 6 + t * 0.4, ys * 2
+        bx, by = xs * 3 + t * 0.5, ys * 3
+        fog = _separable_sum(
+            [np.cos(ay), np.sin(ay), np.cos(by), np.sin(by), np.ones(self.h)],
+            [np.sin(ax) * 0.3, np.cos(ax) * 0.3, np.cos(bx) * 0.2, np.sin(bx) * -0.2, np.full(self.w, 0.5)])
+        return self._add_glow(frame, np.clip(fog, 0, 1, out=fog), 0.25 * 255)
 
     def _light_rays_top(self, frame: np.ndarray, t: float) -> np.ndarray:
         overlay = np.zeros((self.h, self.w), dtype=np.float32)
@@ -2959,54 +3876,61 @@ class OverlayRenderer:
             ray = np.exp(-((x_grid - cx) / spread) ** 2)
             overlay += ray[np.newaxis, :] * (0.15 + 0.05 * math.sin(t * 2 + i * 1.5))
         fade = np.linspace(1, 0, self.h, dtype=np.float32)[:, np.newaxis]
-        overlay = overlay * fade
-        return np.clip(frame.astype(np.float32) + overlay[..., np.newaxis] * 180, 0, 255).astype(np.uint8)
+        overlay *= fade
+        return self._add_glow(frame, overlay, 180)
 
     def _halftone(self, frame: np.ndarray, t: float) -> np.ndarray:
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY).astype(np.float32) / 255.0
         spacing = max(6, int(min(self.w, self.h) * 0.008))
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w]
-        dot = np.sin(x_grid * math.pi / spacing) * np.sin(y_grid * math.pi / spacing)
+        dot = (np.sin(np.arange(self.w) * math.pi / spacing)[np.newaxis, :] *
+               np.sin(np.arange(self.h) * math.pi / spacing)[:, np.newaxis])
         threshold = gray * 0.8 + 0.1
         pattern = (dot > (1 - threshold * 2)).astype(np.float32)
         return np.clip(frame.astype(np.float32) * (0.7 + pattern[..., np.newaxis] * 0.3), 0, 255).astype(np.uint8)
 
     def _cross_hatch(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
         spacing = 8
-        line1 = np.abs(np.sin((x_grid + y_grid + t * 20) * math.pi / spacing))
-        line2 = np.abs(np.sin((x_grid - y_grid + t * 15) * math.pi / spacing))
-        hatch = np.minimum(line1, line2)
-        hatch = np.clip(hatch * 2, 0, 1)
-        return np.clip(frame.astype(np.float32) * (0.6 + hatch[..., np.newaxis] * 0.4), 0, 255).astype(np.uint8)
+        k = math.pi / spacing
+        # sin(k * (x + y + 20t)) and sin(k * (x - y + 15t)), split into x and y terms
+        ax = (np.arange(self.w) + t * 20) * k
+        bx = (np.arange(self.w) + t * 15) * k
+        sy, cy = np.sin(np.arange(self.h) * k), np.cos(np.arange(self.h) * k)
+        line1 = np.abs(_separable_sum([cy, sy], [np.sin(ax), np.cos(ax)]))
+        line2 = np.abs(_separable_sum([cy, sy], [np.sin(bx), -np.cos(bx)]))
+        hatch = np.minimum(line1, line2, out=line1)
+        hatch *= 2
+        np.clip(hatch, 0, 1, out=hatch)
+        hatch *= 0.4
+        hatch += 0.6
+        return (frame * hatch[..., np.newaxis]).astype(np.uint8)
 
     def _light_streak(self, frame: np.ndarray, t: float) -> np.ndarray:
         overlay = np.zeros((self.h, self.w), dtype=np.float32)
+        diag = self._x_row + self._y_col
         for i in range(3):
             offset = (t * 100 + i * self.w // 3) % (self.w + self.h)
-            y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-            dist = np.abs(x_grid + y_grid - offset)
+            dist = np.abs(diag - offset)
             streak = np.exp(-(dist / 30) ** 2) * (0.2 + 0.1 * math.sin(t * 3 + i))
             overlay += streak
-        return np.clip(frame.astype(np.float32) + overlay[..., np.newaxis] * 200, 0, 255).astype(np.uint8)
+        return self._add_glow(frame, overlay, 200)
 
     def _edge_glow(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        dx = np.minimum(x_grid, self.w - 1 - x_grid) / self.w
-        dy = np.minimum(y_grid, self.h - 1 - y_grid) / self.h
+        dx = np.minimum(self._x_row, self.w - 1 - self._x_row) / self.w
+        dy = np.minimum(self._y_col, self.h - 1 - self._y_col) / self.h
         edge = 1 - np.minimum(dx, dy) * 10
         edge = np.clip(edge, 0, 1) * (0.3 + 0.15 * math.sin(t * 2))
         phase = t * 0.5
-        color = np.array([math.sin(phase) * 0.5 + 0.5, math.sin(phase + 2) * 0.5 + 0.5, math.sin(phase + 4) * 0.5 + 0.5])
-        return np.clip(frame.astype(np.float32) + edge[..., np.newaxis] * color * 200, 0, 255).astype(np.uint8)
+        color = [math.sin(phase) * 0.5 + 0.5, math.sin(phase + 2) * 0.5 + 0.5, math.sin(phase + 4) * 0.5 + 0.5]
+        return self._add_glow(frame, edge, [c * 200 for c in color])
 
     def _wave_distort(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        dx_shift = (4 * np.sin(y_grid * 0.03 + t * 2)).astype(np.float32)
-        dy_shift = (4 * np.cos(x_grid * 0.03 + t * 1.5)).astype(np.float32)
-        map_x = np.clip(x_grid + dx_shift, 0, self.w - 1).astype(np.float32)
-        map_y = np.clip(y_grid + dy_shift, 0, self.h - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR)
+        dx_shift = np.sin(self._y_col * 0.03 + t * 2) * 4
+        dy_shift = np.cos(self._x_row * 0.03 + t * 1.5) * 4
+        map_x, map_y = self._remap_maps()
+        np.add(self._x_row, dx_shift, out=map_x)
+        np.add(self._y_col, dy_shift, out=map_y)
+        # Replicating the border samples the same edge pixels clipping the maps did
+        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
 
     def _color_split(self, frame: np.ndarray, t: float) -> np.ndarray:
         shift = int(4 + 3 * math.sin(t * 2))
@@ -3016,16 +3940,15 @@ class OverlayRenderer:
         return result
 
     def _vintage_fade(self, frame: np.ndarray, t: float) -> np.ndarray:
-        tint = np.array([20, 10, -10], dtype=np.float32)
+        tint = (20, 10, -10)
         fade = 0.85 + 0.05 * math.sin(t * 0.5)
-        result = frame.astype(np.float32) * fade + tint + 15
-        return np.clip(result, 0, 255).astype(np.uint8)
+        return cv2.LUT(frame, _affine_lut3(fade, [c + 15 for c in tint]))
 
     def _shimmer(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        shimmer = np.sin(x_grid * 0.05 + t * 5) * np.cos(y_grid * 0.05 + t * 3) * 0.5 + 0.5
-        bright = np.clip((shimmer - 0.8) * 10, 0, 1) * 80
-        return np.clip(frame.astype(np.float32) + bright[..., np.newaxis], 0, 255).astype(np.uint8)
+        # (s * c * 0.5 + 0.5 - 0.8) * 10 with the constants folded into the row
+        bright = (np.sin(self._x_row * 0.05 + t * 5) * 5) * np.cos(self._y_col * 0.05 + t * 3)
+        bright -= 3
+        return self._add_glow(frame, np.clip(bright, 0, 1, out=bright), 80)
 
     def _gradient_wipe(self, frame: np.ndarray, t: float) -> np.ndarray:
         x_grid = np.arange(self.w, dtype=np.float32) / self.w
@@ -3041,76 +3964,83 @@ class OverlayRenderer:
             thickness = np.random.randint(1, 3)
             alpha = 0.1 + np.random.random() * 0.15
             overlay[y:y + thickness, :] = alpha
-        return np.clip(frame.astype(np.float32) + overlay[..., np.newaxis] * 200, 0, 255).astype(np.uint8)
+        return self._add_glow(frame, overlay, 200)
 
     def _ripple_overlay(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        cx, cy = self.w / 2, self.h / 2
-        dist = np.sqrt((x_grid - cx)**2 + (y_grid - cy)**2)
-        ripple = np.sin(dist * 0.05 - t * 4) * 4
-        map_x = np.clip(x_grid + ripple, 0, self.w - 1).astype(np.float32)
-        map_y = np.clip(y_grid + ripple * 0.5, 0, self.h - 1).astype(np.float32)
-        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR)
+        dist = self._center_polar()[0]
+        ripple = dist * np.float32(0.05)
+        ripple -= np.float32(t * 4)
+        np.sin(ripple, out=ripple)
+        ripple *= 4
+        map_x, map_y = self._remap_maps()
+        np.add(self._x_row, ripple, out=map_x)
+        ripple *= 0.5
+        np.add(self._y_col, ripple, out=map_y)
+        return cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
 
     def _star_field(self, frame: np.ndarray, t: float) -> np.ndarray:
         result = frame.copy()
-        np.random.seed(44)
-        for _ in range(100):
-            x = np.random.randint(0, self.w)
-            y = np.random.randint(0, self.h)
-            brightness = 0.5 + 0.5 * math.sin(t * 4 + np.random.random() * 20)
-            if brightness > 0.5:
-                sz = 1 if brightness < 0.7 else 2
-                val = int(180 + brightness * 75)
-                cv2.circle(result, (x, y), sz, (val, val, val), -1)
+        xs, ys, phase = self._seeded_params("star_field", 44, lambda rng: tuple(
+            np.array(col) for col in zip(*[(rng.randint(0, self.w), rng.randint(0, self.h), rng.random_sample())
+                                           for _ in range(100)])))
+        brightness = 0.5 + 0.5 * np.sin(t * 4 + phase * 20)
+        lit = brightness > 0.5
+        sizes = np.where(brightness < 0.7, 1, 2)
+        vals = (180 + brightness * 75).astype(int)
+        for x, y, sz, val in zip(xs[lit].tolist(), ys[lit].tolist(), sizes[lit].tolist(), vals[lit].tolist()):
+            cv2.circle(result, (x, y), sz, (val, val, val), -1)
         return result
 
     def _smoke_wisp(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        nx = x_grid / self.w * 3 + t * 0.1
-        ny = y_grid / self.h * 3
-        wisp = np.sin(nx * 3 + ny * 2 + t * 0.5) * np.cos(nx + ny * 3 - t * 0.3) * 0.5 + 0.5
-        wisp = np.clip(wisp - 0.5, 0, 0.5) * 0.3
-        return np.clip(frame.astype(np.float32) + wisp[..., np.newaxis] * 200, 0, 255).astype(np.uint8)
+        # sin(nx * 3 + ny * 2 + t * 0.5) * cos(nx + ny * 3 - t * 0.3) * 0.5 with
+        # nx = x / w * 3 + t * 0.1 and ny = y / h * 3 expands into four x * y terms
+        xs = np.arange(self.w) / self.w
+        ys = np.arange(self.h) / self.h
+        sa, ca = np.sin(xs * 9 + t * 0.8), np.cos(xs * 9 + t * 0.8)
+        sb, cb = np.sin(xs * 3 - t * 0.2), np.cos(xs * 3 - t * 0.2)
+        say, cay = np.sin(ys * 6), np.cos(ys * 6)
+        sby, cby = np.sin(ys * 9), np.cos(ys * 9)
+        wisp = _separable_sum(
+            [cay * cby, cay * sby, say * cby, say * sby],
+            [sa * cb * 0.5, sa * sb * -0.5, ca * cb * 0.5, ca * sb * -0.5])
+        wisp = np.clip(wisp, 0, 0.5, out=wisp)
+        return self._add_glow(frame, wisp, 0.3 * 200)
 
     def _pulse_ring(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid, x_grid = np.mgrid[0:self.h, 0:self.w].astype(np.float32)
-        cx, cy = self.w / 2, self.h / 2
-        dist = np.sqrt((x_grid - cx)**2 + (y_grid - cy)**2)
+        dist = self._center_polar()[0]
         ring_r = (t * 100) % max(self.w, self.h)
-        ring = np.exp(-((dist - ring_r) / 15) ** 2) * 0.4
-        return np.clip(frame.astype(np.float32) + ring[..., np.newaxis] * 200, 0, 255).astype(np.uint8)
+        ring = dist - np.float32(ring_r)
+        ring *= ring
+        ring *= np.float32(-1 / 225)
+        return self._add_glow(frame, np.exp(ring, out=ring), 0.4 * 200)
 
     def _diamond_sparkle(self, frame: np.ndarray, t: float) -> np.ndarray:
         result = frame.copy()
-        np.random.seed(77)
-        for _ in range(30):
-            x = np.random.randint(0, self.w)
-            y = np.random.randint(0, self.h)
-            brightness = 0.5 + 0.5 * math.sin(t * 6 + np.random.random() * 15)
-            if brightness > 0.7:
-                sz = int(3 + brightness * 4)
-                val = int(200 + brightness * 55)
-                cv2.drawMarker(result, (x, y), (val, val, val), cv2.MARKER_DIAMOND, sz, 1)
+        xs, ys, phase = self._seeded_params("diamond_sparkle", 77, lambda rng: tuple(
+            np.array(col) for col in zip(*[(rng.randint(0, self.w), rng.randint(0, self.h), rng.random_sample())
+                                           for _ in range(30)])))
+        brightness = 0.5 + 0.5 * np.sin(t * 6 + phase * 15)
+        lit = brightness > 0.7
+        sizes = (3 + brightness * 4).astype(int)
+        vals = (200 + brightness * 55).astype(int)
+        for x, y, sz, val in zip(xs[lit].tolist(), ys[lit].tolist(), sizes[lit].tolist(), vals[lit].tolist()):
+            cv2.drawMarker(result, (x, y), (val, val, val), cv2.MARKER_DIAMOND, sz, 1)
         return result
 
     def _neon_edge(self, frame: np.ndarray, t: float) -> np.ndarray:
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         edges = cv2.Canny(gray, 50, 150)
-        edges = cv2.GaussianBlur(edges, (5, 5), 0)
+        edges = self._blur(edges, 5)
         phase = t * 0.8
         color = np.array([math.sin(phase) * 0.5 + 0.5, math.sin(phase + 2) * 0.5 + 0.5, math.sin(phase + 4) * 0.5 + 0.5])
         edge_color = edges.astype(np.float32)[..., np.newaxis] * color * 0.8
         return np.clip(frame.astype(np.float32) + edge_color, 0, 255).astype(np.uint8)
 
     def _color_overlay(self, frame: np.ndarray, t: float) -> np.ndarray:
-        y_grid = np.arange(self.h, dtype=np.float32) / self.h
-        x_grid = np.arange(self.w, dtype=np.float32) / self.w
-        r = (np.sin(t * 0.3) * 0.5 + 0.5) * 40
-        g = (np.sin(t * 0.3 + 2) * 0.5 + 0.5) * 40
-        b = (np.sin(t * 0.3 + 4) * 0.5 + 0.5) * 40
-        tint = np.array([r, g, b], dtype=np.float32)
-        return np.clip(frame.astype(np.float32) + tint, 0, 255).astype(np.uint8)
+        r = (math.sin(t * 0.3) * 0.5 + 0.5) * 40
+        g = (math.sin(t * 0.3 + 2) * 0.5 + 0.5) * 40
+        b = (math.sin(t * 0.3 + 4) * 0.5 + 0.5) * 40
+        return cv2.LUT(frame, _affine_lut3(1, (r, g, b)))
 
     def _grid_overlay(self, frame: np.ndarray, t: float) -> np.ndarray:
         result = frame.copy()
@@ -3124,9 +4054,9 @@ class OverlayRenderer:
         return cv2.addWeighted(frame, 0.9, result, 0.1, 0)
 
     def _bloom_glow(self, frame: np.ndarray, t: float) -> np.ndarray:
-        bright = cv2.GaussianBlur(frame, (51, 51), 0)
+        bright = self._blur_half(frame, 51)
         alpha = 0.25 + 0.1 * math.sin(t * 2)
-        return np.clip(frame.astype(np.float32) + bright.astype(np.float32) * alpha, 0, 255).astype(np.uint8)
+        return cv2.addWeighted(frame, 1.0, bright, alpha, 0)
 
     def _anamorphic_flare(self, frame: np.ndarray, t: float) -> np.ndarray:
         """Cinematic horizontal lens flare streak."""
@@ -3149,32 +4079,33 @@ class OverlayRenderer:
         cx = int(w * (0.3 + 0.4 * math.sin(t * 0.3)))
         cv2.circle(overlay, (cx, cy), int(w * 0.05),
                    (255 * intensity, 240 * intensity, 200 * intensity), -1)
-        overlay = cv2.GaussianBlur(overlay, (31, 3), 0)
+        overlay = self._blur(overlay, 31, 3)
         return np.clip(frame.astype(np.float32) + overlay, 0, 255).astype(np.uint8)
 
     def _floating_embers(self, frame: np.ndarray, t: float) -> np.ndarray:
         """Glowing ember particles rising gently."""
         h, w = frame.shape[:2]
         result = frame.copy()
-        rng = np.random.RandomState(88)
         n = 60
-        base_x = rng.rand(n)
-        base_speed = rng.rand(n) * 0.2 + 0.05
-        base_size = (rng.rand(n) * 2 + 1).astype(int)
-        base_brightness = rng.rand(n) * 0.5 + 0.5
-
-        for i in range(n):
-            x = int((base_x[i] + math.sin(t * 0.5 + i * 0.7) * 0.03) * w) % w
-            y = int((1.0 - ((t * base_speed[i] + i * 0.08) % 1.3)) * h)
-            if y < -5 or y > h + 5:
-                continue
-            r = base_size[i]
-            b = base_brightness[i] * (0.6 + 0.4 * math.sin(t * 3 + i))
-            # Warm ember color (orange-yellow)
-            color = (int(255 * b), int(180 * b), int(50 * b))
+        base_x, base_speed, base_size, base_brightness = self._seeded_params(
+            "floating_embers", 88, lambda rng: (
+                rng.rand(n),
+                rng.rand(n) * 0.2 + 0.05,
+                (rng.rand(n) * 2 + 1).astype(int),
+                rng.rand(n) * 0.5 + 0.5))
+
+        idx = np.arange(n)
+        xs = ((base_x + np.sin(t * 0.5 + idx * 0.7) * 0.03) * w).astype(int) % w
+        ys = ((1.0 - ((t * base_speed + idx * 0.08) % 1.3)) * h).astype(int)
+        b = base_brightness * (0.6 + 0.4 * np.sin(t * 3 + idx))
+        # Warm ember color (orange-yellow) and its soft glow
+        colors = (b[:, np.newaxis] * [255, 180, 50]).astype(int)
+        glows = (b[:, np.newaxis] * [80, 40, 10]).astype(int)
+        visible = (ys >= -5) & (ys <= h + 5)
+        for x, y, r, color, glow in zip(xs[visible].tolist(), ys[visible].tolist(), base_size[visible].tolist(),
+                                        colors[visible].tolist(), glows[visible].tolist()):
             cv2.circle(result, (x, y), r, color, -1, cv2.LINE_AA)
-            # Soft glow
-            cv2.circle(result, (x, y), r * 3, (int(80 * b), int(40 * b), int(10 * b)), -1, cv2.LINE_AA)
+            cv2.circle(result, (x, y), r * 3, glow, -1, cv2.LINE_AA)
 
         return result
 
@@ -3182,20 +4113,23 @@ class OverlayRenderer:
         """Subtle dust particles visible on camera lens."""
         h, w = frame.shape[:2]
         result = frame.copy()
-        rng = np.random.RandomState(44)
         n = 80
-        xs = (rng.rand(n) * w).astype(int)
-        ys = (rng.rand(n) * h).astype(int)
-        sizes = (rng.rand(n) * 3 + 1).astype(int)
-        brightness = rng.rand(n) * 0.15 + 0.05
-
-        for i in range(n):
-            b = brightness[i] * (0.7 + 0.3 * math.sin(t * 0.5 + i * 0.3))
-            color = (int(255 * b), int(255 * b), int(240 * b))
-            cv2.circle(result, (xs[i], ys[i]), sizes[i], color, -1, cv2.LINE_AA)
+        # Positions are stored as fractions so the cached draws fit any frame size
+        fx, fy, sizes, brightness = self._seeded_params(
+            "lens_dust", 44, lambda rng: (
+                rng.rand(n),
+                rng.rand(n),
+                (rng.rand(n) * 3 + 1).astype(int),
+                rng.rand(n) * 0.15 + 0.05))
+        xs = (fx * w).astype(int)
+        ys = (fy * h).astype(int)
+        b = brightness * (0.7 + 0.3 * np.sin(t * 0.5 + np.arange(n) * 0.3))
+        colors = (b[:, np.newaxis] * [255, 255, 240]).astype(int)
+        for x, y, r, color in zip(xs.tolist(), ys.tolist(), sizes.tolist(), colors.tolist()):
+            cv2.circle(result, (x, y), r, color, -1, cv2.LINE_AA)
 
         # Subtle overall haze
-        bright = cv2.GaussianBlur(result, (21, 21), 0)
+        bright = self._blur_half(result, 21)
         haze = 0.03 + 0.02 * math.sin(t * 0.3)
         return np.clip(result.astype(np.float32) * (1 - haze) + bright.astype(np.float32) * haze, 0, 255).astype(np.uint8)
 
@@ -3203,24 +4137,24 @@ class OverlayRenderer:
         """Gentle glowing orbs floating dreamily."""
         h, w = frame.shape[:2]
         overlay = np.zeros((h, w, 3), dtype=np.float32)
-        rng = np.random.RandomState(66)
         n = 15
-        base_x = rng.rand(n)
-        base_y = rng.rand(n)
-        base_r = (rng.rand(n) * 60 + 20).astype(int)
-        base_alpha = rng.rand(n) * 0.15 + 0.05
-
-        for i in range(n):
-            x = int((base_x[i] + math.sin(t * 0.2 + i * 1.2) * 0.06) * w)
-            y = int((base_y[i] + math.cos(t * 0.15 + i * 0.9) * 0.05) * h)
-            r = base_r[i]
-            pulse = 0.6 + 0.4 * math.sin(t * 0.8 + i * 1.5)
-            alpha = base_alpha[i] * pulse
-            # Warm soft white-yellow
-            color = (255 * alpha, 240 * alpha, 200 * alpha)
+        base_x, base_y, base_r, base_alpha = self._seeded_params(
+            "soft_light_orbs", 66, lambda rng: (
+                rng.rand(n),
+                rng.rand(n),
+                (rng.rand(n) * 60 + 20).astype(int),
+                rng.rand(n) * 0.15 + 0.05))
+
+        idx = np.arange(n)
+        xs = ((base_x + np.sin(t * 0.2 + idx * 1.2) * 0.06) * w).astype(int)
+        ys = ((base_y + np.cos(t * 0.15 + idx * 0.9) * 0.05) * h).astype(int)
+        alpha = base_alpha * (0.6 + 0.4 * np.sin(t * 0.8 + idx * 1.5))
+        # Warm soft white-yellow
+        colors = alpha[:, np.newaxis] * [255, 240, 200]
+        for x, y, r, color in zip(xs.tolist(), ys.tolist(), base_r.tolist(), colors.tolist()):
             cv2.circle(overlay, (x, y), r, color, -1, cv2.LINE_AA)
 
-        overlay = cv2.GaussianBlur(overlay, (31, 31), 0)
+        overlay = self._blur(overlay, 31)
         return np.clip(frame.astype(np.float32) + overlay, 0, 255).astype(np.uint8)
 
     def _film_burn(self, frame: np.ndarray, t: float) -> np.ndarray:
@@ -3234,14 +4168,17 @@ class OverlayRenderer:
         intensity = 0.3 + 0.2 * math.sin(t * 1.5)
         # Elliptical burn shape
         rx, ry = int(w * 0.3), int(h * 0.5)
-        y_grid, x_grid = np.mgrid[0:h, 0:w]
-        dist = ((x_grid - cx) / max(rx, 1)) ** 2 + ((y_grid - cy) / max(ry, 1)) ** 2
+        # The ellipse is separable: a (1, W) and an (H, 1) term broadcast
+        # together replace the full int64 mgrid
+        dx = (np.arange(w, dtype=np.float32)[np.newaxis, :] - cx) / max(rx, 1)
+        dy = (np.arange(h, dtype=np.float32)[:, np.newaxis] - cy) / max(ry, 1)
+        dist = dx * dx + dy * dy
         burn = np.clip(1.0 - dist, 0, 1) * intensity
         # Warm burn tint
         overlay[:, :, 0] = burn * 255  # R
         overlay[:, :, 1] = burn * 180  # G
         overlay[:, :, 2] = burn * 80   # B
-        overlay = cv2.GaussianBlur(overlay, (51, 51), 0)
+        overlay = _box_gaussian(overlay, 51)
         return np.clip(frame.astype(np.float32) + overlay, 0, 255).astype(np.uint8)
 
     def _pixel_scatter(self, frame: np.ndarray, t: float) -> np.ndarray:
@@ -3261,16 +4198,17 @@ class OverlayRenderer:
         result = frame.copy()
         border = max(5, int(min(self.w, self.h) * 0.02))
         alpha = 0.6 + 0.2 * math.sin(t * 1.5)
-        result[:border, :] = np.clip(result[:border, :].astype(np.float32) * (1 - alpha) + alpha * 255, 0, 255).astype(np.uint8)
-        result[-border:, :] = np.clip(result[-border:, :].astype(np.float32) * (1 - alpha) + alpha * 255, 0, 255).astype(np.uint8)
-        result[:, :border] = np.clip(result[:, :border].astype(np.float32) * (1 - alpha) + alpha * 255, 0, 255).astype(np.uint8)
-        result[:, -border:] = np.clip(result[:, -border:].astype(np.float32) * (1 - alpha) + alpha * 255, 0, 255).astype(np.uint8)
+        lut = _affine_lut(1 - alpha, alpha * 255)
+        result[:border, :] = cv2.LUT(result[:border, :], lut)
+        result[-border:, :] = cv2.LUT(result[-border:, :], lut)
+        result[:, :border] = cv2.LUT(result[:, :border], lut)
+        result[:, -border:] = cv2.LUT(result[:, -border:], lut)
         return result
 
     def _lightning_flash(self, frame: np.ndarray, t: float) -> np.ndarray:
         flash = math.sin(t * 8) ** 20
         if flash > 0.3:
-            return np.clip(frame.astype(np.float32) + flash * 120, 0, 255).astype(np.uint8)
+            return cv2.LUT(frame, _affine_lut(1, flash * 120))
         return frame
 
     def _zoom_pulse(self, frame: np.ndarray, t: float) -> np.ndarray:
@@ -3309,6 +4247,9 @@ class AbstractVideoGenerator:
         self._stop_event = threading.Event()
         self._generating = False
         self._thread = None
+        # Live preview: renderers are kept until the size or palette changes
+        self._preview_key = None
+        self._preview_renderers = None
 
     @property
     def is_generating(self) -> bool:
@@ -3339,12 +4280,17 @@ class AbstractVideoGenerator:
             preview_h = int(h * ratio)
 
         rgb_colors = [hex_to_rgb(c) for c in colors]
-        renderer = AbstractVideoRenderer(preview_w, preview_h, rgb_colors)
-        overlay_renderer = OverlayRenderer(preview_w, preview_h)
+        key = (preview_w, preview_h, tuple(rgb_colors))
+        if key != self._preview_key:
+            self._preview_key = key
+            self._preview_renderers = (
+                AbstractVideoRenderer(preview_w, preview_h, rgb_colors),
+                OverlayRenderer(preview_w, preview_h),
+            )
 
+        renderer, overlay_renderer = self._preview_renderers
         frame = renderer.render_frame(pattern, t)
-        frame = overlay_renderer.apply(frame, overlay, t)
-        return frame
+        return overlay_renderer.apply(frame, overlay, t)
 
     def generate_video(
         self,
@@ -3572,7 +4518,8 @@ class AbstractVideoGenerator:
         stderr_thread.start()
 
         # ── Multi-threaded frame rendering pipeline ──
-        num_workers = max(2, min(os.cpu_count() or 4, 6))
+        # One core is left for the in-order writer below and FFmpeg itself
+        num_workers = max(2, min((os.cpu_count() or 4) - 1, 6))
         frame_queue = Queue(maxsize=num_workers * 2)
         task_queue = Queue()
         render_error = [None]
@@ -3580,6 +4527,7 @@ class AbstractVideoGenerator:
         def _render_worker(w_renderer, w_overlay):
             """Worker that renders frames and puts them in the output queue."""
             try:
+                render = w_renderer.compile_for(pattern)
                 while True:
                     task = task_queue.get()
                     if task is None:
@@ -3588,13 +4536,18 @@ class AbstractVideoGenerator:
                     if self._stop_event.is_set():
                         frame_queue.put((frame_idx, None))
                         continue
-                    frame = w_renderer.render_frame(pattern, t_val)
+                    frame = render(t_val)
                     frame = w_overlay.apply(frame, overlay, t_val)
                     frame_queue.put((frame_idx, frame))
             except Exception as e:
                 render_error[0] = e
                 frame_queue.put((-1, None))
 
+        # The workers already keep the cores busy; OpenCV's own thread pool
+        # on top of them just oversubscribes the CPU during the render
+        cv2_threads = cv2.getNumThreads()
+        cv2.setNumThreads(1)
+
         # Create per-worker renderers (each needs own coordinate grids)
         workers = []
         for _ in range(num_workers):
@@ -3642,7 +4595,9 @@ class AbstractVideoGenerator:
                 while next_frame in pending:
                     f = pending.pop(next_frame)
                     try:
-                        proc.stdin.write(f.tobytes())
+                        # Hand the frame's own buffer to the pipe; tobytes()
+                        # would copy every frame once more before writing
+                        proc.stdin.write(np.ascontiguousarray(f, dtype=np.uint8).data)
                     except (BrokenPipeError, OSError):
                         self._stop_event.set()
                         break
@@ -3701,6 +4656,7 @@ class AbstractVideoGenerator:
                 pass
             raise
         finally:
+            cv2.setNumThreads(cv2_threads)
             for closeable in (proc.stdin, proc.stdout, proc.stderr):
                 try:
                     if closeable:
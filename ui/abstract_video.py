@@ -144,7 +144,7 @@ class AbstractVideoMixin:
         self._av_lbl(parent, "🎨  Background Pattern")
 
         pattern_keys = list(BACKGROUND_PATTERNS.keys())
-        pattern_display = [f"{BACKGROUND_PATTERNS[k]['icon']} {BACKGROUND_PATTERNS[k]['name']}" for k in pattern_keys]
+        pattern_display = [f"{BACKGROUND_PATTERNS[k].icon} {BACKGROUND_PATTERNS[k].name}" for k in pattern_keys]
         self._av_pattern_keys = pattern_keys
         self._av_pattern_display = pattern_display
         self.av_pattern_var = ctk.StringVar(value=pattern_display[0])
@@ -161,7 +161,7 @@ class AbstractVideoMixin:
 
         # Pattern description
         self._av_pattern_desc = ctk.CTkLabel(
-            parent, text=BACKGROUND_PATTERNS[pattern_keys[0]]["desc"],
+            parent, text=BACKGROUND_PATTERNS[pattern_keys[0]].desc,
             font=ctk.CTkFont(size=9), text_color=COLORS["text_muted"],
             wraplength=280, justify="left"
         )
@@ -176,7 +176,7 @@ class AbstractVideoMixin:
         self._av_lbl(parent, "✨  Overlay Effect")
 
         overlay_keys = list(OVERLAY_EFFECTS.keys())
-        overlay_display = [f"{OVERLAY_EFFECTS[k]['icon']} {OVERLAY_EFFECTS[k]['name']}" for k in overlay_keys]
+        overlay_display = [f"{OVERLAY_EFFECTS[k].icon} {OVERLAY_EFFECTS[k].name}" for k in overlay_keys]
         self._av_overlay_keys = overlay_keys
         self._av_overlay_display = overlay_display
         self.av_overlay_var = ctk.StringVar(value=overlay_display[0])
@@ -193,7 +193,7 @@ class AbstractVideoMixin:
 
         # Overlay description
         self._av_overlay_desc = ctk.CTkLabel(
-            parent, text=OVERLAY_EFFECTS[overlay_keys[0]]["desc"],
+            parent, text=OVERLAY_EFFECTS[overlay_keys[0]].desc,
             font=ctk.CTkFont(size=9), text_color=COLORS["text_muted"],
             wraplength=280, justify="left"
         )
@@ -736,23 +736,23 @@ class AbstractVideoMixin:
     def _av_on_pattern_change(self, *args):
         display = self.av_pattern_var.get()
         for key, info in BACKGROUND_PATTERNS.items():
-            full = f"{info['icon']} {info['name']}"
+            full = f"{info.icon} {info.name}"
             if full == display:
-                self._av_pattern_desc.configure(text=info["desc"])
+                self._av_pattern_desc.configure(text=info.desc)
                 break
 
     def _av_on_overlay_change(self, *args):
         display = self.av_overlay_var.get()
         for key, info in OVERLAY_EFFECTS.items():
-            full = f"{info['icon']} {info['name']}"
+            full = f"{info.icon} {info.name}"
             if full == display:
-                self._av_overlay_desc.configure(text=info["desc"])
+                self._av_overlay_desc.configure(text=info.desc)
                 break
 
     def _av_get_pattern_key(self) -> str:
         display = self.av_pattern_var.get()
         for key, info in BACKGROUND_PATTERNS.items():
-            full = f"{info['icon']} {info['name']}"
+            full = f"{info.icon} {info.name}"
             if full == display:
                 return key
         return "gradient_flow"
@@ -760,7 +760,7 @@ class AbstractVideoMixin:
     def _av_get_overlay_key(self) -> str:
         display = self.av_overlay_var.get()
         for key, info in OVERLAY_EFFECTS.items():
-            full = f"{info['icon']} {info['name']}"
+            full = f"{info.icon} {info.name}"
             if full == display:
                 return key
         return "none"
@@ -1080,7 +1080,7 @@ class AbstractVideoMixin:
 
             # Build job info
             timestamp = time.strftime("%Y%m%d_%H%M%S")
-            pat_name = BACKGROUND_PATTERNS[pat]["name"].lower().replace(" ", "_")
+            pat_name = BACKGROUND_PATTERNS[pat].name.lower().replace(" ", "_")
             filename = f"abstract_{pat_name}_{i+1:03d}_{timestamp}.{fmt}"
             output_path = os.path.join(self._av_output_path, filename)
 
@@ -1094,8 +1094,8 @@ class AbstractVideoMixin:
                 "output_format": fmt,
                 "bitrate": 50,
                 "output_path": output_path,
-                "pattern_name": BACKGROUND_PATTERNS[pat]["name"],
-                "overlay_name": OVERLAY_EFFECTS[ovl]["name"],
+                "pattern_name": BACKGROUND_PATTERNS[pat].name,
+                "overlay_name": OVERLAY_EFFECTS[ovl].name,
             })
 
         # Store batch state